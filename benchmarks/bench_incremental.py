@@ -0,0 +1,67 @@
+"""Times PathAnalyser.update_square, the incremental Max Paths recount
+used by board editors, against searching the whole board again after
+each edit. Each edit drops one destination from every waypoint of a
+random square on a dense grid.
+
+Usage: python benchmarks/bench_incremental.py
+"""
+import random
+import time
+
+from cs_board_tools.analysis import PathAnalyser
+from cs_board_tools.schema.frb import Square, WaypointData
+from cs_board_tools.validation.paths import find_max_paths
+
+
+def make_grid(width: int, height: int) -> list[Square]:
+    def neighbours(i):
+        x, y = i % width, i // width
+        for nx, ny in ((x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1)):
+            if 0 <= nx < width and 0 <= ny < height:
+                yield ny * width + nx
+
+    squares = []
+    for i in range(width * height):
+        n = list(neighbours(i))
+        waypoints = [
+            WaypointData(e, ([d for d in n if d != e] + [255, 255, 255])[:3])
+            for e in n
+        ]
+        waypoints += [WaypointData(255, [255, 255, 255])] * (4 - len(waypoints))
+        squares.append(Square(0, 0, 0, 0, waypoints, 0, 0, 0, 0, 0, 0))
+    return squares
+
+
+def main():
+    for width, height, limit in ((10, 10, 1000), (15, 16, 1000), (10, 10, None), (15, 16, None)):
+        squares = make_grid(width, height)
+        dice = max(16, len(squares) // 3)
+        analyser = PathAnalyser(squares, dice, limit=limit)
+        rng = random.Random(0)
+
+        edits = []
+        searches = []
+        for _ in range(20):
+            square_id = rng.randrange(len(squares))
+            waypoints = [
+                WaypointData(w.entryId, list(w.destinations[1:]) + [255])
+                for w in squares[square_id].waypoints
+            ]
+            start = time.perf_counter()
+            result = analyser.update_square(square_id, waypoints)
+            edits.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            assert result == find_max_paths(squares, dice, limit=limit)
+            searches.append(time.perf_counter() - start)
+
+        print(
+            f"{width}x{height} grid, depth {dice}, limit {limit}: "
+            f"update {1000 * sum(edits) / len(edits):.1f}ms "
+            f"(max {1000 * max(edits):.1f}ms), "
+            f"full search {1000 * sum(searches) / len(searches):.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Times calculate_max_paths on dense synthetic boards: grids of roads
+where every square branches towards each of its neighbours, which is
+the worst case for the number of paths. The exhaustive walk that the
+memoised count replaced is timed at a shallow depth for comparison,
+since at the real search depth it would not finish. The NumPy matrix
+engine is timed against the memoised count where NumPy is installed,
+and the memoised count against itself split across a process pool.
+
+Usage: python benchmarks/bench_max_paths.py
+"""
+import time
+
+from cs_board_tools.schema.frb import Square, WaypointData
+from cs_board_tools.validation.paths import (
+    calculate_max_paths,
+    find_max_paths,
+    get_destinations,
+)
+
+
+def make_grid(width: int, height: int) -> list[Square]:
+    def neighbours(i):
+        x, y = i % width, i // width
+        for nx, ny in ((x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1)):
+            if 0 <= nx < width and 0 <= ny < height:
+                yield ny * width + nx
+
+    squares = []
+    for i in range(width * height):
+        n = list(neighbours(i))
+        waypoints = [
+            WaypointData(e, ([d for d in n if d != e] + [255, 255, 255])[:3])
+            for e in n
+        ]
+        waypoints += [WaypointData(255, [255, 255, 255])] * (4 - len(waypoints))
+        squares.append(Square(0, 0, 0, 0, waypoints, 0, 0, 0, 0, 0, 0))
+    return squares
+
+
+def exhaustive_paths_count(squares, prev_square_id, square_id, dice):
+    if dice == 0:
+        return 1
+    count = 0
+    for d in get_destinations(squares, prev_square_id, square_id):
+        if d < len(squares):
+            count += exhaustive_paths_count(squares, square_id, d, dice - 1)
+    return count
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    squares = make_grid(6, 6)
+    dice = 9
+    _, exhaustive = timed(
+        lambda: max(exhaustive_paths_count(squares, 255, i, dice) for i in range(len(squares)))
+    )
+    _, memoised = timed(calculate_max_paths, squares, dice, None)
+    print(f"6x6 grid, depth {dice}: exhaustive {exhaustive:.3f}s, memoised {memoised:.4f}s")
+
+    for width, height in ((8, 8), (12, 12), (15, 16)):
+        squares = make_grid(width, height)
+        dice = max(16, len(squares) // 3)
+        (_, count), seconds = timed(calculate_max_paths, squares, dice, None)
+        print(
+            f"{width}x{height} grid ({len(squares)} squares), depth {dice}: "
+            f"{seconds:.3f}s, max paths {count:.3e}"
+        )
+
+    # the matrix engine caps its counts, so compare it at a depth where
+    # neither engine saturates
+    for width, height in ((8, 8), (15, 16)):
+        squares = make_grid(width, height)
+        dice = 30
+        dp, dp_seconds = timed(calculate_max_paths, squares, dice, None)
+        matrix, matrix_seconds = timed(calculate_max_paths, squares, dice, None, "matrix")
+        assert dp == matrix
+        print(
+            f"{width}x{height} grid, depth {dice}: dp {dp_seconds:.3f}s, "
+            f"matrix {matrix_seconds:.3f}s"
+        )
+
+    # the memoised search shares its memo between squares, which a pool
+    # cannot, so splitting one board only pays off with cores to spare
+    squares = make_grid(20, 20)
+    dice = len(squares) // 3
+    serial, serial_seconds = timed(find_max_paths, squares, dice)
+    for workers in (2, 4):
+        parallel, parallel_seconds = timed(
+            lambda: find_max_paths(squares, dice, workers=workers)
+        )
+        assert parallel == serial
+        print(
+            f"20x20 grid, depth {dice}: serial {serial_seconds:.3f}s, "
+            f"{workers} workers {parallel_seconds:.3f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Compares validating Map Descriptors with jsonschema.validate(), which
+checks the schema and builds a new validator on every call, against
+reusing the validator compiled by get_yaml_validator().
+
+Usage: python benchmarks/bench_yaml_validation.py [descriptor_count]
+"""
+import sys
+import time
+from copy import deepcopy
+
+import jsonschema
+from ruamel.yaml import YAML
+
+from cs_board_tools.utilities import load_yaml_schema
+from cs_board_tools.utilities.yaml import get_yaml_validator
+
+
+def load_descriptors(count: int) -> list[dict]:
+    with open("tests/artifacts/WiiU.yaml", "r", encoding="utf8") as stream:
+        descriptor = YAML(typ="safe").load(stream)
+    descriptor["shopNames"] = {
+        language: {str(k): v for k, v in names.items()}
+        for language, names in descriptor["shopNames"].items()
+    }
+    return [deepcopy(descriptor) for _ in range(count)]
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 3000
+    schema = load_yaml_schema()
+    descriptors = load_descriptors(count)
+
+    start = time.perf_counter()
+    for d in descriptors:
+        jsonschema.validate(d, schema)
+    per_call = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for d in descriptors:
+        list(get_yaml_validator(schema).iter_errors(d))
+    compiled = time.perf_counter() - start
+
+    print(f"{count} descriptors")
+    print(f"jsonschema.validate:  {per_call:8.3f}s")
+    print(f"compiled validator:   {compiled:8.3f}s ({per_call / compiled:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
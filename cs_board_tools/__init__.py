@@ -14,6 +14,7 @@ from .io import (
     read_files,
     read_frb,
     read_yaml,
+    read_yamls,
     read_zip
 )
 from .validation import (
@@ -26,6 +27,7 @@ __all__ = [
     read_files.__name__,
     read_frb.__name__,
     read_yaml.__name__,
+    read_yamls.__name__,
     read_zip.__name__,
     validate_bundle.__name__,
     validate_board_file.__name__,
@@ -0,0 +1,35 @@
+"""The analysis module holds whole-board analyses that go further than
+the checks in the validation module, such as counting the paths from
+every square at once, keeping those counts up to date while a board
+is being edited, working out where each roll of the dice can take
+a player and how far apart squares are, or finding the parts of a
+board a player cannot get back from.
+"""
+
+from .distances import calculate_distances, compute_distances
+from .incremental import PathAnalyser
+from .paths import (
+    build_transition_matrix,
+    calculate_max_paths_matrix,
+    count_paths_for_all_states
+)
+from .reachability import (
+    analyse_reachability,
+    calculate_roll_probabilities,
+    calculate_stop_sets
+)
+from .structure import analyse_structure, find_strongly_connected_components
+
+__all__ = [
+    PathAnalyser.__name__,
+    analyse_reachability.__name__,
+    analyse_structure.__name__,
+    build_transition_matrix.__name__,
+    calculate_distances.__name__,
+    calculate_max_paths_matrix.__name__,
+    calculate_roll_probabilities.__name__,
+    calculate_stop_sets.__name__,
+    compute_distances.__name__,
+    count_paths_for_all_states.__name__,
+    find_strongly_connected_components.__name__
+]
@@ -0,0 +1,115 @@
+"""Works out how many moves it takes to get from every square to every
+other square, following the waypoints the way a player would, so that
+questions like "how far is the nearest Bank?" can be answered with a
+lookup rather than another walk of the board. The search runs back
+from every square at once, one frontier expansion per move.
+
+This needs NumPy, which can be installed with
+`pip install cs_board_tools[matrix]`.
+"""
+import threading
+import weakref
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from cs_board_tools.analysis.paths import build_transition_matrix, missing_numpy_error
+from cs_board_tools.queries.frb.graph import get_board_graph
+from cs_board_tools.schema.frb import BoardFile
+
+distance_matrices = {}
+distance_matrices_lock = threading.Lock()
+
+
+def calculate_distances(frb: BoardFile, refresh: bool = False) -> "np.ndarray":
+    """
+    Works out the fewest moves from every square to every other square.
+
+    The search runs over (prev_square_id, square_id) states rather than
+    squares, so a player standing on a square can only move on the way
+    its waypoints allow for the square they came from. A player starts
+    on a square with "any entry", as they do after stopping there.
+
+    :param frb: A BoardFile object representing an .frb file.
+    :type frb: BoardFile
+
+    :param refresh: If set, rebuilds the board's graph first; see
+        get_board_graph.
+    :type refresh: bool, optional
+
+    :return: An N x N int32 array, where [i, j] is the fewest moves it
+        takes to get from square i to square j, or -1 if square j
+        cannot be reached from square i. [i, i] is always 0.
+    :rtype: numpy.ndarray
+    """
+    if np is None:
+        raise ImportError(missing_numpy_error)
+
+    graph = get_board_graph(frb, refresh=refresh)
+    n = graph.square_count
+    matrix = build_transition_matrix(frb.squares, graph=graph)
+    state_count = len(matrix.states)
+
+    # the search runs backwards, from every target square at once: row j
+    # of the frontier holds the states that first reached square j on
+    # the last move, and the first n states are the start states. The
+    # extra column is the matrix's always-empty padding slot.
+    square_ids = np.array([square_id for _, square_id in matrix.states], dtype=np.intp)
+    frontier = np.zeros((n, state_count + 1), dtype=bool)
+    frontier[square_ids, np.arange(state_count)] = True
+    visited = frontier.copy()
+
+    # distances[j, i] is filled in while searching back from square j
+    distances = np.full((n, n), -1, dtype=np.int32)
+    distances[np.arange(n), np.arange(n)] = 0
+
+    moves = 0
+    while frontier.any():
+        moves += 1
+        frontier[:, :-1] = frontier[:, matrix.successors].any(axis=2)
+        frontier &= ~visited
+        visited |= frontier
+
+        targets, starts = np.nonzero(frontier[:, :n])
+        distances[targets, starts] = moves
+
+    result = np.ascontiguousarray(distances.T)
+    result.flags.writeable = False
+    return result
+
+
+def compute_distances(frb: BoardFile, refresh: bool = False) -> "np.ndarray":
+    """
+    Returns the board's distance matrix, working it out the first time
+    it is asked for; see calculate_distances. The matrix is kept for as
+    long as the BoardFile is, and is read-only, since it is shared.
+
+    Like the board's graph, the matrix is worked out again whenever the
+    board's waypoints have changed since it was last worked out.
+
+    :param frb: A BoardFile object representing an .frb file.
+    :type frb: BoardFile
+
+    :param refresh: If set, works the matrix out again even if one is
+        cached.
+    :type refresh: bool, optional
+
+    :return: An N x N int32 array of the fewest moves between squares,
+        with -1 for squares that cannot be reached.
+    :rtype: numpy.ndarray
+    """
+    key = id(frb)
+    graph = get_board_graph(frb, refresh=refresh)
+    with distance_matrices_lock:
+        cached = distance_matrices.get(key)
+    if cached is not None and cached[0] is graph:
+        return cached[1]
+
+    distances = calculate_distances(frb)
+    with distance_matrices_lock:
+        if key not in distance_matrices:
+            weakref.finalize(frb, distance_matrices.pop, key, None)
+        distance_matrices[key] = (graph, distances)
+    return distances
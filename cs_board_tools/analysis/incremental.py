@@ -0,0 +1,201 @@
+"""An incremental Max Paths analyser, for board editors that need the
+Max Paths value again after every waypoint change. It keeps the count
+for every (prev_square_id, square_id) state at every depth, and when a
+square's waypoints change, it recounts only the states whose counts
+can have changed.
+"""
+from cs_board_tools.queries.frb.graph import build_square_transitions, build_transitions
+from cs_board_tools.schema.analysis import MaxPathsCount
+from cs_board_tools.schema.frb import Square, WaypointData
+
+
+class PathAnalyser:
+    """Keeps a board's path counts up to date as its waypoints change.
+
+    levels[k][i] holds the number of paths of length k from state i,
+    where states[i] is a (prev_square_id, square_id) pair. Changing one
+    square only changes the moves out of that square, so after an edit
+    the analyser recounts those states, and then, depth by depth, only
+    the states that lead into a state whose count just changed. Counts
+    that were already saturated at the limit stop changing, so most
+    edits settle within a few steps; without a limit, an edit on a
+    large, well-connected board can still reach most of its states.
+
+    The board's squares list is shared, not copied. The square count
+    must not change; to add or remove squares, build a new analyser.
+    """
+    def __init__(self, squares: list[Square], dice: int, limit: int = 1000):
+        """
+        :param squares: The board's squares.
+        :type squares: list[Square]
+
+        :param dice: The search depth.
+        :type dice: int
+
+        :param limit: The count at which to saturate, or None to count
+            every path. Defaults to 1000, the limit the Max Paths check
+            uses.
+        :type limit: int, optional
+        """
+        self.squares = squares
+        self.dice = dice
+        self.limit = limit
+        self.transitions = build_transitions(squares)
+
+        self.states = []
+        self.index = {}
+        self.successors = []
+        self.predecessors = []
+        self.states_by_square = [[] for _ in squares]
+        self.levels = [[] for _ in range(dice + 1)]
+
+        # the (255, square_id) start states come first, in square order
+        for square_id in range(len(squares)):
+            self.add_state((255, square_id))
+        for state in list(self.transitions):
+            self.add_state(state)
+        i = 0
+        while i < len(self.states):
+            self.link(i)
+            i += 1
+
+        for k in range(1, dice + 1):
+            below = self.levels[k - 1]
+            level = self.levels[k]
+            for i, successors in enumerate(self.successors):
+                level[i] = self.cap(sum(below[t] for t in successors))
+
+    def cap(self, count: int) -> int:
+        if self.limit is not None and count > self.limit:
+            return self.limit
+        return count
+
+    def add_state(self, state: tuple[int, int]) -> int:
+        """
+        Adds a state with no successors yet, and returns its index. If
+        the state already exists, just returns its index.
+        """
+        i = self.index.get(state)
+        if i is not None:
+            return i
+        i = len(self.states)
+        self.states.append(state)
+        self.index[state] = i
+        self.successors.append(())
+        self.predecessors.append(set())
+        self.states_by_square[state[1]].append(i)
+        self.levels[0].append(1)
+        for level in self.levels[1:]:
+            level.append(0)
+        return i
+
+    def link(self, i: int) -> list[int]:
+        """
+        Points state i at the states its moves lead to, according to the
+        current transition table, adding any of them that are new.
+        Returns the indices of the new states.
+        """
+        prev_square_id, square_id = self.states[i]
+        first_new = len(self.states)
+        successors = tuple(
+            self.add_state((square_id, d))
+            for d in self.transitions.get((prev_square_id, square_id), ())
+        )
+        for t in self.successors[i]:
+            self.predecessors[t].discard(i)
+        for t in successors:
+            self.predecessors[t].add(i)
+        self.successors[i] = successors
+        return list(range(first_new, len(self.states)))
+
+    def update_square(
+        self,
+        square_id: int,
+        waypoints: list[WaypointData] = None
+    ) -> MaxPathsCount:
+        """
+        Recounts the paths after a square's waypoints have changed.
+
+        :param square_id: The ID of the Square that changed.
+        :type square_id: int
+
+        :param waypoints: The square's new waypoints. If given, they
+            are set on the square; otherwise the square is assumed to
+            have been edited already.
+        :type waypoints: list[WaypointData], optional
+
+        :return: The board's new Max Paths result.
+        :rtype: MaxPathsCount
+        """
+        if waypoints is not None:
+            self.squares[square_id].waypoints = waypoints
+
+        for i in self.states_by_square[square_id]:
+            self.transitions.pop(self.states[i], None)
+        square_transitions = build_square_transitions(self.squares, square_id)
+        self.transitions.update(square_transitions)
+        for state in square_transitions:
+            self.add_state(state)
+
+        # relink every state on the square, and any states those add;
+        # all of them need counting from scratch
+        dirty = list(self.states_by_square[square_id])
+        relinked = set()
+        while dirty:
+            i = dirty.pop()
+            if i not in relinked:
+                relinked.add(i)
+                dirty.extend(self.link(i))
+
+        changed = set()
+        for k in range(1, self.dice + 1):
+            below = self.levels[k - 1]
+            level = self.levels[k]
+            candidates = set(relinked)
+            for t in changed:
+                candidates.update(self.predecessors[t])
+            changed = set()
+            for i in candidates:
+                count = self.cap(sum(below[t] for t in self.successors[i]))
+                if count != level[i]:
+                    level[i] = count
+                    changed.add(i)
+
+        return self.max_paths()
+
+    def paths_count(self, square_id: int, prev_square_id: int = 255) -> int:
+        """
+        Returns the number of paths from a square, having arrived from
+        prev_square_id.
+
+        :param square_id: The ID of the Square to count from.
+        :type square_id: int
+
+        :param prev_square_id: The ID of the Previous Square, or 255
+            for "any entry". Defaults to 255.
+        :type prev_square_id: int, optional
+
+        :return: The number of paths, capped at the limit.
+        :rtype: int
+        """
+        i = self.index.get((prev_square_id, square_id))
+        if i is None:
+            return 0 if self.dice > 0 else 1
+        return self.levels[self.dice][i]
+
+    def max_paths(self) -> MaxPathsCount:
+        """
+        Returns the square with the most paths and its count, exactly
+        as validation.paths' find_max_paths would.
+
+        :return: The square with the most paths and its count.
+        :rtype: MaxPathsCount
+        """
+        result = MaxPathsCount()
+        level = self.levels[self.dice]
+        for square_id in range(len(self.squares)):
+            if level[square_id] > result.count:
+                result.count = level[square_id]
+                result.square_id = square_id
+        result.saturated = self.limit is not None and result.count >= self.limit
+        return result
@@ -0,0 +1,188 @@
+"""A linear-algebra engine for counting paths. Rather than searching from
+one start square at a time, it treats every move a player can make as a
+state, builds the board's state transition matrix, and counts the paths
+from every square at once with repeated sparse matrix-vector products.
+
+This engine needs NumPy, which can be installed with
+`pip install cs_board_tools[matrix]`.
+"""
+import time
+from dataclasses import dataclass
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from cs_board_tools.queries.frb.graph import BoardGraph
+from cs_board_tools.schema.analysis import MaxPathsCount
+from cs_board_tools.schema.frb import Square
+
+missing_numpy_error = (
+    "The matrix engine requires NumPy. You can install it with "
+    "`pip install cs_board_tools[matrix]`."
+)
+
+# Counts are capped here so they never overflow an int64. A square has at
+# most 4 waypoints with 3 destinations each, so a product step adds up at
+# most 12 capped values, which still fits.
+count_cap = 2 ** 59
+
+
+@dataclass
+class TransitionMatrix:
+    """The state transition matrix of a board.
+
+    Each state is a (prev_square_id, square_id) pair: standing on
+    square_id with your back to prev_square_id. The first square_count
+    states are the (255, square_id) "any entry" states that every search
+    starts from, in square order.
+
+    The matrix is stored in ELLPACK form: row i of successors lists the
+    indices of the states reachable in one move from state i, padded
+    with the index of an extra, always-zero slot at the end of the
+    vector.
+    """
+    states: list[tuple[int, int]]
+    successors: "np.ndarray"
+    square_count: int
+
+
+def build_transition_matrix(
+    squares: list[Square],
+    graph: BoardGraph = None
+) -> TransitionMatrix:
+    """
+    Builds the state transition matrix for a board.
+
+    :param squares: A list of Square objects to index.
+    :type squares: list[Square]
+
+    :param graph: The board's BoardGraph, if it has already been built.
+        Defaults to None, which builds one from squares.
+    :type graph: BoardGraph, optional
+
+    :return: The board's TransitionMatrix.
+    :rtype: TransitionMatrix
+    """
+    if np is None:
+        raise ImportError(missing_numpy_error)
+
+    if graph is None:
+        graph = BoardGraph(squares)
+    transitions = graph.transitions
+    square_count = graph.square_count
+
+    states = graph.states
+    index = {state: i for i, state in enumerate(states)}
+
+    # moving from (prev, square) on to d leaves you on d, with your back
+    # to square
+    rows = [
+        [index[(square_id, d)] for d in transitions.get((prev_square_id, square_id), ())]
+        for prev_square_id, square_id in states
+    ]
+    width = max((len(r) for r in rows), default=0) or 1
+    padding = len(states)
+    successors = np.full((len(states), width), padding, dtype=np.intp)
+    for i, r in enumerate(rows):
+        successors[i, :len(r)] = r
+
+    return TransitionMatrix(states, successors, square_count)
+
+
+def count_paths_for_all_states(
+    matrix: TransitionMatrix,
+    dice: int,
+    limit: int = None,
+    deadline: float = None
+) -> "np.ndarray":
+    """
+    Counts the paths of length dice from every state of the board, with
+    one sparse matrix-vector product per step.
+
+    :param matrix: The board's TransitionMatrix.
+    :type matrix: TransitionMatrix
+
+    :param dice: The search depth.
+    :type dice: int
+
+    :param limit: The count at which to saturate, or None to count every
+        path (up to 2 ** 59). Defaults to None.
+    :type limit: int, optional
+
+    :param deadline: A time.monotonic() value after which to give up.
+        Defaults to None, which means no deadline.
+    :type deadline: float, optional
+
+    :return: An int64 array holding the count for each state, in the
+        order of matrix.states, each one capped at the limit, or None
+        if the deadline passed first.
+    :rtype: numpy.ndarray
+    """
+    cap = count_cap if limit is None else min(limit, count_cap)
+    counts = np.ones(len(matrix.states) + 1, dtype=np.int64)
+    counts[-1] = 0
+    for _ in range(dice):
+        if deadline is not None and time.monotonic() > deadline:
+            return None
+        step = counts[matrix.successors].sum(axis=1)
+        np.minimum(step, cap, out=step)
+        counts[:-1] = step
+    return counts[:-1]
+
+
+def calculate_max_paths_matrix(
+    squares: list[Square],
+    dice: int,
+    limit: int = None,
+    time_budget: float = None,
+    graph: BoardGraph = None
+) -> MaxPathsCount:
+    """
+    Calculates the Max Paths value for all squares with the matrix
+    engine. The result is the same as validation.paths'
+    find_max_paths, for any board whose counts stay below 2 ** 59.
+
+    :param squares: A list of Square objects to test.
+    :type squares: list[Square]
+
+    :param dice: The search depth.
+    :type dice: int
+
+    :param limit: The highest count to search for, or None to count
+        every path. Defaults to None.
+    :type limit: int, optional
+
+    :param time_budget: The most wall-clock time, in seconds, that the
+        search may take. The matrix engine finishes every square at
+        once, so running out of time leaves no count at all. Defaults
+        to None, which means no budget.
+    :type time_budget: float, optional
+
+    :param graph: The board's BoardGraph, if it has already been built.
+        Defaults to None, which builds one from squares.
+    :type graph: BoardGraph, optional
+
+    :return: The square with the most paths and its count.
+    :rtype: MaxPathsCount
+    """
+    if not squares:
+        return MaxPathsCount()
+
+    deadline = None if time_budget is None else time.monotonic() + time_budget
+    matrix = build_transition_matrix(squares, graph=graph)
+    counts = count_paths_for_all_states(matrix, dice, limit=limit, deadline=deadline)
+    if counts is None:
+        return MaxPathsCount(timed_out=True)
+
+    per_square = counts[:matrix.square_count]
+    square_id = int(np.argmax(per_square))
+    max_paths_count = int(per_square[square_id])
+    if max_paths_count == 0:
+        return MaxPathsCount()
+    return MaxPathsCount(
+        square_id=square_id,
+        count=max_paths_count,
+        saturated=limit is not None and max_paths_count >= limit,
+    )
@@ -0,0 +1,154 @@
+"""Works out, for every square and every roll of the dice, where a
+player can stop, and how likely each of those squares is. Every start
+square and every roll is covered by a single sweep over the board's
+states, one step per pip of the largest roll, rather than by walking
+the board from each square in turn.
+
+Stop sets only need the standard library. Landing probabilities need
+NumPy, which can be installed with `pip install cs_board_tools[matrix]`.
+"""
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from cs_board_tools.analysis.paths import build_transition_matrix, missing_numpy_error
+from cs_board_tools.queries.frb.graph import BoardGraph, get_board_graph
+from cs_board_tools.schema.analysis import ReachabilityAnalysis
+from cs_board_tools.schema.frb import BoardFile, Square
+
+
+def calculate_stop_sets(
+    squares: list[Square],
+    max_dice_roll: int,
+    graph: BoardGraph = None
+) -> list[list[list[int]]]:
+    """
+    Works out which squares a player can stop on, from every start
+    square and for every roll from 1 to max_dice_roll.
+
+    Each state holds the squares reachable from it as the bits of an
+    int, so one step for every state is one OR per move; after r steps,
+    the start states hold the stop sets for a roll of r.
+
+    :param squares: A list of Square objects to analyse.
+    :type squares: list[Square]
+
+    :param max_dice_roll: The highest roll to work out.
+    :type max_dice_roll: int
+
+    :param graph: The board's BoardGraph, if it has already been built.
+        Defaults to None, which builds one from squares.
+    :type graph: BoardGraph, optional
+
+    :return: stop_sets[start][roll - 1], the sorted IDs of the squares
+        a player on start can stop on after that roll.
+    :rtype: list[list[list[int]]]
+    """
+    if graph is None:
+        graph = BoardGraph(squares)
+    states = graph.states
+    index = {state: i for i, state in enumerate(states)}
+    successors = [
+        [index[(square_id, d)] for d in graph.destinations(prev_square_id, square_id)]
+        for prev_square_id, square_id in states
+    ]
+
+    stop_sets = [[] for _ in range(graph.square_count)]
+    reachable = [1 << square_id for _, square_id in states]
+    for _ in range(max_dice_roll):
+        step = []
+        for moves in successors:
+            bits = 0
+            for t in moves:
+                bits |= reachable[t]
+            step.append(bits)
+        reachable = step
+        for square_id in range(graph.square_count):
+            bits = reachable[square_id]
+            stop_sets[square_id].append(
+                [i for i, bit in enumerate(reversed(bin(bits)[2:])) if bit == "1"]
+            )
+    return stop_sets
+
+
+def calculate_roll_probabilities(
+    squares: list[Square],
+    max_dice_roll: int,
+    graph: BoardGraph = None
+) -> "np.ndarray":
+    """
+    Works out the chance of stopping on each square, from every start
+    square and for every roll from 1 to max_dice_roll, assuming the
+    player picks each branch with equal chance.
+
+    :param squares: A list of Square objects to analyse.
+    :type squares: list[Square]
+
+    :param max_dice_roll: The highest roll to work out.
+    :type max_dice_roll: int
+
+    :param graph: The board's BoardGraph, if it has already been built.
+        Defaults to None, which builds one from squares.
+    :type graph: BoardGraph, optional
+
+    :return: An array indexed by [start, roll - 1, square].
+    :rtype: numpy.ndarray
+    """
+    if np is None:
+        raise ImportError(missing_numpy_error)
+
+    matrix = build_transition_matrix(squares, graph=graph)
+    state_count = len(matrix.states)
+    square_count = matrix.square_count
+
+    # the last row is the padding slot, which always holds zeros
+    degree = (matrix.successors != state_count).sum(axis=1)
+    degree[degree == 0] = 1
+    probabilities = np.zeros((state_count + 1, square_count))
+    probabilities[np.arange(state_count), [s for _, s in matrix.states]] = 1.0
+
+    rolls = np.zeros((square_count, max_dice_roll, square_count))
+    for roll in range(max_dice_roll):
+        step = probabilities[matrix.successors].sum(axis=1) / degree[:, None]
+        probabilities[:-1] = step
+        rolls[:, roll, :] = step[:square_count]
+    return rolls
+
+
+def analyse_reachability(
+    frb: BoardFile,
+    max_dice_roll: int = None,
+    probabilities: bool = True
+) -> ReachabilityAnalysis:
+    """
+    Works out where a player can stop on each roll of the dice, from
+    every square on a board, and how likely each stop is.
+
+    :param frb: A BoardFile object representing an .frb file.
+    :type frb: BoardFile
+
+    :param max_dice_roll: The highest roll to work out. Defaults to
+        None, which uses the board's own Max Dice Roll.
+    :type max_dice_roll: int, optional
+
+    :param probabilities: If set to False, only the stop sets are
+        worked out, which does not need NumPy. Defaults to True.
+    :type probabilities: bool, optional
+
+    :return: The stop sets and, if asked for, the landing
+        probabilities.
+    :rtype: ReachabilityAnalysis
+    """
+    if max_dice_roll is None:
+        max_dice_roll = frb.board_info.max_dice_roll
+    graph = get_board_graph(frb)
+
+    result = ReachabilityAnalysis(max_dice_roll=max_dice_roll)
+    result.stop_sets = calculate_stop_sets(frb.squares, max_dice_roll, graph=graph)
+    if probabilities:
+        result.roll_probabilities = calculate_roll_probabilities(
+            frb.squares, max_dice_roll, graph=graph
+        )
+        result.landing_probabilities = result.roll_probabilities.mean(axis=1)
+    return result
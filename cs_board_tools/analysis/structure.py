@@ -0,0 +1,134 @@
+"""Looks at the shape of a board's waypoint graph -- which squares can
+reach which, where a player can get stuck, and which moves only go one
+way -- in time linear in the size of the board. This finds broken
+pathing without counting a single path.
+"""
+from collections import deque
+
+from cs_board_tools.queries.frb.graph import BoardGraph, get_board_graph
+from cs_board_tools.queries.frb.squaretype import get_square_type_index
+from cs_board_tools.schema.analysis import BoardStructure
+from cs_board_tools.schema.frb import BoardFile, SquareType
+
+# moves into or out of these squares are expected to only go one way
+one_way_square_types = [
+    SquareType.OneWayAlleyDoorA,
+    SquareType.OneWayAlleyDoorB,
+    SquareType.OneWayAlleyDoorC,
+    SquareType.OneWayAlleyDoorD,
+    SquareType.OneWayAlleySquare,
+    SquareType.LiftMagmaliceSquareStart,
+    SquareType.LiftSquareEnd,
+]
+
+
+def find_strongly_connected_components(graph: BoardGraph) -> list[list[int]]:
+    """
+    Finds the strongly connected components of a board's squares, with
+    an edge from each square to every square any of its waypoints leads
+    to. Uses Tarjan's algorithm, without recursion.
+
+    :param graph: The board's BoardGraph.
+    :type graph: BoardGraph
+
+    :return: Each component's square IDs in ascending order, with the
+        components ordered by their lowest square ID.
+    :rtype: list[list[int]]
+    """
+    edges = [graph.destinations(255, i) for i in range(graph.square_count)]
+    index = [None] * graph.square_count
+    lowlink = [0] * graph.square_count
+    on_stack = [False] * graph.square_count
+    stack = []
+    components = []
+    counter = 0
+
+    for root in range(graph.square_count):
+        if index[root] is not None:
+            continue
+        work = [(root, 0)]
+        while work:
+            square_id, next_edge = work.pop()
+            if next_edge == 0:
+                index[square_id] = lowlink[square_id] = counter
+                counter += 1
+                stack.append(square_id)
+                on_stack[square_id] = True
+
+            recursed = False
+            for e in range(next_edge, len(edges[square_id])):
+                d = edges[square_id][e]
+                if index[d] is None:
+                    work.append((square_id, e + 1))
+                    work.append((d, 0))
+                    recursed = True
+                    break
+                if on_stack[d]:
+                    lowlink[square_id] = min(lowlink[square_id], index[d])
+            if recursed:
+                continue
+
+            if lowlink[square_id] == index[square_id]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack[member] = False
+                    component.append(member)
+                    if member == square_id:
+                        break
+                components.append(sorted(component))
+            if work:
+                parent = work[-1][0]
+                lowlink[parent] = min(lowlink[parent], lowlink[square_id])
+
+    return sorted(components)
+
+
+def analyse_structure(frb: BoardFile) -> BoardStructure:
+    """
+    Analyses the shape of a board's waypoint graph: its strongly
+    connected components, the squares that cannot be reached from the
+    Bank, the states a player can get stuck in, and the moves that only
+    go one way.
+
+    :param frb: A BoardFile object representing an .frb file.
+    :type frb: BoardFile
+
+    :return: The board's structure.
+    :rtype: BoardStructure
+    """
+    graph = get_board_graph(frb)
+    result = BoardStructure()
+    result.components = find_strongly_connected_components(graph)
+
+    # players start on the Bank, and can leave it in any direction
+    square_types = get_square_type_index(frb)
+    banks = square_types.ids(SquareType.Bank) or (0,)
+    seen = {(255, i) for i in banks if i < graph.square_count}
+    queue = deque(seen)
+    while queue:
+        prev_square_id, square_id = queue.popleft()
+        destinations = graph.destinations(prev_square_id, square_id)
+        if not destinations:
+            result.dead_end_states.append((prev_square_id, square_id))
+        for d in destinations:
+            if (square_id, d) not in seen:
+                seen.add((square_id, d))
+                queue.append((square_id, d))
+    result.dead_end_states.sort()
+
+    reached = {square_id for _, square_id in seen}
+    result.unreachable_squares = [
+        i for i in range(graph.square_count) if i not in reached
+    ]
+
+    one_way = {i for t in one_way_square_types for i in square_types.ids(t)}
+    for square_id in range(graph.square_count):
+        for d in graph.destinations(255, square_id):
+            if square_id in graph.destinations(255, d):
+                continue
+            if square_id in one_way or d in one_way:
+                result.door_moves.append((square_id, d))
+            else:
+                result.one_way_moves.append((square_id, d))
+    return result
@@ -18,6 +18,7 @@ from .descriptor import (
     print_descriptors,
     print_descriptors_validation_result
 )
+from .profile import print_slowest_checks
 
 from cs_board_tools.io import (
     read_files,
@@ -40,6 +41,34 @@ file_flag_help_message = (
     "The archive file to open. Should end in .frb, .yaml., or .zip, "
 )
 
+max_paths_time_budget_help_message = (
+    "The most time, in seconds, the Max Paths test may spend on each board. "
+    "Useful for keeping CI runs bounded."
+)
+
+cache_help_message = (
+    "Reuse the stored results of bundles whose files have not changed "
+    "since they were last validated, and store the rest."
+)
+
+profile_help_message = (
+    "Print a table of the slowest checks, with their wall time, CPU time "
+    "and peak memory."
+)
+
+profile_dir_help_message = (
+    "Write cProfile stats for every check to this directory. Implies --profile."
+)
+
+board_structure_test_help_message = (
+    "Run the Board Structure test. It does not yet follow Back Street "
+    "warps or Cannons, so it is skipped unless asked for."
+)
+
+workers_help_message = (
+    "The number of processes the Max Paths test may use."
+)
+
 display_short_help_message = (
     "Display data from a CSMM-compatible file."
 )
@@ -116,6 +145,8 @@ def display(directory: str, file: str, gdrive_api_key=None):
 
 @click.command(short_help=validate_short_help_message)
 @click.option('-sbc', '--skip-board-configuration-test', is_flag=True, flag_value=True, default=False)
+@click.option('-bst', '--board-structure-test', is_flag=True, flag_value=True, default=False,
+              help=board_structure_test_help_message)
 @click.option('-sct', '--skip-consistency-test', is_flag=True, flag_value=True, default=False)
 @click.option('-sdt', '--skip-music-download-test', is_flag=True, flag_value=True, default=False)
 @click.option('-sit', '--skip-icon-test', is_flag=True, flag_value=True, default=False)
@@ -125,12 +156,24 @@ def display(directory: str, file: str, gdrive_api_key=None):
 @click.option('-svt', '--skip-venture-card-test', is_flag=True, flag_value=True, default=False)
 @click.option('-sw', '--skip-warnings', is_flag=True, flag_value=True, default=False)
 @click.option('-g', '--gdrive-api-key', is_flag=False, flag_value=None, default=None)
+@click.option('-mpb', '--max-paths-time-budget', type=float, default=None,
+              help=max_paths_time_budget_help_message)
+@click.option('-w', '--workers', type=int, default=None, help=workers_help_message)
+@click.option('-c', '--cache', is_flag=True, flag_value=True, default=False, help=cache_help_message)
+@click.option('-p', '--profile', is_flag=True, flag_value=True, default=False, help=profile_help_message)
+@click.option('-pd', '--profile-dir', type=str, default=None, help=profile_dir_help_message)
 @click.option('-d', '--directory', type=str, help=directory_flag_help_message)
 @click.option('-f', '--file', type=str, help=file_flag_help_message)
 def validate(directory: str,
              file: str,
              gdrive_api_key: str = None,
+             max_paths_time_budget: float = None,
+             workers: int = None,
+             cache: bool = False,
+             profile: bool = False,
+             profile_dir: str = None,
              skip_board_configuration_test: bool = False,
+             board_structure_test: bool = False,
              skip_consistency_test: bool = False,
              skip_icon_test: bool = False,
              skip_max_paths_test: bool = False,
@@ -164,11 +207,44 @@ def validate(directory: str,
         (e.g. `export GDRIVE_API_KEY=value`)
     :type gdrive_api_key: str, optional
 
+    :param max_paths_time_budget: (-mpb or --max-paths-time-budget)
+        The most wall-clock time, in seconds, the Max Paths test may
+        spend on each board. If it runs out, the test warns and shows
+        the count it had reached as a lower bound.
+    :type max_paths_time_budget: float, optional
+
+    :param workers: (-w or --workers) The number of processes the Max
+        Paths test may use, to search several boards side by side.
+    :type workers: int, optional
+
+    :param cache: (-c or --cache) If set, bundles whose files and
+        options have not changed since they were last validated reuse
+        their stored results instead of being validated again. The
+        Music Download test always runs. Results are stored in
+        $CS_BOARD_TOOLS_CACHE_DIR, or in ~/.cache.
+    :type cache: bool, optional
+
+    :param profile: (-p or --profile) If set, prints a table of the
+        slowest checks after the results, with the wall time, CPU time
+        and peak memory of each. Checks run one after another while
+        profiling, so the run as a whole is slower.
+    :type profile: bool, optional
+
+    :param profile_dir: (-pd or --profile-dir) A directory to write
+        cProfile stats for every check of a bundle to, one
+        <board name>.<check name>.prof file each. Implies --profile.
+    :type profile_dir: str, optional
+
     :param skip_board_configuration_test: (-sbc or
         --skip-board-configuration-test) If set, skips the Board
         Configuration tests.
     :type skip_board_configuration_test: bool, optional
 
+    :param board_structure_test: (-bst or --board-structure-test) If
+        set, runs the Board Structure tests, which are skipped
+        otherwise. They do not yet follow Back Street warps or Cannons.
+    :type board_structure_test: bool, optional
+
     :param skip_consistency_test: (-sct or --skip-consistency-test)
         If set, skips the Board Consistency tests.
     :type skip_consistency_test: bool, optional
@@ -220,6 +296,7 @@ def validate(directory: str,
             bundles=bundles,
             gdrive_api_key=gdrive_api_key,
             skip_board_configuration_test=skip_board_configuration_test,
+            skip_board_structure_test=not board_structure_test,
             skip_consistency_test=skip_consistency_test,
             skip_icon_test=skip_icon_test,
             skip_max_paths_test=skip_max_paths_test,
@@ -227,13 +304,23 @@ def validate(directory: str,
             skip_naming_convention_test=skip_naming_convention_test,
             skip_screenshots_test=skip_screenshots_test,
             skip_venture_cards_test=skip_venture_cards_test,
-            skip_warnings=skip_warnings
+            skip_warnings=skip_warnings,
+            max_paths_time_budget=max_paths_time_budget,
+            workers=workers,
+            cache=cache,
+            profile=profile,
+            profile_dir=profile_dir
         )
         print_bundles_validation_result(results=result)
     elif file:
         if file.endswith(".frb"):  # if it's a solo .frb file
             frb = read_frb(file)
-            result = validate_board_file([frb])
+            result = validate_board_file(
+                [frb],
+                skip_board_structure_test=not board_structure_test,
+                max_paths_time_budget=max_paths_time_budget,
+                workers=workers
+            )
             print_frbs_validation_result(results=result)
         elif file.endswith(".yaml"):  # if it's a solo .yaml file
             descriptor = read_yaml(file)
@@ -250,6 +337,7 @@ def validate(directory: str,
                 bundles=bundles,
                 gdrive_api_key=gdrive_api_key,
                 skip_board_configuration_test=skip_board_configuration_test,
+                skip_board_structure_test=not board_structure_test,
                 skip_consistency_test=skip_consistency_test,
                 skip_icon_test=skip_icon_test,
                 skip_max_paths_test=skip_max_paths_test,
@@ -257,7 +345,12 @@ def validate(directory: str,
                 skip_naming_convention_test=skip_naming_convention_test,
                 skip_screenshots_test=skip_screenshots_test,
                 skip_venture_cards_test=skip_venture_cards_test,
-                skip_warnings=skip_warnings
+                skip_warnings=skip_warnings,
+                max_paths_time_budget=max_paths_time_budget,
+                workers=workers,
+                cache=cache,
+                profile=profile,
+                profile_dir=profile_dir
             )
             print_bundles_validation_result(results=result)
     else:
@@ -267,6 +360,10 @@ def validate(directory: str,
             "or a file with -f or --file. \n"
             "You can also show help with -h or --help."
         )
+        return
+
+    if profile or profile_dir:
+        print_slowest_checks(results=result)
 
 cs_board_tools.add_command(display)
 cs_board_tools.add_command(validate)
@@ -4,6 +4,7 @@
 import sys
 from prettytable import PrettyTable
 
+from ..schema.analysis import MaxPathsBreakdown
 from ..schema.bundle import Bundle
 from ..schema.validation import ValidationResultBundle
 
@@ -96,9 +97,13 @@ def print_bundles_validation_result(results: ValidationResultBundle):
         b_table = PrettyTable()
         b_table.title = f"Validation Results for {r.board_name}"
         b_table.field_names = ["Attribute", "Value or Count"]
-        b_table.add_row(["Max Paths", r.paths])
+        b_table.add_row(["Max Paths", r.max_paths.data or r.paths])
+        if isinstance(r.max_paths.data, MaxPathsBreakdown) and len(r.max_paths.data.files) > 1:
+            for filename, paths in zip(r.max_paths.data.filenames, r.max_paths.data.files):
+                b_table.add_row([f"Max Paths ({filename})", paths])
         b_table.add_row(["---", "---"])
         b_table.add_row(["Board Configuration", r.board_configuration.status])
+        b_table.add_row(["Board Structure", r.structure.status])
         b_table.add_row(["Consistency", r.consistency.status])
         b_table.add_row(["Icon", r.icon.status])
         b_table.add_row(["Max Paths", r.max_paths.status])
@@ -71,9 +71,10 @@ def print_frbs_validation_result(results: ValidationResultBundle):
         b_table = PrettyTable()
         b_table.title = title
         b_table.field_names = ["Attribute", "Value or Count"]
-        b_table.add_row(["Max Paths", r.paths])
+        b_table.add_row(["Max Paths", r.max_paths.data or r.paths])
         b_table.add_row(["---", "---"])
         b_table.add_row(["Board Configuration", r.board_configuration.status])
+        b_table.add_row(["Board Structure", r.structure.status])
         b_table.add_row(["Max Paths", r.max_paths.status])
 
         b_table.align["Attribute"] = "r"
@@ -0,0 +1,52 @@
+"""This function prints how long each validation check took, for runs
+made with the --profile flag, so that slow boards and checks stand out.
+"""
+from dataclasses import fields
+
+from prettytable import PrettyTable
+
+from ..schema.validation import CheckResult, ValidationResultBundle
+
+
+def print_slowest_checks(results: ValidationResultBundle, count: int = 10):
+    """
+    Prints the checks that took the longest across every board, slowest
+    first, followed by the totals. Uses PrettyTable to print
+    nicely-formatted ASCII tables.
+
+    :param results: The results you would like to print the timings of.
+    :type results: ValidationResultBundle
+
+    :param count: The number of checks to show. Defaults to 10.
+    :type count: int, optional
+    """
+    rows = []
+    for r in results.boards:
+        for f in fields(r):
+            check_result = getattr(r, f.name)
+            if isinstance(check_result, CheckResult) and check_result.timing.wall_time > 0:
+                rows.append((r.board_name, f.name, check_result.timing))
+    rows.sort(key=lambda row: row[2].wall_time, reverse=True)
+
+    table = PrettyTable()
+    table.title = f"Slowest Checks (top {min(count, len(rows))} of {len(rows)})"
+    table.field_names = ["Board", "Check", "Wall (s)", "CPU (s)", "Peak Memory (KiB)"]
+    for board_name, check_name, timing in rows[:count]:
+        table.add_row([
+            board_name,
+            check_name,
+            f"{timing.wall_time:.3f}",
+            f"{timing.cpu_time:.3f}",
+            f"{timing.peak_memory / 1024:.1f}" if timing.peak_memory else "-",
+        ])
+    table.add_row(["---", "---", "---", "---", "---"])
+    table.add_row([
+        "Total",
+        "",
+        f"{results.timing.wall_time:.3f}",
+        f"{results.timing.cpu_time:.3f}",
+        f"{results.timing.peak_memory / 1024:.1f}" if results.timing.peak_memory else "-",
+    ])
+    table.align["Board"] = "l"
+    table.align["Check"] = "l"
+    print(table)
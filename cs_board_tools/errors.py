@@ -1,18 +1,16 @@
 """The Errors module handles counts and message lists for errors,
 warnings, and even informational reasons.
-"""
 
+Counts and messages are kept in a ValidationContext. Each validation
+run gets a context of its own, so runs on different threads, or in a
+long-running server, never see each other's counts. The module-level
+functions work on the current context, which is the one installed with
+use_context, or a shared default context outside of any run.
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
 from enum import Enum
 
-all_errors = []
-all_fixes = []
-all_warnings = []
-all_informational = []
-error_count = 0
-fixed_count = 0
-success_count = 0
-warning_count = 0
-
 
 class IssueType(Enum):
     """This enum is used with the get_count and get_messages functions
@@ -24,11 +22,152 @@ class IssueType(Enum):
     WARNINGS = 4
 
 
+class ValidationContext:
+    """Collects the counts and message lists for one validation run.
+
+    Checks send their messages to the context with
+    process_log_messages, normally by way of build_results_object, and
+    the run reads the totals back with get_count and get_text.
+    """
+    def __init__(self):
+        self.all_errors = []
+        self.all_fixes = []
+        self.all_warnings = []
+        self.all_informational = []
+        self.error_count = 0
+        self.fixed_count = 0
+        self.success_count = 0
+        self.warning_count = 0
+
+    def process_log_messages(
+        self,
+        errors: list[str] = [],
+        messages: list[str] = [],
+        warnings: list[str] = [],
+        job_was_successful: bool = False
+    ):
+        """
+        Tallies the messages from a job, and whether it was
+        successful. See the module-level process_log_messages.
+        """
+        if len(errors) > 0:
+            self.error_count += len(errors)
+            self.all_errors += errors
+
+        if len(messages) > 0:
+            self.all_informational += messages
+
+        if len(warnings) > 0:
+            self.warning_count += len(warnings)
+            self.all_warnings += warnings
+
+        if job_was_successful:
+            self.success_count += 1
+        else:
+            if len(errors) == 0 and len(warnings) == 0:
+                self.success_count += 1
+
+    def merge(self, other: "ValidationContext"):
+        """
+        Adds another context's counts and messages to this one's, as
+        if its jobs had been tallied here, after this context's own.
+
+        :param other: The context to add.
+        :type other: ValidationContext
+        """
+        self.all_errors += other.all_errors
+        self.all_fixes += other.all_fixes
+        self.all_warnings += other.all_warnings
+        self.all_informational += other.all_informational
+        self.error_count += other.error_count
+        self.fixed_count += other.fixed_count
+        self.success_count += other.success_count
+        self.warning_count += other.warning_count
+
+    def get_count(self, t: IssueType) -> int:
+        """
+        Returns the number of checks of the type specified by
+        parameter t. See the module-level get_count.
+        """
+        match (t):
+            case IssueType.ERRORS:
+                return self.error_count
+            case IssueType.FIXED:
+                return self.fixed_count
+            case IssueType.WARNINGS:
+                return self.warning_count
+            case IssueType.SUCCESS:
+                return self.success_count
+
+    def get_text(self, t: IssueType) -> list[str]:
+        """
+        Returns a copy of the messages of the type specified by
+        parameter t. See the module-level get_text.
+        """
+        match (t):
+            case IssueType.ERRORS:
+                return self.all_errors.copy()
+            case IssueType.FIXED:
+                return self.all_fixes.copy()
+            case IssueType.WARNINGS:
+                return self.all_warnings.copy()
+            case IssueType.SUCCESS:
+                return self.all_informational.copy()
+
+    def reset(self):
+        """
+        Clears all counts and message lists.
+        """
+        self.all_errors.clear()
+        self.all_fixes.clear()
+        self.all_informational.clear()
+        self.all_warnings.clear()
+        self.error_count = 0
+        self.fixed_count = 0
+        self.success_count = 0
+        self.warning_count = 0
+
+
+default_context = ValidationContext()
+current_context = ContextVar("current_context", default=default_context)
+
+
+def get_context() -> ValidationContext:
+    """
+    Returns the current ValidationContext: the one installed with
+    use_context, or the shared default context.
+
+    :return: The current context.
+    :rtype: ValidationContext
+    """
+    return current_context.get()
+
+
+@contextmanager
+def use_context(context: ValidationContext = None):
+    """
+    Makes a ValidationContext the current one, for as long as the
+    with block runs, on this thread only. Yields the context.
+
+    :param context: The context to use. Defaults to None, which
+        creates a new, empty one.
+    :type context: ValidationContext, optional
+    """
+    if context is None:
+        context = ValidationContext()
+    token = current_context.set(context)
+    try:
+        yield context
+    finally:
+        current_context.reset(token)
+
+
 def process_log_messages(
     errors: list[str] = [],
     messages: list[str] = [],
     warnings: list[str] = [],
-    job_was_successful: bool = False
+    job_was_successful: bool = False,
+    context: ValidationContext = None
 ):
     """
     This function is not just used to process log messages. It also
@@ -55,34 +194,22 @@ def process_log_messages(
         as a success in metrics even if errors are present. As you
         might expect, this defaults to False.
     :type job_was_successful: bool
-    """
-
-    global all_errors
-    global all_informational
-    global all_warnings
-    global error_count
-    global success_count
-    global warning_count
-
-    if len(errors) > 0:
-        error_count += len(errors)
-        all_errors += errors
 
-    if len(messages) > 0:
-        all_informational += messages
-
-    if len(warnings) > 0:
-        warning_count += len(warnings)
-        all_warnings += warnings
-
-    if job_was_successful:
-        success_count += 1
-    else:
-        if len(errors) == 0 and len(warnings) == 0:
-            success_count += 1
+    :param context: The context to tally the messages in. Defaults to
+        None, which uses the current context.
+    :type context: ValidationContext, optional
+    """
+    if context is None:
+        context = get_context()
+    context.process_log_messages(
+        errors=errors,
+        messages=messages,
+        warnings=warnings,
+        job_was_successful=job_was_successful
+    )
 
 
-def get_count(t: IssueType) -> int:
+def get_count(t: IssueType, context: ValidationContext = None) -> int:
     """
     Returns the number of checks of the type specified by parameter t.
 
@@ -91,23 +218,21 @@ def get_count(t: IssueType) -> int:
         IssueType.FIXED, IssueType.WARNINGS, and IssueType.SUCCESS.
     :type t: cs_board_tools.errors.IssueType
 
+    :param context: The context to read. Defaults to None, which uses
+        the current context.
+    :type context: ValidationContext, optional
+
     :return: A bundle containing the overall results, as well as a
         list containing objects that represent each of the individual
         results.
     :rtype: int
     """
-    match (t):
-        case IssueType.ERRORS:
-            return error_count
-        case IssueType.FIXED:
-            return fixed_count
-        case IssueType.WARNINGS:
-            return warning_count
-        case IssueType.SUCCESS:
-            return success_count
-
-
-def get_text(t: IssueType) -> list[str]:
+    if context is None:
+        context = get_context()
+    return context.get_count(t)
+
+
+def get_text(t: IssueType, context: ValidationContext = None) -> list[str]:
     """
     Works similarly to get_count, but instead returns the messages of
     the type specified by parameter t.
@@ -117,39 +242,28 @@ def get_text(t: IssueType) -> list[str]:
         IssueType.FIXED, IssueType.WARNINGS, and IssueType.SUCCESS.
     :type t: cs_board_tools.errors.IssueType
 
+    :param context: The context to read. Defaults to None, which uses
+        the current context.
+    :type context: ValidationContext, optional
+
     :return: A bundle containing the overall results, as well as a
         list containing objects that represent each of the individual
         results.
     :rtype: int
     """
-    match (t):
-        case IssueType.ERRORS:
-            return all_errors.copy()
-        case IssueType.FIXED:
-            return all_fixes.copy()
-        case IssueType.WARNINGS:
-            return all_warnings.copy()
-        case IssueType.SUCCESS:
-            return all_informational.copy()
-
-
-def reset_errors_and_warnings():
+    if context is None:
+        context = get_context()
+    return context.get_text(t)
+
+
+def reset_errors_and_warnings(context: ValidationContext = None):
     """
     When called, it clears all counts and message lists.
+
+    :param context: The context to clear. Defaults to None, which uses
+        the current context.
+    :type context: ValidationContext, optional
     """
-    global all_errors
-    global all_fixes
-    global all_informational
-    global all_warnings
-    global error_count
-    global fixed_count
-    global success_count
-    global warning_count
-    all_errors.clear()
-    all_fixes.clear()
-    all_informational.clear()
-    all_warnings.clear()
-    error_count = 0
-    fixed_count = 0
-    success_count = 0
-    warning_count = 0
+    if context is None:
+        context = get_context()
+    context.reset()
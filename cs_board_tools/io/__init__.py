@@ -4,11 +4,12 @@ different types of files.
 
 from .bundle import read_files, read_zip
 from .frb import read_frb
-from .yaml import read_yaml
+from .yaml import read_yaml, read_yamls
 
 __all__ = [
     read_files.__name__,
     read_frb.__name__,
     read_yaml.__name__,
+    read_yamls.__name__,
     read_zip.__name__
 ]
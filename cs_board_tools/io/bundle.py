@@ -5,7 +5,7 @@ import os
 from pathlib import Path
 
 from cs_board_tools.io.frb import read_frb
-from cs_board_tools.io.yaml import read_yaml
+from cs_board_tools.io.yaml import read_yamls
 from cs_board_tools.schema.bundle import Bundle
 from cs_board_tools.utilities import extract_zip_file, cleanup
 
@@ -89,9 +89,10 @@ def read_files(files: list[Path]) -> list[Bundle]:
 
     # # now we can actually start processing them
     bundles = []
-    for y in yaml_filenames:
+    descriptors = read_yamls(yaml_filenames)
+    for y, descriptor in zip(yaml_filenames, descriptors):
         bundle = Bundle()
-        bundle.descriptor = read_yaml(y)
+        bundle.descriptor = descriptor
         bundle_path = y.rsplit("/", 1)[0]
 
         bundle.authors = bundle.descriptor.authors
@@ -117,6 +118,19 @@ def read_files(files: list[Path]) -> list[Bundle]:
         bundle.frbs = board_files
         bundle.screenshots = screenshot_paths
 
+        # every file the checks can look at, so that a cached
+        # validation result is only reused while all of them are the same
+        bundle.source_dir = bundle_path
+        bundle.source_files = [
+            f
+            for filenames in (
+                brstm_filenames, cmpres_filenames, frb_filenames,
+                png_filenames, webp_filenames, yaml_filenames
+            )
+            for f in filenames
+            if f"{bundle_path}/" in f
+        ]
+
         bundles.append(bundle)
 
     return bundles
@@ -160,6 +174,14 @@ def read_zip(file_path: Path, temp_dir_path: str = "./temp") -> list[Bundle]:
 
     bundles = read_files(files)
 
+    # the extracted files are about to be removed, so the archive itself
+    # stands in for them, along with where each bundle sits inside it
+    for b in bundles:
+        if isinstance(b, Bundle):
+            b.source_entry = Path(os.path.relpath(b.source_dir, temp_dir_path)).as_posix()
+            b.source_dir = os.path.dirname(file_path)
+            b.source_files = [file_path]
+
     cleanup(
         temp_dir=temp_dir_path,
         directories=directories,
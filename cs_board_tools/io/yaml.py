@@ -1,16 +1,18 @@
 """Entry-point functions for loading Map Descriptor .yaml files and
 the schema for those files live here.
 """
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-import requests
 
 from cs_board_tools.schema.descriptor import (
     build_map_descriptor_object,
     MapDescriptor
 )
+from cs_board_tools.utilities import load_yaml_schema
+from cs_board_tools.utilities.yaml import get_yaml_validator
 
 
-def read_yaml(file_path: Path) -> MapDescriptor:
+def read_yaml(file_path: Path, fast: bool = False) -> MapDescriptor:
     """
     Reads a Map Descriptor .yaml file into a Python object.
 
@@ -19,23 +21,67 @@ def read_yaml(file_path: Path) -> MapDescriptor:
         its relative path as well.
     :type file_path: Path
 
+    :param fast: If set to True, and PyYAML was installed with libyaml
+        support (`pip install cs_board_tools[fast]`), the file is parsed
+        with PyYAML's C loader instead of ruamel.yaml. Defaults to False.
+    :type fast: bool, optional
+
     :return: Returns a MapDescriptor file representing the data from the
         .yaml file.
     :rtype: MapDescriptor
     """
-    return build_map_descriptor_object(file_path)
+    return build_map_descriptor_object(file_path, fast=fast)
+
+
+def read_yamls(
+    file_paths: list[Path],
+    workers: int = None,
+    fast: bool = False
+) -> list[MapDescriptor]:
+    """
+    Reads many Map Descriptor .yaml files into Python objects at once,
+    loading them concurrently on a pool of threads. The schema is
+    resolved, and its validator compiled, a single time up front and
+    then shared by every file.
+
+    :param file_paths: A list of Path objects representing the .yaml
+        files' filenames, including their relative paths if they are in
+        a different directory than your current shell.
+    :type file_paths: list[Path]
+
+    :param workers: The number of threads to load files with. If set to
+        1, files are loaded one after another on the calling thread.
+        Defaults to the ThreadPoolExecutor default for this machine.
+    :type workers: int, optional
+
+    :param fast: Passed through to read_yaml. Defaults to False.
+    :type fast: bool, optional
+
+    :return: Returns a list of MapDescriptors, in the same order as
+        file_paths. Each one carries its own yaml_validation_results.
+    :rtype: list[MapDescriptor]
+    """
+    if not file_paths:
+        return []
+
+    yaml_schema = load_yaml_schema()
+    if yaml_schema:
+        get_yaml_validator(yaml_schema)
+
+    if workers == 1 or len(file_paths) == 1:
+        return [read_yaml(f, fast=fast) for f in file_paths]
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(lambda f: read_yaml(f, fast=fast), file_paths))
 
 
-def read_yaml_schema() -> str:
+def read_yaml_schema() -> dict:
     """
     Returns the schema for Map Descriptor .yaml files.
 
     :return: Returns schema. You can find this schema file in the
-        fortunestreetmodding.github.io repository.
-    :rtype: str
+        fortunestreetmodding.github.io repository. It is downloaded at
+        most once per process, and cached on disk between runs.
+    :rtype: dict
     """
-    url = "http://fortunestreetmodding.github.io/schema/mapdescriptor.json"
-    res = requests.get(url)
-    if not res.ok:
-        return
-    return res.json()
+    return load_yaml_schema()
@@ -2,12 +2,38 @@
 Fortune Avenue-compatible .frb files.
 """
 
+from .cache import BoardCache
+from .graph import (
+    BoardGraph,
+    build_square_transitions,
+    build_transitions,
+    get_board_graph,
+    get_destinations
+)
+from .query import SquareQuery, SquareTable, get_square_table, query
+from .spatial import SpatialIndex, get_spatial_index
 from .squaretype import (
+    SquareTypeIndex,
     are_square_types_present,
+    get_square_type_index,
     is_square_type_present
 )
 
 __all__ = [
+    BoardCache.__name__,
+    BoardGraph.__name__,
+    SpatialIndex.__name__,
+    SquareQuery.__name__,
+    SquareTable.__name__,
+    SquareTypeIndex.__name__,
     are_square_types_present.__name__,
-    is_square_type_present.__name__
+    build_square_transitions.__name__,
+    build_transitions.__name__,
+    get_board_graph.__name__,
+    get_destinations.__name__,
+    get_spatial_index.__name__,
+    get_square_table.__name__,
+    get_square_type_index.__name__,
+    is_square_type_present.__name__,
+    query.__name__
 ]
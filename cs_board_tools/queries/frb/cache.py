@@ -0,0 +1,72 @@
+"""The per-board cache shared by the queries in this module lives here.
+Queries such as the board's graph or its square type index are built
+from a board's squares once, then handed to every check that asks for
+them, for as long as the BoardFile is alive.
+"""
+import threading
+import weakref
+from typing import Any, Callable
+
+from cs_board_tools.schema.frb import BoardFile, Square
+
+
+class BoardCache:
+    """
+    Keeps one object per BoardFile, built by build the first time it is
+    asked for. An entry is dropped when its BoardFile is garbage
+    collected, so the cache never keeps a board alive.
+
+    An entry is rebuilt once the BoardFile's squares have been replaced
+    with a new list. Squares edited in place are caught by signature: a
+    cheap summary of the parts of the squares the object is built from,
+    such as their waypoints, worked out on every call and compared with
+    the one the entry was built with. Without a signature, only
+    refresh=True rebuilds an entry after such an edit.
+
+    :param build: Builds the object for a BoardFile.
+    :type build: Callable[[BoardFile], Any]
+
+    :param signature: Summarises a board's squares, as any value that
+        can be compared with ==. Defaults to None.
+    :type signature: Callable[[list[Square]], Any], optional
+    """
+
+    def __init__(
+        self,
+        build: Callable[[BoardFile], Any],
+        signature: Callable[[list[Square]], Any] = None
+    ):
+        self.build = build
+        self.signature = signature
+        self.entries = {}
+        self.lock = threading.Lock()
+
+    def get(self, frb: BoardFile, refresh: bool = False) -> Any:
+        """
+        Returns the object for a BoardFile, building it if there is none
+        yet, or if the one there is out of date.
+
+        :param frb: A BoardFile object representing an .frb file.
+        :type frb: BoardFile
+
+        :param refresh: If set, rebuilds the object even if one is cached.
+        :type refresh: bool, optional
+
+        :return: The board's object.
+        """
+        key = id(frb)
+        squares = frb.squares
+        signature = self.signature(squares) if self.signature else None
+        with self.lock:
+            entry = self.entries.get(key)
+        if entry is not None and not refresh:
+            built_from, built_signature, value = entry
+            if built_from is squares and built_signature == signature:
+                return value
+
+        value = self.build(frb)
+        with self.lock:
+            if key not in self.entries:
+                weakref.finalize(frb, self.entries.pop, key, None)
+            self.entries[key] = (squares, signature, value)
+        return value
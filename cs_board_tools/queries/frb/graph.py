@@ -0,0 +1,202 @@
+"""Queries relating to how players can move around a board -- which
+squares they can move on to, given where they came from -- live here.
+"""
+import hashlib
+
+from cs_board_tools.queries.frb.cache import BoardCache
+from cs_board_tools.schema.frb import BoardFile, Square
+
+
+def get_destinations(
+    squares: list[Square],
+    prev_square_id: int,
+    square_id: int
+) -> list[int]:
+    """
+    Looks at a Square's waypoints and returns a list of possible
+    destinations for a given Entry ID.
+
+    :param squares: A list of Square objects to test.
+    :type squares: list[Square]
+
+    :param prev_square_id: The ID of the Previous Square, the
+        one you previously walked over in-game. The one you have
+        your back to.
+    :type prev_square_id: int
+
+    :param square_id: The ID of the Square for which to get the
+        paths count.
+    :type square_id: int
+
+    :return: Returns a list of Square IDs as Destinations.
+    :rtype: list[int]
+    """
+    destinations = []
+
+    if not (square_id < len(squares) or square_id == 255):
+        return
+    if not (prev_square_id < len(squares) or prev_square_id == 255):
+        return
+
+    square = squares[square_id]
+    for w in square.waypoints:
+        for d in w.destinations:
+            if w.entryId == prev_square_id or prev_square_id == 255:
+                if d != 255:
+                    destinations.append(d)
+    return list(set(destinations))
+
+
+def build_square_transitions(
+    squares: list[Square],
+    square_id: int
+) -> dict[tuple[int, int], tuple[int]]:
+    """
+    Builds the part of the transition table that belongs to a single
+    square: the moves that can be made from it. See build_transitions.
+
+    :param squares: A list of Square objects to index.
+    :type squares: list[Square]
+
+    :param square_id: The ID of the Square whose moves to build.
+    :type square_id: int
+
+    :return: The square's entries in the transition table.
+    :rtype: dict[tuple[int, int], tuple[int]]
+    """
+    square_count = len(squares)
+    by_entry = {}
+    for w in squares[square_id].waypoints:
+        by_entry.setdefault(w.entryId, set()).update(
+            d for d in w.destinations if d != 255 and d < square_count
+        )
+    transitions = {}
+    for prev_square_id, destinations in by_entry.items():
+        if prev_square_id < square_count:
+            transitions[(prev_square_id, square_id)] = tuple(sorted(destinations))
+    transitions[(255, square_id)] = tuple(sorted(set().union(*by_entry.values())))
+    return transitions
+
+
+def build_transitions(squares: list[Square]) -> dict[tuple[int, int], tuple[int]]:
+    """
+    Builds a table of every move that can be made on a board. Each key
+    is a (prev_square_id, square_id) pair, and its value holds the IDs
+    of the squares the player can move on to from there, exactly as
+    get_destinations would return them (minus any out-of-range IDs).
+    The (255, square_id) key holds the destinations for "any entry".
+
+    Pairs that are not in the table have no destinations.
+
+    :param squares: A list of Square objects to index.
+    :type squares: list[Square]
+
+    :return: The transition table.
+    :rtype: dict[tuple[int, int], tuple[int]]
+    """
+    transitions = {}
+    for square_id in range(len(squares)):
+        transitions.update(build_square_transitions(squares, square_id))
+    return transitions
+
+
+class BoardGraph:
+    """An index of how players can move around a board, built once and
+    then shared by everything that needs to walk it, such as the Max
+    Paths search and the door checks.
+
+    transitions maps each (prev_square_id, square_id) pair to the IDs of
+    the squares the player can move on to from there; see
+    build_transitions. connections holds, for each square, every square
+    ID its waypoints mention, either as an entry or as a destination.
+    fingerprint is a digest of the transition table, so two boards with
+    the same fingerprint can be walked in exactly the same ways.
+    """
+    def __init__(self, squares: list[Square]):
+        self.squares = squares
+        self.square_count = len(squares)
+        self.transitions = build_transitions(squares)
+        self.connections = tuple(
+            frozenset(
+                i
+                for w in square.waypoints
+                for i in (w.entryId, *w.destinations)
+                if i != 255
+            )
+            for square in squares
+        )
+        self.fingerprint = hashlib.blake2b(
+            repr(sorted(self.transitions.items())).encode("utf8"), digest_size=16
+        ).hexdigest()
+
+    @property
+    def states(self) -> list[tuple[int, int]]:
+        """
+        Every (prev_square_id, square_id) state a player can be in: the
+        (255, square_id) "any entry" start states, in square order,
+        followed by every state some move leads to, in sorted order.
+        """
+        moves = {
+            (square_id, d)
+            for (prev_square_id, square_id), destinations in self.transitions.items()
+            for d in destinations
+        }
+        return [(255, i) for i in range(self.square_count)] + sorted(moves)
+
+    def destinations(self, prev_square_id: int, square_id: int) -> tuple[int]:
+        """
+        Returns the IDs of the squares a player standing on square_id,
+        with their back to prev_square_id, can move on to.
+
+        :param prev_square_id: The ID of the Previous Square, or 255
+            for "any entry".
+        :type prev_square_id: int
+
+        :param square_id: The ID of the Square the player is on.
+        :type square_id: int
+
+        :return: The destination Square IDs, in ascending order.
+        :rtype: tuple[int]
+        """
+        return self.transitions.get((prev_square_id, square_id), ())
+
+
+def get_waypoints_signature(squares: list[Square]) -> tuple:
+    """
+    Returns every square's waypoints as a tuple, so that two calls give
+    equal results only if no waypoint has changed in between.
+
+    :param squares: A list of Square objects.
+    :type squares: list[Square]
+
+    :return: The waypoints, square by square.
+    :rtype: tuple
+    """
+    return tuple(
+        tuple((w.entryId, tuple(w.destinations)) for w in s.waypoints)
+        for s in squares
+    )
+
+
+board_graphs = BoardCache(lambda frb: BoardGraph(frb.squares), get_waypoints_signature)
+
+
+def get_board_graph(frb: BoardFile, refresh: bool = False) -> BoardGraph:
+    """
+    Returns the BoardGraph for a BoardFile, building it the first time
+    it is asked for. The graph is kept for as long as the BoardFile is.
+
+    The graph is rebuilt whenever the board's waypoints have changed
+    since it was built, including waypoints edited in place, so it
+    always matches the board as it is now.
+
+    :param frb: A BoardFile object representing an .frb file.
+    :type frb: BoardFile
+
+    :param refresh: If set, rebuilds the graph even if one is cached.
+    :type refresh: bool, optional
+
+    :return: The board's BoardGraph.
+    :rtype: BoardGraph
+    """
+    return board_graphs.get(frb, refresh)
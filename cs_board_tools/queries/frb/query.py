@@ -0,0 +1,244 @@
+"""A small query engine over a board's squares, so that scripts can
+filter squares by their attributes without writing the same loops over
+frb.squares again and again. For example:
+
+    query(frb).where(type=SquareType.Property, district=2, price__gt=100).select("id", "value")
+
+Each board's squares are kept in columns, built once and cached, with
+hash indexes on the square type, the district and the shop model. A
+query looks up whichever indexed conditions it has first, then checks
+the rest of its conditions against the columns of the squares left.
+"""
+import operator
+
+from cs_board_tools.queries.frb.cache import BoardCache
+from cs_board_tools.queries.frb.squaretype import get_square_type_index
+from cs_board_tools.schema.frb import BoardFile
+
+# the names a query can use for each column, and the Square attribute
+# each one is read from
+fields = {
+    "id": None,
+    "type": "square_type",
+    "x": "positionX",
+    "y": "positionY",
+    "district": "district_destination_id",
+    "one_way_lift": "one_way_lift",
+    "value": "value",
+    "price": "price",
+    "shop_model": "shop_model",
+}
+indexed_fields = ["type", "district", "shop_model"]
+
+operators = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "gt": operator.gt,
+    "gte": operator.ge,
+    "lt": operator.lt,
+    "lte": operator.le,
+    "in": lambda a, b: a in b,
+}
+
+unknown_field_error = (
+    "Unknown square field '{field}'. The fields are: {fields}."
+)
+unknown_operator_error = (
+    "Unknown operator '{operator}'. The operators are: {operators}."
+)
+
+
+class SquareTable:
+    """A board's squares, stored column by column.
+
+    columns maps each field name to a tuple holding that field's value
+    for every square, in square order. indexes maps each indexed field
+    name to a dict from each of its values to the IDs of the squares
+    with that value, in ascending order.
+    """
+    def __init__(self, frb: BoardFile):
+        self.squares = frb.squares
+        self.square_count = len(frb.squares)
+        self.columns = {"id": tuple(range(self.square_count))}
+        for name, attribute in fields.items():
+            if attribute is not None:
+                self.columns[name] = tuple(getattr(s, attribute) for s in frb.squares)
+
+        self.indexes = {"type": get_square_type_index(frb).square_ids}
+        for name in indexed_fields:
+            if name in self.indexes:
+                continue
+            index = {}
+            for square_id, v in enumerate(self.columns[name]):
+                index.setdefault(v, []).append(square_id)
+            self.indexes[name] = {v: tuple(ids) for v, ids in index.items()}
+
+
+square_tables = BoardCache(
+    SquareTable,
+    lambda squares: tuple(
+        tuple(getattr(s, a) for a in fields.values() if a is not None)
+        for s in squares
+    )
+)
+
+
+def get_square_table(frb: BoardFile, refresh: bool = False) -> SquareTable:
+    """
+    Returns the SquareTable for a BoardFile, building it the first time
+    it is asked for. The table is kept for as long as the BoardFile is.
+
+    The table is rebuilt whenever any of its fields has changed since
+    it was built, including squares edited in place, so it always
+    matches the board as it is now.
+
+    :param frb: A BoardFile object representing an .frb file.
+    :type frb: BoardFile
+
+    :param refresh: If set, rebuilds the table even if one is cached.
+    :type refresh: bool, optional
+
+    :return: The board's SquareTable.
+    :rtype: SquareTable
+    """
+    if refresh:
+        get_square_type_index(frb, refresh=True)
+    return square_tables.get(frb, refresh)
+
+
+def parse_condition(condition: str) -> tuple[str, str]:
+    """
+    Splits a condition such as "price__gt" into its field and its
+    operator, which defaults to "eq".
+
+    :param condition: The keyword used in a where() call.
+    :type condition: str
+
+    :return: The field name and the operator name.
+    :rtype: tuple[str, str]
+    """
+    name, _, op = condition.partition("__")
+    op = op or "eq"
+    if name not in fields:
+        raise ValueError(unknown_field_error.format(field=name, fields=", ".join(fields)))
+    if op not in operators:
+        raise ValueError(unknown_operator_error.format(
+            operator=op, operators=", ".join(operators)
+        ))
+    return name, op
+
+
+class SquareQuery:
+    """A query over a board's squares. Queries are immutable: where()
+    returns a new query with the extra conditions, so a query can be
+    kept and narrowed down in several different ways.
+    """
+    def __init__(self, frb: BoardFile, conditions: tuple = ()):
+        self.frb = frb
+        self.conditions = conditions
+
+    def where(self, **conditions) -> "SquareQuery":
+        """
+        Narrows the query down to the squares matching every condition.
+        Each keyword is a field name, optionally followed by a double
+        underscore and an operator: eq (the default), ne, gt, gte, lt,
+        lte or in. The fields are id, type, x, y, district,
+        one_way_lift, value, price and shop_model.
+
+        :return: A new query, with the extra conditions.
+        :rtype: SquareQuery
+        """
+        parsed = tuple(
+            (*parse_condition(condition), v) for condition, v in conditions.items()
+        )
+        return SquareQuery(self.frb, self.conditions + parsed)
+
+    def ids(self) -> list[int]:
+        """
+        Runs the query.
+
+        :return: The IDs of the matching squares, in ascending order.
+        :rtype: list[int]
+        """
+        table = get_square_table(self.frb)
+
+        # look up the indexed conditions first, smallest result first,
+        # and check everything else square by square
+        candidates = None
+        lookups = []
+        checks = []
+        for name, op, v in self.conditions:
+            if name in table.indexes and op in ("eq", "in"):
+                index = table.indexes[name]
+                values = [v] if op == "eq" else v
+                lookups.append(set().union(*(index.get(x, ()) for x in values)))
+            else:
+                checks.append((table.columns[name], operators[op], v))
+
+        for ids in sorted(lookups, key=len):
+            candidates = ids if candidates is None else candidates & ids
+            if not candidates:
+                return []
+        candidates = range(table.square_count) if candidates is None else sorted(candidates)
+
+        return [
+            square_id for square_id in candidates
+            if all(compare(column[square_id], v) for column, compare, v in checks)
+        ]
+
+    def count(self) -> int:
+        """
+        :return: The number of matching squares.
+        :rtype: int
+        """
+        return len(self.ids())
+
+    def exists(self) -> bool:
+        """
+        :return: True if at least one square matches.
+        :rtype: bool
+        """
+        return self.count() > 0
+
+    def select(self, *names: str) -> list:
+        """
+        Runs the query and returns the matching squares, or some of
+        their fields.
+
+        :param names: The fields to return. With none, the Square
+            objects themselves are returned; with one, just that
+            field's values; with several, a tuple of values for each
+            square.
+        :type names: str
+
+        :return: One entry per matching square, in square order.
+        :rtype: list
+        """
+        ids = self.ids()
+        if not names:
+            return [self.frb.squares[i] for i in ids]
+
+        table = get_square_table(self.frb)
+        for name in names:
+            if name not in fields:
+                raise ValueError(unknown_field_error.format(field=name, fields=", ".join(fields)))
+        columns = [table.columns[name] for name in names]
+        if len(columns) == 1:
+            return [columns[0][i] for i in ids]
+        return [tuple(column[i] for column in columns) for i in ids]
+
+    def __iter__(self):
+        return iter(self.select())
+
+
+def query(frb: BoardFile) -> SquareQuery:
+    """
+    Starts a query over a board's squares; see SquareQuery.
+
+    :param frb: A BoardFile object representing an .frb file.
+    :type frb: BoardFile
+
+    :return: A query matching every square on the board.
+    :rtype: SquareQuery
+    """
+    return SquareQuery(frb)
@@ -0,0 +1,222 @@
+"""Queries relating to where squares sit on a board -- which squares
+are in an area, which square is nearest, which squares overlap -- live
+here. Squares are bucketed into a uniform grid of tile-sized cells, so
+each query only looks at the cells around it rather than at every
+square on the board.
+"""
+import math
+
+from cs_board_tools.queries.frb.cache import BoardCache
+from cs_board_tools.schema.frb import BoardFile, Square
+
+# squares are drawn as tiles of this many units across
+tile_size = 64
+
+
+class SpatialIndex:
+    """A uniform grid over a board's square coordinates.
+
+    cells maps each (cell_x, cell_y) cell to the IDs of the squares
+    whose positions fall in it, in ascending order, where a cell is
+    cell_size units across. positions holds each square's (x, y).
+    """
+    def __init__(self, squares: list[Square], cell_size: int = tile_size):
+        self.squares = squares
+        self.cell_size = cell_size
+        self.positions = [(s.positionX, s.positionY) for s in squares]
+        self.cells = {}
+        for square_id, (x, y) in enumerate(self.positions):
+            self.cells.setdefault(self.cell(x, y), []).append(square_id)
+
+    def cell(self, x: int, y: int) -> tuple[int, int]:
+        return x // self.cell_size, y // self.cell_size
+
+    def in_range(self, x_min: int, y_min: int, x_max: int, y_max: int) -> list[int]:
+        """
+        Returns the squares whose positions are inside a rectangle,
+        edges included.
+
+        :param x_min: The rectangle's lowest X coordinate.
+        :type x_min: int
+
+        :param y_min: The rectangle's lowest Y coordinate.
+        :type y_min: int
+
+        :param x_max: The rectangle's highest X coordinate.
+        :type x_max: int
+
+        :param y_max: The rectangle's highest Y coordinate.
+        :type y_max: int
+
+        :return: The IDs of the squares inside, in ascending order.
+        :rtype: list[int]
+        """
+        (cx_min, cy_min), (cx_max, cy_max) = self.cell(x_min, y_min), self.cell(x_max, y_max)
+        found = []
+        if (cx_max - cx_min + 1) * (cy_max - cy_min + 1) > len(self.cells):
+            cells = [
+                ids for (cx, cy), ids in self.cells.items()
+                if cx_min <= cx <= cx_max and cy_min <= cy <= cy_max
+            ]
+        else:
+            cells = [
+                self.cells.get((cx, cy), ())
+                for cx in range(cx_min, cx_max + 1)
+                for cy in range(cy_min, cy_max + 1)
+            ]
+        for ids in cells:
+            for square_id in ids:
+                x, y = self.positions[square_id]
+                if x_min <= x <= x_max and y_min <= y <= y_max:
+                    found.append(square_id)
+        return sorted(found)
+
+    def within(self, x: int, y: int, distance: float) -> list[int]:
+        """
+        Returns the squares whose positions are no further than
+        distance from a point.
+
+        :param x: The point's X coordinate.
+        :type x: int
+
+        :param y: The point's Y coordinate.
+        :type y: int
+
+        :param distance: The greatest distance, in units.
+        :type distance: float
+
+        :return: The IDs of the squares in range, in ascending order.
+        :rtype: list[int]
+        """
+        reach = math.floor(distance)
+        return [
+            square_id
+            for square_id in self.in_range(x - reach, y - reach, x + reach, y + reach)
+            if math.dist(self.positions[square_id], (x, y)) <= distance
+        ]
+
+    def nearest(self, x: int, y: int, exclude: int = None) -> int:
+        """
+        Returns the square whose position is closest to a point. Cells
+        are searched in rings outwards from the point's cell, stopping
+        once no further ring can hold anything closer.
+
+        :param x: The point's X coordinate.
+        :type x: int
+
+        :param y: The point's Y coordinate.
+        :type y: int
+
+        :param exclude: A square ID to leave out, such as the square
+            the point belongs to. Defaults to None.
+        :type exclude: int, optional
+
+        :return: The ID of the closest square, the lowest one if several
+            are as close, or None if there are no other squares.
+        :rtype: int
+        """
+        cx, cy = self.cell(x, y)
+        best = None
+        best_distance = math.inf
+        rings = max(
+            (max(abs(px - cx), abs(py - cy)) for px, py in self.cells),
+            default=-1
+        )
+        for ring in range(rings + 1):
+            # every square in this ring is at least this far away
+            if (ring - 1) * self.cell_size > best_distance:
+                break
+            for px in range(cx - ring, cx + ring + 1):
+                for py in range(cy - ring, cy + ring + 1):
+                    if max(abs(px - cx), abs(py - cy)) != ring:
+                        continue
+                    for square_id in self.cells.get((px, py), ()):
+                        if square_id == exclude:
+                            continue
+                        d = math.dist(self.positions[square_id], (x, y))
+                        if d < best_distance or (d == best_distance and square_id < best):
+                            best, best_distance = square_id, d
+        return best
+
+    def nearest_neighbour(self, square_id: int) -> int:
+        """
+        Returns the square closest to another square.
+
+        :param square_id: The ID of the Square to look around.
+        :type square_id: int
+
+        :return: The ID of the closest other square, or None if there
+            are no other squares.
+        :rtype: int
+        """
+        x, y = self.positions[square_id]
+        return self.nearest(x, y, exclude=square_id)
+
+    def find_overlaps(self, size: int = tile_size) -> list[tuple[int, int]]:
+        """
+        Finds the pairs of squares whose tiles overlap: those less than
+        one tile apart along both axes.
+
+        :param size: The tile size, in units. Defaults to 64.
+        :type size: int, optional
+
+        :return: Each overlapping pair of Square IDs, lower ID first, in
+            ascending order.
+        :rtype: list[tuple[int, int]]
+        """
+        overlaps = []
+        reach = math.ceil(size / self.cell_size)
+        for (cx, cy), ids in self.cells.items():
+            for px in range(cx - reach, cx + reach + 1):
+                for py in range(cy - reach, cy + reach + 1):
+                    for a in ids:
+                        ax, ay = self.positions[a]
+                        for b in self.cells.get((px, py), ()):
+                            if b <= a:
+                                continue
+                            bx, by = self.positions[b]
+                            if abs(ax - bx) < size and abs(ay - by) < size:
+                                overlaps.append((a, b))
+        return sorted(overlaps)
+
+    def find_isolated(self, distance: float) -> list[int]:
+        """
+        Finds the squares with no other square within distance of them.
+
+        :param distance: The distance, in units.
+        :type distance: float
+
+        :return: The IDs of the isolated squares, in ascending order.
+        :rtype: list[int]
+        """
+        return [
+            square_id for square_id, (x, y) in enumerate(self.positions)
+            if self.within(x, y, distance) == [square_id]
+        ]
+
+
+spatial_indexes = BoardCache(
+    lambda frb: SpatialIndex(frb.squares),
+    lambda squares: tuple((s.positionX, s.positionY) for s in squares)
+)
+
+
+def get_spatial_index(frb: BoardFile, refresh: bool = False) -> SpatialIndex:
+    """
+    Returns the SpatialIndex for a BoardFile, building it the first time
+    it is asked for. The index is kept for as long as the BoardFile is.
+
+    The index is rebuilt whenever a square has moved since it was
+    built, including squares moved in place, so it always matches the
+    board as it is now.
+
+    :param frb: A BoardFile object representing an .frb file.
+    :type frb: BoardFile
+
+    :param refresh: If set, rebuilds the index even if one is cached.
+    :type refresh: bool, optional
+
+    :return: The board's SpatialIndex.
+    :rtype: SpatialIndex
+    """
+    return spatial_indexes.get(frb, refresh)
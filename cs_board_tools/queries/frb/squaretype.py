@@ -1,6 +1,109 @@
 """Queries relating to which SquareTypes are present on a board live here.
 """
-from cs_board_tools.schema.frb import BoardFile, SquareType
+from collections import Counter
+
+from cs_board_tools.queries.frb.cache import BoardCache
+from cs_board_tools.schema.frb import BoardFile, Square, SquareType
+
+
+class SquareTypeIndex:
+    """An index of which SquareTypes are on a board, built in one pass
+    over its squares and then shared by every check that asks.
+
+    counts maps each SquareType on the board to its number of squares.
+    mask has bit t.value set for every SquareType t on the board.
+    square_ids maps each SquareType on the board to the IDs of its
+    squares, in ascending order.
+    """
+    def __init__(self, squares: list[Square]):
+        self.squares = squares
+        square_ids = {}
+        for square_id, square in enumerate(squares):
+            square_ids.setdefault(square.square_type, []).append(square_id)
+        self.square_ids = {t: tuple(ids) for t, ids in square_ids.items()}
+        self.counts = Counter({t: len(ids) for t, ids in self.square_ids.items()})
+        self.mask = 0
+        for t in self.square_ids:
+            self.mask |= 1 << t.value
+
+    def count(self, t: SquareType) -> int:
+        """
+        Returns the number of squares of a SquareType on the board.
+
+        :param t: The SquareType to count.
+        :type t: SquareType
+
+        :return: The number of squares of that type.
+        :rtype: int
+        """
+        return self.counts[t]
+
+    def ids(self, t: SquareType) -> tuple[int]:
+        """
+        Returns the IDs of the squares of a SquareType on the board.
+
+        :param t: The SquareType to look up.
+        :type t: SquareType
+
+        :return: The Square IDs, in ascending order.
+        :rtype: tuple[int]
+        """
+        return self.square_ids.get(t, ())
+
+    def has_all(self, t: list[SquareType]) -> bool:
+        """
+        Returns True if every one of the SquareTypes is on the board.
+
+        :param t: The SquareTypes to look for.
+        :type t: list[SquareType]
+
+        :return: The result of the search.
+        :rtype: bool
+        """
+        wanted = 0
+        for square_type in t:
+            wanted |= 1 << square_type.value
+        return self.mask & wanted == wanted
+
+    def has_any(self, t: list[SquareType]) -> bool:
+        """
+        Returns True if at least one of the SquareTypes is on the board.
+
+        :param t: The SquareTypes to look for.
+        :type t: list[SquareType]
+
+        :return: The result of the search.
+        :rtype: bool
+        """
+        return any(self.mask >> square_type.value & 1 for square_type in t)
+
+
+square_type_indexes = BoardCache(
+    lambda frb: SquareTypeIndex(frb.squares),
+    lambda squares: tuple(s.square_type for s in squares)
+)
+
+
+def get_square_type_index(frb: BoardFile, refresh: bool = False) -> SquareTypeIndex:
+    """
+    Returns the SquareTypeIndex for a BoardFile, building it the first
+    time it is asked for. The index is kept for as long as the BoardFile
+    is.
+
+    The index is rebuilt whenever a square's type has changed since it
+    was built, including types changed in place, so it always matches
+    the board as it is now.
+
+    :param frb: A BoardFile object representing an .frb file.
+    :type frb: BoardFile
+
+    :param refresh: If set, rebuilds the index even if one is cached.
+    :type refresh: bool, optional
+
+    :return: The board's SquareTypeIndex.
+    :rtype: SquareTypeIndex
+    """
+    return square_type_indexes.get(frb, refresh)
 
 
 def are_square_types_present(frb: BoardFile, t: list[SquareType]) -> bool:
@@ -14,14 +117,11 @@ def are_square_types_present(frb: BoardFile, t: list[SquareType]) -> bool:
     :param t: A list of SquareTypes to search the board for.
     :type t: list[SquareType]
 
-    :return: The result of the search. If True, the SquareType was present.
+    :return: The result of the search. If True, every SquareType was
+        present.
     :rtype: bool
     """
-    types = []
-    for i, square in enumerate(frb.squares):
-        types.append(square.square_type)
-    result = all(item in types for item in t)
-    return result
+    return get_square_type_index(frb).has_all(t)
 
 
 def is_square_type_present(frb: BoardFile, t: SquareType) -> bool:
@@ -38,8 +138,4 @@ def is_square_type_present(frb: BoardFile, t: SquareType) -> bool:
     :return: The result of the search. If True, the SquareType was present.
     :rtype: bool
     """
-    result = False
-    for i, square in enumerate(frb.squares):
-        if square.square_type == t:
-            result = True
-    return result
+    return get_square_type_index(frb).count(t) > 0
@@ -12,3 +12,143 @@ class SquareAnalysis:
 
     # general information
     board_name: str = field(default="")
+
+
+@dataclass
+class MaxPathsCount:
+    """Represents the result of a Max Paths search: the square with the
+    most paths, and how many paths it has.
+
+    The count is exact unless the search was cut short, which happens
+    when a square's count reaches the search's limit (saturated), when
+    the search stops because some square has already gone past its
+    stop_at threshold (stopped_early), or when it runs out of time
+    (timed_out). In those cases the count is only a lower bound, and it
+    is shown as "≥ count".
+    """
+    square_id: int = 255
+    count: int = 0
+    saturated: bool = False
+    stopped_early: bool = False
+    timed_out: bool = False
+
+    @property
+    def exact(self) -> bool:
+        return not (self.saturated or self.stopped_early or self.timed_out)
+
+    def __int__(self) -> int:
+        return self.count
+
+    def __str__(self) -> str:
+        if self.exact:
+            return f"{self.count}"
+        return f"≥ {self.count}"
+
+
+@dataclass
+class MaxPathsBreakdown:
+    """Represents the results of a Max Paths search across every .frb
+    file in a bundle, one MaxPathsCount per file, in the same order as
+    filenames.
+
+    It converts to an int, and prints, as the highest of its counts, so
+    it can stand in wherever a single MaxPathsCount is expected.
+    """
+    filenames: list[str] = field(default_factory=list)
+    files: list[MaxPathsCount] = field(default_factory=list)
+
+    @property
+    def max(self) -> MaxPathsCount:
+        result = MaxPathsCount()
+        for f in self.files:
+            if f.count > result.count or (f.count == result.count and not f.exact):
+                result = f
+        return result
+
+    def __int__(self) -> int:
+        return int(self.max)
+
+    def __str__(self) -> str:
+        return str(self.max)
+
+
+@dataclass
+class PathsHeatmap:
+    """Represents the path counts for every square on a board, rather
+    than just the highest one.
+
+    square_counts holds, for each square in order, the number of paths
+    from it with "any entry". entry_counts holds the number of paths
+    for each way of arriving on a square, keyed by (prev_square_id,
+    square_id). histogram sorts the squares into bins by their count:
+    each entry is (low, high, squares), where high is None for the last,
+    open-ended bin.
+    """
+    dice: int = 0
+    limit: Any = None
+    square_counts: list[int] = field(default_factory=list)
+    entry_counts: dict[tuple[int, int], int] = field(default_factory=dict)
+    histogram: list[tuple[int, Any, int]] = field(default_factory=list)
+
+    @property
+    def max_paths(self) -> MaxPathsCount:
+        result = MaxPathsCount()
+        for square_id, count in enumerate(self.square_counts):
+            if count > result.count:
+                result.count = count
+                result.square_id = square_id
+        result.saturated = self.limit is not None and result.count >= self.limit
+        return result
+
+    def hotspots(self, threshold: int = 100) -> list[int]:
+        """
+        Returns the IDs of the squares with more than threshold paths,
+        the busiest first.
+        """
+        squares = [i for i, count in enumerate(self.square_counts) if count > threshold]
+        return sorted(squares, key=lambda i: -self.square_counts[i])
+
+
+@dataclass
+class ReachabilityAnalysis:
+    """Represents where a player can stop on each roll of the dice.
+
+    stop_sets[start][roll - 1] lists the IDs of the squares a player
+    starting on square start (with "any entry") can stop on after
+    moving exactly roll squares, for each roll from 1 to max_dice_roll.
+
+    roll_probabilities[start, roll - 1, square] is the chance of
+    stopping on square after that roll, if the player picks each
+    branch with equal chance. landing_probabilities[start, square]
+    averages that over every roll, each being equally likely. Both are
+    NumPy arrays, or None if they were not computed. Moves that run
+    into a dead end are lost, so a vector can sum to less than 1.
+    """
+    max_dice_roll: int = 0
+    stop_sets: list[list[list[int]]] = field(default_factory=list)
+    roll_probabilities: Any = None
+    landing_probabilities: Any = None
+
+
+@dataclass
+class BoardStructure:
+    """Represents the shape of a board's waypoint graph.
+
+    components holds the board's strongly connected components: groups
+    of squares that can all reach each other. unreachable_squares are
+    the squares a player can never get to from the Bank.
+    dead_end_states are the (prev_square_id, square_id) states a player
+    can get into from the Bank, but has no waypoint to leave by.
+    one_way_moves are the moves from one square to another that cannot
+    be made in reverse, and door_moves are the ones of those that
+    involve a One Way Alley or a Lift, where that is expected.
+    """
+    components: list[list[int]] = field(default_factory=list)
+    unreachable_squares: list[int] = field(default_factory=list)
+    dead_end_states: list[tuple[int, int]] = field(default_factory=list)
+    one_way_moves: list[tuple[int, int]] = field(default_factory=list)
+    door_moves: list[tuple[int, int]] = field(default_factory=list)
+
+    @property
+    def is_strongly_connected(self) -> bool:
+        return len(self.components) <= 1
@@ -32,6 +32,12 @@ class Bundle:
     A Bundle is an object that holds the data that is,
     on the disk, held across the Fortune Avenue .frb file,
     the Map Descriptor .yaml file, and the other accompanying files.
+
+    source_files lists the files the bundle was read from, or the .zip
+    file holding them, and source_dir the directory they are in. For a
+    bundle read from a .zip file, source_entry is its directory inside
+    the archive, which tells apart the bundles of one archive. All of
+    them are empty for a Bundle built some other way.
     """
     authors: list[AuthorInfo]
     background: str = field(default="")
@@ -42,9 +48,15 @@ class Bundle:
     music: CustomMusic = field(default_factory=CustomMusic)
     name: Name = field(default_factory=Name)
     screenshots: list[str] = field(default_factory=list)
+    source_dir: str = field(default="")
+    source_entry: str = field(default="")
+    source_files: list[str] = field(default_factory=list)
 
     def __init__(self):
         self.descriptor = MapDescriptor()
         self.filenames = Filenames()
         self.music = CustomMusic()
         self.name = Name()
+        self.source_dir = ""
+        self.source_entry = ""
+        self.source_files = []
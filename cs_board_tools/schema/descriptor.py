@@ -234,7 +234,7 @@ class MapDescriptor:
     yaml_validation_results: CheckResult = field(default_factory=CheckResult)
 
 
-def build_map_descriptor_object(yaml_filename) -> MapDescriptor:
+def build_map_descriptor_object(yaml_filename, fast: bool = False) -> MapDescriptor:
     """
     This function takes in the filename of a .yaml Map Descriptor
     file and returns a MapDescriptor object with all of the data
@@ -243,12 +243,15 @@ def build_map_descriptor_object(yaml_filename) -> MapDescriptor:
     :param yaml_filename: A filename for a .yaml Map Descriptor
         file. (For example, WiiU.yaml)
     :type yaml_filename: str
+    :param fast: If set to True, the C-accelerated PyYAML loader is
+        used to parse the file when it is installed. Defaults to False.
+    :type fast: bool, optional
     :return: Returns a MapDescriptor object containing all of the
         data from the .yaml file.
     :rtype: MapDescriptor
     """
     yaml_schema = load_yaml_schema()
-    results = load_yaml(yaml_filename, yaml_schema)
+    results = load_yaml(yaml_filename, yaml_schema, fast=fast)
     d = MapDescriptor()
     yaml = results[0]
     if not yaml:
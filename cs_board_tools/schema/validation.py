@@ -4,6 +4,36 @@ from dataclasses import dataclass, field
 from typing import Any
 
 
+# Timing
+@dataclass
+class CheckTiming:
+    """A dataclass representing how long a validation check took to run,
+    and how much memory it needed.
+
+    wall_time and cpu_time are in seconds; cpu_time only counts the
+    thread the check ran on. peak_memory is the most memory, in bytes,
+    the check allocated at once, and is only measured when profiling,
+    so it is 0 otherwise. On a ValidationResult or a
+    ValidationResultBundle, the times are totals across its checks, and
+    peak_memory is the highest of their peaks.
+    """
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+    peak_memory: int = 0
+
+    def add(self, other: "CheckTiming"):
+        """
+        Adds another timing's times to this one's, and keeps the higher
+        of the two memory peaks.
+
+        :param other: The timing to add.
+        :type other: CheckTiming
+        """
+        self.wall_time += other.wall_time
+        self.cpu_time += other.cpu_time
+        self.peak_memory = max(self.peak_memory, other.peak_memory)
+
+
 # Check-level
 @dataclass
 class CheckResult:
@@ -15,13 +45,15 @@ class CheckResult:
     a single board. This object contains a status, which will be either
     ERROR, OK, WARNING, or SKIPPED; data, a field designed to allow any
     sort of data to be passed back; and three lists of strings to hold
-    error, informational, and warning messages, respectively.
+    error, informational, and warning messages, respectively. timing
+    records how long the check took, and is left out of comparisons.
     """
     data: Any = field(default="")
     status: str = field(default="SKIPPED")
     error_messages: list[str] = field(default_factory=list)
     informational_messages: list[str] = field(default_factory=list)
     warning_messages: list[str] = field(default_factory=list)
+    timing: CheckTiming = field(default_factory=CheckTiming, compare=False)
 
 
 # File-level
@@ -58,6 +90,7 @@ class ValidationResult:
     music_download: CheckResult = field(default_factory=CheckResult)
     naming: CheckResult = field(default_factory=CheckResult)
     screenshots: CheckResult = field(default_factory=CheckResult)
+    structure: CheckResult = field(default_factory=CheckResult)
     venture: CheckResult = field(default_factory=CheckResult)
     yaml: CheckResult = field(default_factory=CheckResult)
 
@@ -66,6 +99,9 @@ class ValidationResult:
     informational_messages: list[str] = field(default_factory=list)
     warning_messages: list[str] = field(default_factory=list)
 
+    # the total time taken by the checks
+    timing: CheckTiming = field(default_factory=CheckTiming, compare=False)
+
 
 # Bundle-level
 @dataclass
@@ -88,3 +124,4 @@ class ValidationResultBundle:
     warning_messages: list[str] = field(default_factory=list)
     informational_messages: list[str] = field(default_factory=list)
     boards: list[ValidationResult] = field(default_factory=list)
+    timing: CheckTiming = field(default_factory=CheckTiming, compare=False)
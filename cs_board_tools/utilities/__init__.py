@@ -6,14 +6,20 @@ incorrectly outside of that use-case.
 """
 
 from .collections import remove_null_entries_from_dict
-from .filesystem import cleanup, get_files_recursively
+from .filesystem import cleanup, get_cache_directory, get_files_recursively, hash_files
+from .schema import SchemaProvider, read_vendored_schema, vendor_schema
 from .yaml import load_yaml, load_yaml_schema
 from .zip import extract_zip_file
 
 __all__ = [
     cleanup.__name__,
     extract_zip_file.__name__,
+    get_cache_directory.__name__,
+    hash_files.__name__,
     load_yaml.__name__,
     load_yaml_schema.__name__,
-    remove_null_entries_from_dict.__name__
+    read_vendored_schema.__name__,
+    remove_null_entries_from_dict.__name__,
+    SchemaProvider.__name__,
+    vendor_schema.__name__
 ]
@@ -2,9 +2,32 @@
 repeatedly -- namely, functions that assist with proper handling of
 temporary files.
 """
+import hashlib
 import os
 
 
+def get_cache_directory() -> str:
+    """
+    Returns the directory this library uses to persist cached data,
+    such as the Map Descriptor schema, between runs.
+
+    The $CS_BOARD_TOOLS_CACHE_DIR environment variable takes priority.
+    Otherwise, a cs_board_tools directory is used inside
+    $XDG_CACHE_HOME, or inside ~/.cache if that is not set either.
+    The directory is not created by this function.
+
+    :return: The path to the cache directory.
+    :rtype: str
+    """
+    directory = os.environ.get("CS_BOARD_TOOLS_CACHE_DIR")
+    if directory:
+        return directory
+    base = os.environ.get("XDG_CACHE_HOME")
+    if not base:
+        base = os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "cs_board_tools")
+
+
 def get_files_recursively(directory):
     """
     This function takes a directory, and adds all of its files to an array,
@@ -21,6 +44,37 @@ def get_files_recursively(directory):
     return files
 
 
+def hash_files(file_paths: list[str], root: str = "") -> str:
+    """
+    Returns a fingerprint of a set of files: a hash of each file's name
+    and contents, so that it changes whenever any of the files is
+    renamed, edited, added, or removed. The order of file_paths does
+    not matter.
+
+    :param file_paths: The files to hash.
+    :type file_paths: list[str]
+
+    :param root: A directory that names are taken relative to, so that
+        the same files give the same fingerprint wherever they are
+        extracted to. Defaults to "", which uses the paths as given.
+    :type root: str, optional
+
+    :return: The fingerprint, as a hex string.
+    :rtype: str
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    named = sorted(
+        (os.path.relpath(f, root) if root else f, f) for f in file_paths
+    )
+    for name, f in named:
+        file_digest = hashlib.blake2b(digest_size=20)
+        with open(f, "rb") as stream:
+            for chunk in iter(lambda: stream.read(1 << 16), b""):
+                file_digest.update(chunk)
+        digest.update(name.encode("utf8") + b"\0" + file_digest.digest())
+    return digest.hexdigest()
+
+
 def remove_temp_directories(directories):
     """
     This function empties and removes all the directories passed
@@ -0,0 +1,286 @@
+"""The provider for the Map Descriptor schema lives here. It makes sure
+the schema is only downloaded once per process, keeps a copy of it on
+disk between runs, and falls back to a vendored copy of the schema if
+neither the network nor the disk cache can supply one.
+
+The vendored copy is the published schema, byte-for-byte, alongside a
+record of where and when it was downloaded. It is made and refreshed
+with vendor_schema(), or by running this module:
+
+    python -m cs_board_tools.utilities.schema
+
+A vendored copy whose bytes do not match its record is never used.
+"""
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+
+import requests
+
+from cs_board_tools.utilities.filesystem import get_cache_directory
+
+schema_url = "http://fortunestreetmodding.github.io/schema/mapdescriptor.json"
+
+vendored_schema_path = (
+    Path(__file__).resolve().parent.parent / "schema" / "mapdescriptor.json"
+)
+
+vendored_source_path = vendored_schema_path.with_name("mapdescriptor.source.json")
+
+
+def read_vendored_schema(
+    schema_path: Path = vendored_schema_path,
+    source_path: Path = vendored_source_path
+) -> dict:
+    """
+    Returns the vendored copy of the Map Descriptor schema, or None if
+    there is no vendored copy, or its bytes do not match the SHA-256
+    recorded for it by vendor_schema().
+
+    :param schema_path: The path of the vendored schema.
+    :type schema_path: Path, optional
+
+    :param source_path: The path of the record of where it came from.
+    :type source_path: Path, optional
+
+    :return: The schema as a Python dictionary, or None.
+    :rtype: dict
+    """
+    try:
+        with open(schema_path, "rb") as stream:
+            content = stream.read()
+        with open(source_path, "r", encoding="utf8") as stream:
+            source = json.load(stream)
+        if hashlib.sha256(content).hexdigest() != source["sha256"]:
+            return None
+        return json.loads(content)
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def vendor_schema(
+    url: str = schema_url,
+    schema_path: Path = vendored_schema_path,
+    source_path: Path = vendored_source_path,
+    timeout: float = 30
+) -> dict:
+    """
+    Downloads the published Map Descriptor schema and writes it to
+    schema_path exactly as it was served, along with a record of its
+    address, version, download time, and SHA-256 in source_path.
+
+    :param url: The address the schema is published at.
+    :type url: str, optional
+
+    :param schema_path: The path to write the schema to.
+    :type schema_path: Path, optional
+
+    :param source_path: The path to write the record to.
+    :type source_path: Path, optional
+
+    :param timeout: How many seconds to wait for the server.
+    :type timeout: float, optional
+
+    :raises requests.RequestException: If the schema cannot be downloaded.
+    :raises ValueError: If what was downloaded is not JSON.
+
+    :return: The record written to source_path.
+    :rtype: dict
+    """
+    res = requests.get(url, timeout=timeout)
+    res.raise_for_status()
+    content = res.content
+    json.loads(content)
+
+    source = {
+        "url": url,
+        "etag": res.headers.get("ETag"),
+        "last_modified": res.headers.get("Last-Modified"),
+        "retrieved": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "sha256": hashlib.sha256(content).hexdigest(),
+    }
+    with open(schema_path, "wb") as stream:
+        stream.write(content)
+    with open(source_path, "w", encoding="utf8") as stream:
+        json.dump(source, stream, indent=2)
+        stream.write("\n")
+    return source
+
+
+class SchemaProvider:
+    """
+    Supplies the Map Descriptor schema to the rest of the library.
+
+    The first call to get() in a process resolves the schema, and every
+    call after that returns the same object without touching the network
+    or the disk. Resolving the schema works like this:
+
+    1. If a copy exists in the on-disk cache, the server is asked for the
+       schema with If-None-Match / If-Modified-Since headers, so an
+       unchanged schema costs a 304 response and no download.
+    2. If there is no cached copy, the schema is downloaded and cached.
+    3. If the network is unavailable, the cached copy is used as-is.
+    4. If there is no cached copy either, the vendored copy that ships
+       with this library is used, if it matches its record.
+    5. If none of these can supply the schema, get() returns None.
+       Descriptors are then not checked against the schema, and each
+       one is loaded with a warning saying so, so it never passes as
+       if it had been checked.
+
+    :param url: The address the schema is published at.
+    :type url: str, optional
+
+    :param cache_dir: The directory to keep the cached schema in. Defaults
+        to the directory returned by get_cache_directory().
+    :type cache_dir: str, optional
+
+    :param timeout: How many seconds to wait for the server before falling
+        back to the cached or vendored copy.
+    :type timeout: float, optional
+
+    :param offline: If set to True, the network is never used.
+    :type offline: bool, optional
+    """
+
+    def __init__(
+        self,
+        url: str = schema_url,
+        cache_dir: str = None,
+        timeout: float = 10,
+        offline: bool = False
+    ):
+        self.url = url
+        self.cache_dir = cache_dir
+        self.timeout = timeout
+        self.offline = offline
+        self.source = ""
+        self._lock = threading.Lock()
+        self._schema = None
+        self._resolved = False
+
+    @property
+    def cache_path(self) -> Path:
+        """The path of the cached schema file."""
+        return Path(self.cache_dir or get_cache_directory()) / "mapdescriptor.json"
+
+    @property
+    def metadata_path(self) -> Path:
+        """The path of the file holding the cached schema's ETag and
+        Last-Modified values."""
+        return self.cache_path.with_suffix(".meta.json")
+
+    def get(self) -> dict:
+        """
+        Returns the Map Descriptor schema, resolving it first if this is
+        the first call. After this, the source attribute will be one of
+        "network", "cache", or "vendored", depending on where the schema
+        came from, or "unavailable" if it could not be found anywhere.
+
+        :return: The schema as a Python dictionary, or None if it is
+            unavailable.
+        :rtype: dict
+        """
+        with self._lock:
+            if not self._resolved:
+                self._schema = self._resolve()
+                self._resolved = True
+            return self._schema
+
+    def clear(self):
+        """
+        Forgets the in-memory copy of the schema, so that the next call
+        to get() resolves it again. The on-disk cache is left alone.
+        """
+        with self._lock:
+            self._schema = None
+            self._resolved = False
+            self.source = ""
+
+    def _resolve(self) -> dict:
+        cached_schema, metadata = self._read_cache()
+
+        if not self.offline:
+            schema = self._fetch(cached_schema, metadata)
+            if schema is not None:
+                return schema
+
+        if cached_schema is not None:
+            self.source = "cache"
+            return cached_schema
+
+        vendored_schema = read_vendored_schema(vendored_schema_path, vendored_source_path)
+        if vendored_schema is not None:
+            self.source = "vendored"
+            return vendored_schema
+
+        self.source = "unavailable"
+        return None
+
+    def _fetch(self, cached_schema: dict, metadata: dict) -> dict:
+        headers = {}
+        if cached_schema is not None:
+            if metadata.get("etag"):
+                headers["If-None-Match"] = metadata["etag"]
+            if metadata.get("last_modified"):
+                headers["If-Modified-Since"] = metadata["last_modified"]
+
+        try:
+            res = requests.get(self.url, headers=headers, timeout=self.timeout)
+            if res.status_code == 304 and cached_schema is not None:
+                self.source = "cache"
+                return cached_schema
+            if not res.ok:
+                return None
+            schema = res.json()
+        except (requests.RequestException, ValueError):
+            return None
+
+        self._write_cache(schema, {
+            "etag": res.headers.get("ETag"),
+            "last_modified": res.headers.get("Last-Modified"),
+        })
+        self.source = "network"
+        return schema
+
+    def _read_cache(self) -> tuple[dict, dict]:
+        try:
+            with open(self.cache_path, "r", encoding="utf8") as stream:
+                schema = json.load(stream)
+        except (OSError, ValueError):
+            return None, {}
+
+        try:
+            with open(self.metadata_path, "r", encoding="utf8") as stream:
+                metadata = json.load(stream)
+        except (OSError, ValueError):
+            metadata = {}
+
+        return schema, metadata
+
+    def _write_cache(self, schema: dict, metadata: dict):
+        # write to temporary files first and swap them into place, so
+        # that another process never reads a half-written schema
+        try:
+            os.makedirs(self.cache_path.parent, exist_ok=True)
+            for path, content in (
+                (self.cache_path, schema),
+                (self.metadata_path, metadata),
+            ):
+                temp_path = path.with_suffix(f".{os.getpid()}.tmp")
+                with open(temp_path, "w", encoding="utf8") as stream:
+                    json.dump(content, stream)
+                os.replace(temp_path, path)
+        except OSError:
+            # an unwritable cache should never stop a validation run
+            pass
+
+
+default_schema_provider = SchemaProvider()
+
+
+if __name__ == "__main__":
+    record = vendor_schema()
+    print(f"Vendored {record['url']} ({record['sha256']}).")
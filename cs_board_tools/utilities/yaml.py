@@ -1,48 +1,157 @@
 """These functions handle loading yaml and yaml schema.
 """
 from ruamel.yaml import YAML, YAMLError
+from datetime import date
 import json
+import threading
 import jsonschema
-import requests
 from cs_board_tools.schema.validation import CheckResult
-from cs_board_tools.errors import process_log_messages
+from cs_board_tools.utilities.schema import default_schema_provider
 
-error_messages = []
-informational_messages = []
-warning_messages = []
+# PyYAML is optional. When it was built against libyaml, its CSafeLoader
+# is the fastest way to parse a descriptor, so load_yaml can use it
+# when asked to.
+try:
+    import yaml as pyyaml
+    from yaml import CSafeLoader
+    yaml_error_types = (pyyaml.YAMLError,)
+except ImportError:
+    pyyaml = None
+    CSafeLoader = None
+    yaml_error_types = ()
 
+# compiled validators, keyed by the id() of the schema they were built
+# from. The schema itself is kept alongside so that the id can't be
+# reused by another object while the entry exists.
+compiled_validators = {}
+compiled_validators_lock = threading.Lock()
 
-def load_yaml(yaml_filename, yaml_schema):
+schema_unavailable_message = (
+    "The Map Descriptor schema could not be loaded, so this .yaml file "
+    "was not checked against it."
+)
+
+
+def get_yaml_validator(yaml_schema):
+    """This function returns a jsonschema validator for the given schema.
+    The schema is checked and the validator is built the first time a
+    schema is seen; after that, the same validator is reused for every
+    descriptor validated against that schema.
+
+    :param yaml_schema: The schema of the Map Descriptor format.
+    :type yaml_schema: dict
+
+    :return: A validator of the Draft*Validator class that matches the
+        schema's $schema keyword.
+    :rtype: jsonschema.protocols.Validator
+    """
+    key = id(yaml_schema)
+    with compiled_validators_lock:
+        entry = compiled_validators.get(key)
+        if entry is not None and entry[0] is yaml_schema:
+            return entry[1]
+
+        validator_class = jsonschema.validators.validator_for(yaml_schema)
+        validator_class.check_schema(yaml_schema)
+        validator = validator_class(yaml_schema)
+        compiled_validators[key] = (yaml_schema, validator)
+        return validator
+
+
+def normalize_yaml_content(node):
+    """This function walks parsed yaml content once and turns it into the
+    plain, JSON-compatible data the schema expects: mapping keys become
+    strings the way json.dumps would write them (so shopNames' 1: turns
+    into "1"), tuples become lists, and dates become ISO 8601 strings.
+
+    :param node: Parsed yaml content, or any part of it.
+    :type node: Any
+
+    :return: The normalized content.
+    :rtype: Any
+    """
+    if isinstance(node, dict):
+        return {
+            (k if isinstance(k, str) else json.dumps(k)): normalize_yaml_content(v)
+            for k, v in node.items()
+        }
+    if isinstance(node, (list, tuple)):
+        return [normalize_yaml_content(v) for v in node]
+    if isinstance(node, date):
+        return node.isoformat()
+    return node
+
+
+def parse_yaml(stream, fast: bool = False):
+    """This function parses a yaml stream with the safe loader.
+
+    :param stream: An open file, or a string, containing yaml.
+    :type stream: Any
+
+    :param fast: If set to True and PyYAML's libyaml-based CSafeLoader is
+        installed, it is used instead of ruamel.yaml. Note that PyYAML
+        follows YAML 1.1, so values like `yes` and `off` load as booleans.
+        Defaults to False.
+    :type fast: bool, optional
+
+    :return: The parsed content, not yet normalized.
+    :rtype: Any
+    """
+    if fast and CSafeLoader is not None:
+        return pyyaml.load(stream, Loader=CSafeLoader)
+    # ruamel.yaml uses its own C-based loader for typ='safe' whenever
+    # ruamel.yaml.clib is available
+    return YAML(typ='safe').load(stream)
+
+
+def load_yaml(yaml_filename, yaml_schema, fast: bool = False):
     """This function handles loading the .yaml file from disk.
 
     :param yaml_filename: The filename of the .yaml file.
     :type yaml_filename: str
 
-    :param yaml_schema: The schema of the Map Descriptor format.
-    :type yaml_schema: str
+    :param yaml_schema: The schema of the Map Descriptor format. If it
+        is None, the file is not checked against it, and a warning says
+        so.
+    :type yaml_schema: dict
+
+    :param fast: If set to True, the C-accelerated PyYAML loader is used
+        when it is available. See parse_yaml. Defaults to False.
+    :type fast: bool, optional
+
+    :return: A list holding the parsed content and a CheckResult with
+        the validation results. Both are created fresh for every call,
+        so descriptors can safely be loaded from several threads.
+    :rtype: list
     """
     results = CheckResult()
-    global error_messages
-    global informational_messages
-    global warning_messages
+    error_messages = []
+    informational_messages = []
+    warning_messages = []
     yamlContent = ""
     with open(yaml_filename, "r", encoding="utf8") as stream:
         try:
-            yaml=YAML(typ='safe')
-            yamlContent = yaml.load(stream)
-            board_dict = json.dumps(yamlContent)
-            yamlContent = yaml.load(board_dict)
+            yamlContent = normalize_yaml_content(parse_yaml(stream, fast))
 
-            jsonschema.validate(yamlContent, yaml_schema)
-        except YAMLError as exc:
+            if yaml_schema:
+                validator = get_yaml_validator(yaml_schema)
+                # report every violation, in a stable order, rather
+                # than stopping at the first one
+                violations = sorted(
+                    validator.iter_errors(yamlContent),
+                    key=lambda e: [str(p) for p in e.absolute_path]
+                )
+                for err in violations:
+                    error_messages.append(str(f"A yaml schema violation has been found: {err.message}"))
+            else:
+                warning_messages.append(schema_unavailable_message)
+        except (YAMLError, *yaml_error_types) as exc:
             split = str(exc).split("\n\nTo", 1)
             error_messages.append("A yaml format error was encountered:\n" + split[0])
-        except jsonschema.ValidationError as err:
-            error_messages.append(str(f"A yaml schema violation has been found: {err.message}"))
 
-    results.error_messages = error_messages.copy()
-    results.informational_messages = informational_messages.copy()
-    results.warning_messages = warning_messages.copy()
+    results.error_messages = error_messages
+    results.informational_messages = informational_messages
+    results.warning_messages = warning_messages
 
     if error_messages:
         results.status = "ERROR"
@@ -51,16 +160,9 @@ def load_yaml(yaml_filename, yaml_schema):
     else:
         results.status = "OK"
 
-    process_log_messages(
-        errors=error_messages.copy(),
-        messages=informational_messages.copy(),
-        warnings=warning_messages.copy()
-    )
-
-    error_messages.clear()
-    informational_messages.clear()
-    warning_messages.clear()
-
+    # Nothing is tallied in cs_board_tools.errors here: the validation
+    # entry points process yaml_validation_results themselves, and
+    # shared counters would mix up descriptors loaded concurrently.
     return [yamlContent, results]
 
 
@@ -68,11 +170,13 @@ def load_yaml_schema():
     """This function handles loading the Map Descriptor yaml schema from
     the fortunestreetmodding.github.io repo.
 
-    :return: Returns the schema JSON as a string.
-    :rtype: str
+    The schema is only fetched once per process. It is also cached on
+    disk and revalidated with a conditional request, and if the network
+    is unavailable, the cached or vendored copy of the schema is used
+    instead. See cs_board_tools.utilities.schema for details.
+
+    :return: Returns the schema JSON as a dictionary, or None if it is
+        unavailable.
+    :rtype: dict
     """
-    url = "http://fortunestreetmodding.github.io/schema/mapdescriptor.json"
-    res = requests.get(url)
-    if not res.ok:
-        return
-    return res.json()
+    return default_schema_provider.get()
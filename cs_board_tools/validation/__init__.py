@@ -5,39 +5,49 @@ compatiblility with Custom Street Map Manager (CSMM).
 """
 
 from .consistency import check_consistency
-from .board import check_board_configuration
+from .board import check_board_configuration, check_overlapping_squares
 from ..errors import (
     get_count,
     get_text,
     IssueType,
     reset_errors_and_warnings,
+    use_context,
+    ValidationContext,
 )
 
 from .filesystem import check_for_screenshots, check_icon
 from .main import (
     validate_board_file,
     validate_bundle,
+    validate_bundles_parallel,
     validate_descriptor
 )
 from .music import check_music_download
 from .naming import check_naming_convention
-from .paths import check_max_paths
+from .paths import check_max_paths, check_max_paths_for_boards
+from .structure import check_board_structure
 from .venture import check_venture_cards
 
 __all__ = [
     check_consistency.__name__,
     check_board_configuration.__name__,
+    check_board_structure.__name__,
     check_for_screenshots.__name__,
     check_icon.__name__,
     check_music_download.__name__,
     check_naming_convention.__name__,
+    check_overlapping_squares.__name__,
     check_max_paths.__name__,
+    check_max_paths_for_boards.__name__,
     check_venture_cards.__name__,
     get_count.__name__,
     get_text.__name__,
     IssueType.__name__,
     reset_errors_and_warnings.__name__,
+    use_context.__name__,
     validate_board_file.__name__,
     validate_bundle.__name__,
-    validate_descriptor.__name__
+    validate_bundles_parallel.__name__,
+    validate_descriptor.__name__,
+    ValidationContext.__name__
 ]
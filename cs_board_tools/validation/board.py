@@ -1,6 +1,11 @@
 """Validation checks related to board configuration, in the .yaml and/or
 the .frb file, live here.
 """
+from dataclasses import dataclass, field
+
+from cs_board_tools.queries.frb.graph import get_board_graph
+from cs_board_tools.queries.frb.spatial import get_spatial_index
+from cs_board_tools.queries.frb.squaretype import get_square_type_index
 from cs_board_tools.schema.descriptor import MapDescriptor
 from cs_board_tools.schema.frb import BoardFile, SquareType
 from cs_board_tools.schema.validation import CheckResult
@@ -19,11 +24,62 @@ doors = [
     SquareType.OneWayAlleyDoorD
 ]
 
+overlapping_squares_warning = (
+    "This board contains squares placed less than one tile apart, so "
+    "that they overlap. The overlapping pairs of square IDs in each "
+    ".frb file are as follows: {overlaps}"
+)
+
+
+@dataclass
+class SquareScan:
+    """
+    This dataclass holds the per-square facts the door mini-checks
+    need, gathered from every .frb file's SquareTypeIndex and
+    BoardGraph.
+    """
+    has_doors: bool = False
+    door_ids: set[int] = field(default_factory=set)
+    door_connection_ids: set[int] = field(default_factory=set)
+
+
+def scan_squares(frbs: list[BoardFile]) -> SquareScan:
+    """
+    Gathers everything the door mini-checks need to know about the
+    squares of every .frb file. The doors are looked up in each file's
+    SquareTypeIndex, and the squares they connect to in its BoardGraph,
+    both of which are shared with the other checks, so the squares
+    themselves are not walked again.
+
+    :param frbs: A list of BoardFile objects representing one or more
+        .frb files.
+    :type frbs: list[BoardFile]
+
+    :return: The facts gathered from the squares.
+    :rtype: SquareScan
+    """
+    scan = SquareScan()
+    scan.has_doors = any(get_square_type_index(f).has_any(doors) for f in frbs)
+    if not scan.has_doors:
+        return scan
+
+    # Two-Way Doors are only looked for in the first file
+    square_types = get_square_type_index(frbs[0])
+    connections = get_board_graph(frbs[0]).connections
+    for t in doors:
+        for square_id in square_types.ids(t):
+            scan.door_ids.add(square_id)
+            scan.door_connection_ids.update(connections[square_id])
+    return scan
+
+
 # Mini-checks
 # These tests simply return strings when errors occur, then return them to
-# be part of the larger "Board Configuration" check.
+# be part of the larger "Board Configuration" check. Each one can be given
+# a SquareScan that has already been made, so that several of them only
+# walk the squares once.
 
-def check_doors_and_dice(frbs: list[BoardFile]) -> str:
+def check_doors_and_dice(frbs: list[BoardFile], scan: SquareScan = None) -> str:
     """
     Checks to ensure that boards that have Max Dice Roll set to 9
     do not have doors. This is a condition that is known to cause the
@@ -33,6 +89,9 @@ def check_doors_and_dice(frbs: list[BoardFile]) -> str:
         .frb files.
     :type frbs: list[BoardFile]
 
+    :param scan: The squares' SquareScan, if it has already been made.
+    :type scan: SquareScan, optional
+
     :return: A string containing the error message if the check
         fails, or an empty string if it passes.
     :rtype: str
@@ -44,10 +103,10 @@ def check_doors_and_dice(frbs: list[BoardFile]) -> str:
     # The combination of these things is unstable
     # in-game and likely to crash the game.
     if frbs[0].board_info.max_dice_roll == 9:
-        for f in frbs:
-            for s in f._board_data.squares:
-                if s.square_type in doors:
-                    result = doors_and_dice_error
+        if scan is None:
+            scan = scan_squares(frbs)
+        if scan.has_doors:
+            result = doors_and_dice_error
 
     return result
 
@@ -146,7 +205,7 @@ def check_switch_ids(frbs: list[BoardFile]) -> str:
     return result
 
 
-def check_two_way_doors(frbs: list[BoardFile]) -> str:
+def check_two_way_doors(frbs: list[BoardFile], scan: SquareScan = None) -> str:
     """
     Checks that there are no Two-Way Doors if Max Dice Roll is set to
     8 or 9. (A Two-Way door is a One-Way Door whose Destination ID is
@@ -156,41 +215,90 @@ def check_two_way_doors(frbs: list[BoardFile]) -> str:
         .frb files.
     :type frbs: list[BoardFile]
 
+    :param scan: The squares' SquareScan, if it has already been made.
+    :type scan: SquareScan, optional
+
     :return: A string containing the error message if the check
         fails, or an empty string if it passes.
     :rtype: str
     """
-    door_ids = []
-    frb = frbs[0]
-    result = ""
-    waypoint_connection_ids = []
-
-    # populate door_ids list
-    for idx, s in enumerate(frb.squares):
-        if s.square_type in doors:
-            door_ids.append(idx)
-
-    # populate waypoint_connection_ids list
-    for d in door_ids:
-        for w in frb.squares[d].waypoints:
-            waypoint_connection_ids.append(w.entryId)
-            for i in w.destinations:
-                waypoint_connection_ids.append(i)
-
-    # check to see if any of the waypoint connection ids are doors
-    # if yes = a two-way door is present
-    for w in waypoint_connection_ids:
-        if w in door_ids:
-            if frb.board_info.max_dice_roll > 7:
-                return (
-                    "This board uses Two-Way Doors, and Max Dice Roll is "
-                    "> 7. This is a scenario that can cause crashes, so "
-                    "please switch to using One-Way Alley Ends (rather "
-                    "than linking Doors directly), or reduce Max Dice Roll "
-                    "to be less than or equal to 7."
-                )
+    if frbs[0].board_info.max_dice_roll <= 7:
+        return ""
+    if scan is None:
+        scan = scan_squares(frbs)
+
+    # if any square a door's waypoints mention is itself a door, a
+    # two-way door is present
+    if scan.door_connection_ids & scan.door_ids:
+        return (
+            "This board uses Two-Way Doors, and Max Dice Roll is "
+            "> 7. This is a scenario that can cause crashes, so "
+            "please switch to using One-Way Alley Ends (rather "
+            "than linking Doors directly), or reduce Max Dice Roll "
+            "to be less than or equal to 7."
+        )
+
+    return ""
 
-    return result
+
+def check_overlapping_squares(
+    frbs: list[BoardFile],
+    skip: bool = False,
+    skip_warnings: bool = False
+) -> CheckResult:
+    """
+    Checks to see if any squares are placed so close together that
+    their tiles overlap, which makes the board hard to read in-game.
+    This check is not part of the Board Configuration Checks, and
+    validate_bundle does not run it.
+
+    :param frbs: A list of BoardFile objects representing one or more
+        .frb files.
+    :type frbs: list[BoardFile]
+
+    :param skip: If set to True, the check will be skipped, but a
+        valid resultobject with no messages and SKIPPED as its
+        status will still be returned.
+    :type skip: bool
+
+    :param skip_warnings: If set, skips tests resulting in
+        "Warning" messages.
+    :type skip_warnings: bool, optional
+
+    :return: A CheckResult object containing the check status as
+        well as any messages.
+    :rtype: CheckResult
+    """
+    if skip:
+        return build_results_object(skip=True)
+
+    error_messages = []
+    informational_messages = []
+    warning_messages = []
+
+    overlaps_message = ""
+    for filenum, f in enumerate(frbs, start=1):
+        overlaps = get_spatial_index(f).find_overlaps()
+        if overlaps:
+            pairs = " ".join(f"({a}, {b})" for a, b in overlaps)
+            overlaps_message += f"{filenum}: {pairs}, "
+
+    if overlaps_message and not skip_warnings:
+        warning_messages.append(
+            overlapping_squares_warning.format(overlaps=overlaps_message)
+        )
+
+    results = build_results_object(
+        errors=error_messages,
+        messages=informational_messages,
+        warnings=warning_messages
+    )
+
+    error_messages.clear()
+    informational_messages.clear()
+    warning_messages.clear()
+
+    return results
 
 
 def check_yaml_authors(descriptor: MapDescriptor) -> str:
@@ -301,7 +409,9 @@ def check_board_configuration(descriptor: MapDescriptor = None, frbs: list[Board
 
     # frb checks
     if frbs:
-        doors_and_dice_result = check_doors_and_dice(frbs)
+        scan = scan_squares(frbs)
+
+        doors_and_dice_result = check_doors_and_dice(frbs, scan)
         if doors_and_dice_result:
             error_messages.append(doors_and_dice_result)
 
@@ -313,7 +423,7 @@ def check_board_configuration(descriptor: MapDescriptor = None, frbs: list[Board
         if switch_id_result:
             error_messages.append(switch_id_result)
 
-        two_way_door_result = check_two_way_doors(frbs)
+        two_way_door_result = check_two_way_doors(frbs, scan)
         if two_way_door_result:
             error_messages.append(two_way_door_result)
 
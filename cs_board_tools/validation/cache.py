@@ -0,0 +1,270 @@
+"""A persistent cache for validation results, so that a bundle whose
+files have not changed since it was last validated is not validated
+again. Results are kept on disk between runs, one JSON file per bundle,
+keyed by a hash of the bundle's files, the version of this library, and
+the options the checks ran with; changing any of those misses the cache.
+
+The cache stores the result of each check, rather than the board's
+totals, so that a hit can replay the stored checks in order and still
+run the checks that cannot be cached, such as the Music Download check,
+which depends on the network rather than on the bundle's files.
+"""
+import hashlib
+import json
+import os
+from dataclasses import fields, is_dataclass
+from pathlib import Path
+from typing import Any
+
+from cs_board_tools.__about__ import __version__
+from cs_board_tools.errors import process_log_messages
+from cs_board_tools.schema.analysis import BoardStructure, MaxPathsBreakdown, MaxPathsCount
+from cs_board_tools.schema.bundle import Bundle
+from cs_board_tools.schema.validation import CheckResult
+from cs_board_tools.utilities.filesystem import get_cache_directory, hash_files
+
+# checks whose results depend on more than the bundle's files, and so
+# run again every time
+uncached_checks = {"music_download"}
+
+# the types a check's data can hold and still be cached
+cached_data_types = {
+    t.__name__: t for t in (BoardStructure, MaxPathsBreakdown, MaxPathsCount)
+}
+
+
+def get_validation_cache_directory(cache_dir: str = None) -> Path:
+    """
+    Returns the directory cached validation results are kept in.
+
+    :param cache_dir: The directory to use. Defaults to None, which uses
+        a validation directory inside get_cache_directory().
+    :type cache_dir: str, optional
+
+    :return: The path to the directory.
+    :rtype: Path
+    """
+    if cache_dir:
+        return Path(cache_dir)
+    return Path(get_cache_directory()) / "validation"
+
+
+def get_validation_cache_key(bundle: Bundle, options: dict) -> str:
+    """
+    Returns the key a bundle's validation result is cached under, or an
+    empty string if the bundle cannot be cached, because it was not
+    read from disk, or its files can no longer be read.
+
+    The key is made from a hash of every file the bundle was read from,
+    so it is only worked out when caching is on. Bundles read from the
+    same .zip file share that hash, so the bundle's place inside the
+    archive goes into the key as well.
+
+    :param bundle: The bundle being validated.
+    :type bundle: Bundle
+
+    :param options: The options the checks run with, such as which of
+        them are skipped. Every value should have a stable repr.
+    :type options: dict
+
+    :return: The key, as a hex string.
+    :rtype: str
+    """
+    if not bundle.source_files:
+        return ""
+    try:
+        fingerprint = hash_files(bundle.source_files, root=bundle.source_dir)
+    except OSError:
+        return ""
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(fingerprint.encode("utf8"))
+    digest.update(bundle.source_entry.encode("utf8") + b"\0")
+    digest.update(__version__.encode("utf8"))
+    digest.update(repr(sorted(options.items())).encode("utf8"))
+    return digest.hexdigest()
+
+
+def encode_data(value: Any) -> Any:
+    """
+    Turns a check's data into something json.dump can write. Dataclasses
+    are tagged with their type, and tuples are tagged as tuples, so that
+    decode_data can rebuild them exactly.
+
+    :raises TypeError: If the data holds a type that cannot be cached.
+    """
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, list):
+        return [encode_data(v) for v in value]
+    if isinstance(value, tuple):
+        return {"tuple": [encode_data(v) for v in value]}
+    if is_dataclass(value) and cached_data_types.get(type(value).__name__) is type(value):
+        return {
+            "type": type(value).__name__,
+            "fields": {f.name: encode_data(getattr(value, f.name)) for f in fields(value)},
+        }
+    raise TypeError(f"{type(value).__name__} data cannot be cached.")
+
+
+def decode_data(value: Any) -> Any:
+    """
+    Rebuilds a check's data from what encode_data made of it.
+
+    :raises ValueError: If the value was not made by encode_data.
+    """
+    if isinstance(value, list):
+        return [decode_data(v) for v in value]
+    if isinstance(value, dict):
+        if set(value) == {"tuple"}:
+            return tuple(decode_data(v) for v in value["tuple"])
+        data_type = cached_data_types.get(value.get("type"))
+        if data_type is None or not isinstance(value.get("fields"), dict):
+            raise ValueError("The cached data has an unknown type.")
+        return data_type(**{k: decode_data(v) for k, v in value["fields"].items()})
+    return value
+
+
+def encode_check_result(result: CheckResult) -> dict:
+    """
+    Turns a CheckResult into something json.dump can write. Its timing
+    is left out.
+
+    :raises TypeError: If the result's data cannot be cached.
+    """
+    return {
+        "status": result.status,
+        "data": encode_data(result.data),
+        "error_messages": list(result.error_messages),
+        "informational_messages": list(result.informational_messages),
+        "warning_messages": list(result.warning_messages),
+    }
+
+
+def decode_check_result(entry: dict) -> CheckResult:
+    """
+    Rebuilds a CheckResult from what encode_check_result made of it.
+
+    :raises ValueError: If the entry was not made by encode_check_result.
+    """
+    result = CheckResult(data=decode_data(entry["data"]), status=entry["status"])
+    if not isinstance(result.status, str):
+        raise ValueError("The cached status is not a string.")
+    for name in ("error_messages", "informational_messages", "warning_messages"):
+        messages = entry[name]
+        if not isinstance(messages, list) or not all(isinstance(m, str) for m in messages):
+            raise ValueError(f"The cached {name} are not a list of strings.")
+        setattr(result, name, messages)
+    return result
+
+
+def is_cacheable(results: dict[str, CheckResult]) -> bool:
+    """
+    Returns whether a bundle's check results would be the same next time
+    for the same files. Max Paths searches that ran out of time depend
+    on how busy the machine was, so results holding one are not cached.
+
+    :param results: The bundle's check results, by name.
+    :type results: dict[str, CheckResult]
+
+    :rtype: bool
+    """
+    max_paths = results.get("max_paths")
+    paths = max_paths.data if max_paths is not None else None
+    if isinstance(paths, MaxPathsBreakdown):
+        return not any(p.timed_out for p in paths.files)
+    return not getattr(paths, "timed_out", False)
+
+
+def read_cached_results(key: str, cache_dir: str = None) -> dict[str, CheckResult]:
+    """
+    Returns the check results cached under a key, by check name, or None
+    if there are none, or they cannot be read. Checks in uncached_checks
+    are never among them.
+
+    :param key: The key, from get_validation_cache_key.
+    :type key: str
+
+    :param cache_dir: The directory the cache is kept in. Defaults to
+        None, which uses get_validation_cache_directory().
+    :type cache_dir: str, optional
+
+    :return: The cached results, or None.
+    :rtype: dict[str, CheckResult]
+    """
+    if not key:
+        return None
+    path = get_validation_cache_directory(cache_dir) / f"{key}.json"
+    try:
+        with open(path, "r", encoding="utf8") as stream:
+            entry = json.load(stream)
+        return {
+            name: decode_check_result(result)
+            for name, result in entry["checks"].items()
+        }
+    except Exception:
+        # a missing, truncated, or otherwise unreadable entry is a miss
+        return None
+
+
+def write_cached_results(key: str, results: dict[str, CheckResult], cache_dir: str = None):
+    """
+    Caches a bundle's check results under a key, apart from those in
+    uncached_checks, unless is_cacheable says they should not be. Does
+    nothing if the cache cannot be written.
+
+    :param key: The key, from get_validation_cache_key.
+    :type key: str
+
+    :param results: The bundle's check results, by name.
+    :type results: dict[str, CheckResult]
+
+    :param cache_dir: The directory the cache is kept in. Defaults to
+        None, which uses get_validation_cache_directory().
+    :type cache_dir: str, optional
+    """
+    if not key or not is_cacheable(results):
+        return
+    try:
+        entry = {"checks": {
+            name: encode_check_result(result)
+            for name, result in results.items()
+            if name not in uncached_checks
+        }}
+    except TypeError:
+        return
+
+    directory = get_validation_cache_directory(cache_dir)
+    path = directory / f"{key}.json"
+
+    # write to a temporary file first and swap it into place, so that
+    # another process never reads a half-written result
+    try:
+        os.makedirs(directory, exist_ok=True)
+        temp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(temp_path, "w", encoding="utf8") as stream:
+            json.dump(entry, stream)
+        os.replace(temp_path, path)
+    except OSError:
+        # an unwritable cache should never stop a validation run
+        pass
+
+
+def replay_cached_result(result: CheckResult) -> CheckResult:
+    """
+    Stands in for a check whose result was cached: tallies the stored
+    messages in the current context, exactly as build_results_object
+    did when the check first ran, and returns the stored result.
+
+    :param result: The cached result.
+    :type result: CheckResult
+
+    :return: The same result.
+    :rtype: CheckResult
+    """
+    process_log_messages(
+        errors=result.error_messages.copy(),
+        messages=result.informational_messages.copy(),
+        warnings=result.warning_messages.copy(),
+        job_was_successful=result.status
+    )
+    return result
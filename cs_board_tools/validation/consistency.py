@@ -17,12 +17,8 @@ mismatch_error = (
     "yaml file but {frbValue} in the frb file."
 )
 
-error_messages = []
-informational_messages = []
-warning_messages = []
 
-
-def compare_values(frbValue, yamlValue, attribute):
+def compare_values(frbValue, yamlValue, attribute, messages: list[str]):
     """
     A function that compares two values, one from the
     Fortune Avenue-compatible .frb board file, and the
@@ -41,12 +37,13 @@ def compare_values(frbValue, yamlValue, attribute):
     :param attribute: The attribute, in string form, which we are comparing.
     :type attribute: string
 
+    :param messages: The list to add the error message to.
+    :type messages: list[str]
     """
     if not frbValue or not yamlValue:
         return
-    global error_messages
     if frbValue != yamlValue:
-        error_messages.append(
+        messages.append(
             mismatch_error.format(
                 attribute=attribute,
                 frbValue=frbValue,
@@ -105,9 +102,10 @@ def check_consistency(bundle: Bundle, skip: bool, skip_warnings: bool = False) -
     if skip:
         return build_results_object(skip=True)
 
-    global error_messages
-    global informational_messages
-    global warning_messages
+    # these are kept local, so that bundles can be checked side by side
+    error_messages = []
+    informational_messages = []
+    warning_messages = []
 
     if len(bundle.frbs) == 0:
         error_messages.append(file_not_found_error)
@@ -118,22 +116,26 @@ def check_consistency(bundle: Bundle, skip: bool, skip_warnings: bool = False) -
         compare_values(
             frb_info.base_salary,
             yaml_info.base_salary,
-            "baseSalary"
+            "baseSalary",
+            error_messages
         )
         compare_values(
             frb_info.initial_cash,
             yaml_info.initial_cash,
-            "initialCash"
+            "initialCash",
+            error_messages
         )
         compare_values(
             frb_info.max_dice_roll,
             yaml_info.max_dice_roll,
-            "maxDiceRoll"
+            "maxDiceRoll",
+            error_messages
         )
         compare_values(
             frb_info.salary_increment,
             yaml_info.salary_increment,
-            "salaryIncrement"
+            "salaryIncrement",
+            error_messages
         )
 
         # convert_galaxy_status is needed to convert the
@@ -143,7 +145,7 @@ def check_consistency(bundle: Bundle, skip: bool, skip_warnings: bool = False) -
         yaml_loop_mode = "none"
         if bundle.descriptor.looping is not None:
             yaml_loop_mode = bundle.descriptor.looping.mode.lower()
-        compare_values(frb_loop_mode, yaml_loop_mode, "looping mode")
+        compare_values(frb_loop_mode, yaml_loop_mode, "looping mode", error_messages)
 
     results = build_results_object(
         errors=error_messages,
@@ -2,29 +2,49 @@
 then use the validation check functions from all the surrounding
 files.
 """
-
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import fields
+from typing import Iterator
 
 from cs_board_tools.errors import (
     get_count,
     get_text,
     IssueType,
     process_log_messages,
-    reset_errors_and_warnings,
+    use_context,
 )
+from cs_board_tools.io.bundle import read_files, read_zip
 from cs_board_tools.schema.validation import (
+    CheckResult,
     ValidationResult,
     ValidationResultBundle
 )
 from cs_board_tools.schema.bundle import Bundle
 from cs_board_tools.schema.frb import BoardFile
 from cs_board_tools.schema.descriptor import MapDescriptor
+from cs_board_tools.utilities.filesystem import get_files_recursively
 
 from .consistency import check_consistency
 from .board import check_board_configuration
+from .cache import (
+    get_validation_cache_key,
+    read_cached_results,
+    replay_cached_result,
+    uncached_checks,
+    write_cached_results
+)
 from .filesystem import check_for_screenshots, check_icon
 from .music import check_music_download
 from .naming import check_naming_convention
-from .paths import check_max_paths
+from .paths import (
+    check_max_paths,
+    check_max_paths_for_boards,
+    search_max_paths_for_boards
+)
+from .scheduler import ScheduledCheck, collect_checks, run_timed, submit_checks
+from .structure import check_board_structure
 from .venture import check_venture_cards
 
 
@@ -39,18 +59,78 @@ board_name_ignore_list = [
 ]
 
 
+def tally_board_result(board_result: ValidationResult):
+    """
+    Fills in a board's counts and messages from the current
+    ValidationContext, once all of its checks have run, and totals up
+    the time its checks took.
+
+    :param board_result: The board's result.
+    :type board_result: ValidationResult
+    """
+    errors = get_count(IssueType.ERRORS)
+    successes = get_count(IssueType.SUCCESS)
+    warnings = get_count(IssueType.WARNINGS)
+    issues = errors + warnings
+    total = issues + successes
+
+    board_result.error_count = errors
+    board_result.success_count = successes
+    board_result.warning_count = warnings
+    board_result.issue_count = issues
+    board_result.total_count = total
+    board_result.error_messages = get_text(IssueType.ERRORS)
+    board_result.warning_messages = get_text(IssueType.WARNINGS)
+    board_result.informational_messages = get_text(IssueType.SUCCESS)
+
+    for f in fields(board_result):
+        check_result = getattr(board_result, f.name)
+        if isinstance(check_result, CheckResult):
+            board_result.timing.add(check_result.timing)
+
+
+def add_board_result(result_bundle: ValidationResultBundle, board_result: ValidationResult):
+    """
+    Adds a board's result to a ValidationResultBundle, and its counts
+    and messages to the bundle's totals.
+
+    :param result_bundle: The bundle to add the result to.
+    :type result_bundle: ValidationResultBundle
+
+    :param board_result: The board's result.
+    :type board_result: ValidationResult
+    """
+    result_bundle.boards.append(board_result)
+    result_bundle.error_count += board_result.error_count
+    result_bundle.warning_count += board_result.warning_count
+    result_bundle.issue_count += board_result.issue_count
+    result_bundle.success_count += board_result.success_count
+    result_bundle.total_count += board_result.total_count
+    result_bundle.error_messages.extend(board_result.error_messages)
+    result_bundle.informational_messages.extend(board_result.informational_messages)
+    result_bundle.warning_messages.extend(board_result.warning_messages)
+    result_bundle.timing.add(board_result.timing)
+
+
 def validate_bundle(
     bundles: list[Bundle],
     gdrive_api_key=None,
     skip_consistency_test=False,
     skip_board_configuration_test=False,
+    skip_board_structure_test=True,
     skip_icon_test=False,
     skip_max_paths_test=False,
     skip_music_download_test=False,
     skip_naming_convention_test=False,
     skip_screenshots_test=False,
     skip_venture_cards_test=False,
-    skip_warnings=False
+    skip_warnings=False,
+    max_paths_time_budget=None,
+    workers=None,
+    cache=False,
+    cache_dir=None,
+    profile=False,
+    profile_dir=None
 ) -> ValidationResultBundle:
     """
     The entry-point for validating board bundles.
@@ -71,6 +151,12 @@ def validate_bundle(
         Checks will be skipped. Defaults to False.
     :type skip_board_configuration_test: bool, optional
 
+    :param skip_board_structure_test: If set to True, the Board Structure
+        Check will be skipped. Defaults to True, as the check does not
+        yet follow Back Street warps or Cannons, and would warn about
+        squares that can only be reached through them.
+    :type skip_board_structure_test: bool, optional
+
     :param skip_mapicon_test: If set to True, the Map Icon Check will
         be skipped. Defaults to False.
     :type skip_max_paths_test: bool, optional
@@ -99,6 +185,41 @@ def validate_bundle(
         that return Warning messages will be skipped. Defaults to False.
     :type skip_warnings: bool, optional
 
+    :param max_paths_time_budget: The most wall-clock time, in seconds,
+        that the Max Paths Check may spend on each board. Defaults to
+        None, which means no budget.
+    :type max_paths_time_budget: float, optional
+
+    :param workers: The number of processes the Max Paths Check may
+        use, to search several bundles side by side. The other checks
+        always run side by side on threads. Defaults to None, which
+        uses one process per CPU. The Max Paths Check only falls back
+        to a thread where processes cannot be started.
+    :type workers: int, optional
+
+    :param cache: If set to True, each bundle's check results are kept
+        on disk, and a bundle whose files and options have not changed
+        since it was last validated reuses its stored results instead of
+        running the checks again. The Music Download Check depends on the
+        network, so it is never cached, and always runs. Only bundles
+        read from disk can be cached. Defaults to False.
+    :type cache: bool, optional
+
+    :param cache_dir: The directory to keep cached results in. Defaults
+        to None, which uses a directory inside get_cache_directory().
+    :type cache_dir: str, optional
+
+    :param profile: Every check's wall and CPU time are always recorded
+        on its CheckResult. If set to True, each check's peak memory is
+        measured as well, and the checks run one after another so that
+        their measurements do not overlap. Defaults to False.
+    :type profile: bool, optional
+
+    :param profile_dir: If given, each check runs under cProfile, and
+        its stats are written to a <board name>.<check name>.prof file
+        in this directory. Implies profile. Defaults to None.
+    :type profile_dir: str, optional
+
     :return: A bundle containing the overall results, as well as a list
         containing objects that represent each of the individual results.
     :rtype: ValidationResultBundle
@@ -106,137 +227,176 @@ def validate_bundle(
 
     result_bundle = ValidationResultBundle()
 
-    r = []
-    for b in bundles:
-        reset_errors_and_warnings()
-        board_result = ValidationResult()
-        board_result.board_name = b.name.en
-
-        if not b.name.en or b.name.en in board_name_ignore_list:
-            board_result.board_configuration = check_board_configuration(skip=True)
-            board_result.consistency = check_consistency(bundle=b, skip=True)
-            board_result.max_paths = check_max_paths(frb="", skip=True)
-            board_result.icon = check_icon(bundle=b, skip=True)
-            board_result.music_download = check_music_download(skip=True)
-            board_result.naming = check_naming_convention(bundle=b, skip=True)
-            board_result.screenshots = check_for_screenshots(bundle=b, skip=True)
-            board_result.venture = check_venture_cards(bundle=b, skip=True, skip_warnings=skip_warnings)
-        else:
-            board_result.naming = check_naming_convention(
-                bundle=b,
-                skip=skip_naming_convention_test,
-                skip_warnings=skip_warnings
+    def get_checks(b: Bundle) -> list[ScheduledCheck]:
+        # boards on the ignore list are not checked at all, and the .frb
+        # checks need at least one .frb
+        ignored = not b.name.en or b.name.en in board_name_ignore_list
+        no_frbs = ignored or len(b.frbs) == 0
+        return [
+            ScheduledCheck(
+                "naming", check_naming_convention,
+                inputs={"bundle": "bundle"},
+                options={"skip": ignored or skip_naming_convention_test, "skip_warnings": skip_warnings}
+            ),
+            ScheduledCheck(
+                "consistency", check_consistency,
+                inputs={"bundle": "bundle"},
+                options={"skip": ignored or skip_consistency_test, "skip_warnings": skip_warnings}
+            ),
+            ScheduledCheck(
+                "board_configuration", check_board_configuration,
+                inputs={"frbs": "frbs", "descriptor": "descriptor"},
+                options={"skip": skip_board_configuration_test or no_frbs, "skip_warnings": skip_warnings}
+            ),
+            ScheduledCheck(
+                "max_paths", check_max_paths_for_boards,
+                inputs={"frbs": "frbs", "filenames": "filenames"},
+                options={
+                    "skip": skip_max_paths_test or no_frbs,
+                    "skip_warnings": skip_warnings,
+                    "time_budget": max_paths_time_budget
+                },
+                cpu_bound=True
+            ),
+            ScheduledCheck(
+                "structure", check_board_structure,
+                inputs={"frbs": "frbs", "filenames": "filenames"},
+                options={"skip": skip_board_structure_test or no_frbs, "skip_warnings": skip_warnings}
+            ),
+            ScheduledCheck(
+                "icon", check_icon,
+                inputs={"bundle": "bundle"},
+                options={"skip": ignored or skip_icon_test, "skip_warnings": skip_warnings}
+            ),
+            ScheduledCheck(
+                "music_download", check_music_download,
+                inputs={"descriptor": "descriptor"},
+                options={
+                    "gdrive_api_key": gdrive_api_key,
+                    "skip": ignored or skip_music_download_test,
+                    "skip_warnings": skip_warnings
+                }
+            ),
+            ScheduledCheck(
+                "screenshots", check_for_screenshots,
+                inputs={"bundle": "bundle"},
+                options={"skip": ignored or skip_screenshots_test, "skip_warnings": skip_warnings}
+            ),
+            ScheduledCheck(
+                "venture", check_venture_cards,
+                inputs={"bundle": "bundle"},
+                options={"skip": ignored or skip_venture_cards_test, "skip_warnings": skip_warnings}
+            ),
+        ]
+
+    # every bundle's checks are started up front, so that independent
+    # checks run side by side: I/O-bound ones on threads, and the max
+    # paths search on processes, unless the platform cannot start them.
+    # The results are then collected bundle by bundle, in order. When
+    # profiling, nothing runs side by side, so that each check's
+    # measurements are its own.
+    profile = profile or bool(profile_dir)
+    processes = None
+    threads = None
+    if not profile:
+        if not skip_max_paths_test:
+            try:
+                processes = ProcessPoolExecutor(max_workers=workers)
+            except (NotImplementedError, OSError):
+                processes = None
+        threads = ThreadPoolExecutor()
+
+    # everything that changes what the checks report goes into the
+    # cache key; workers only changes how fast they report it
+    cache_options = {
+        "gdrive_api_key": bool(gdrive_api_key),
+        "max_paths_time_budget": max_paths_time_budget,
+        "skip_board_configuration_test": skip_board_configuration_test,
+        "skip_board_structure_test": skip_board_structure_test,
+        "skip_consistency_test": skip_consistency_test,
+        "skip_icon_test": skip_icon_test,
+        "skip_max_paths_test": skip_max_paths_test,
+        "skip_music_download_test": skip_music_download_test,
+        "skip_naming_convention_test": skip_naming_convention_test,
+        "skip_screenshots_test": skip_screenshots_test,
+        "skip_venture_cards_test": skip_venture_cards_test,
+        "skip_warnings": skip_warnings,
+    }
+
+    scheduled = []
+    try:
+        for b in bundles:
+            checks = get_checks(b)
+
+            # on a cache hit, the stored results stand in for the checks
+            # that were cached, and the rest run as usual
+            key = get_validation_cache_key(b, cache_options) if cache else ""
+            cached_results = read_cached_results(key, cache_dir)
+            hit = cached_results is not None and all(
+                c.name in cached_results for c in checks if c.name not in uncached_checks
             )
-            board_result.consistency = check_consistency(
-                bundle=b,
-                skip=skip_consistency_test,
-                skip_warnings=skip_warnings
+            if hit:
+                checks = [
+                    c if c.name in uncached_checks else ScheduledCheck(
+                        c.name, replay_cached_result,
+                        options={"result": cached_results[c.name]}
+                    )
+                    for c in checks
+                ]
+
+            inputs = {
+                "bundle": b,
+                "descriptor": b.descriptor,
+                "filenames": b.filenames.frb,
+                "frbs": b.frbs,
+            }
+            futures = submit_checks(
+                checks, inputs, threads, processes,
+                trace_memory=profile,
+                profile_dir=profile_dir,
+                board_name=b.name.en
             )
-
-            if len(b.frbs) == 0:
-                board_result.board_configuration = check_board_configuration(frb="", skip=True)
-                board_result.max_paths = check_max_paths(frb="", skip=True)
-                board_result.paths = 0
-            else:
-                board_result.board_configuration = check_board_configuration(
-                    frbs=b.frbs,
-                    descriptor=b.descriptor,
-                    skip=skip_board_configuration_test,
-                    skip_warnings=skip_warnings
+            scheduled.append((key if not hit else "", checks, futures))
+
+        for b, (key, checks, futures) in zip(bundles, scheduled):
+            # each board gets a context of its own, so that its counts
+            # are never mixed up with those of another run
+            with use_context():
+                board_result = ValidationResult()
+                board_result.board_name = b.name.en
+
+                check_results = collect_checks(checks, futures)
+                for name, result in check_results.items():
+                    setattr(board_result, name, result)
+                board_result.paths = int(board_result.max_paths.data or 0)
+
+                # go ahead and process yaml validation results as
+                # those get generated elsewhere, on load
+                board_result.yaml = b.descriptor.yaml_validation_results
+                process_log_messages(
+                    errors=board_result.yaml.error_messages,
+                    warnings=board_result.yaml.warning_messages
                 )
-                board_result.max_paths = check_max_paths(
-                    frb=b.frbs[0],
-                    skip=skip_max_paths_test,
-                    skip_warnings=skip_warnings
-                )
-                board_result.paths = int(board_result.max_paths.data)
-
-            board_result.icon = check_icon(
-                bundle=b,
-                skip=skip_icon_test,
-                skip_warnings=skip_warnings
-            )
 
-            board_result.music_download = check_music_download(
-                descriptor=b.descriptor,
-                gdrive_api_key=gdrive_api_key,
-                skip=skip_music_download_test,
-                skip_warnings=skip_warnings
-            )
-
-            board_result.screenshots = check_for_screenshots(
-                bundle=b,
-                skip=skip_screenshots_test,
-                skip_warnings=skip_warnings
-            )
+                tally_board_result(board_result)
+                add_board_result(result_bundle, board_result)
+                write_cached_results(key, check_results, cache_dir)
+    finally:
+        if threads is not None:
+            threads.shutdown(cancel_futures=True)
+        if processes is not None:
+            processes.shutdown(cancel_futures=True)
 
-            board_result.venture = check_venture_cards(
-                bundle=b,
-                skip=skip_venture_cards_test,
-                skip_warnings=skip_warnings
-            )
-
-        # go ahead and process yaml validation results as
-        # those get generated elsewhere, on load
-        board_result.yaml = b.descriptor.yaml_validation_results
-        process_log_messages(errors=board_result.yaml.error_messages)
-
-        errors = get_count(IssueType.ERRORS)
-        successes = get_count(IssueType.SUCCESS)
-        warnings = get_count(IssueType.WARNINGS)
-        issues = errors + warnings
-        total = issues + successes
-
-        board_result.error_count = errors
-        board_result.success_count = successes
-        board_result.warning_count = warnings
-        board_result.issue_count = issues
-        board_result.total_count = total
-        board_result.error_messages = get_text(IssueType.ERRORS)
-        board_result.warning_messages = get_text(IssueType.WARNINGS)
-        board_result.informational_messages = get_text(IssueType.SUCCESS)
-
-        r.append(board_result)
-
-    result_bundle.boards = r
-
-    error_count = 0
-    warning_count = 0
-    issue_count = 0
-    success_count = 0
-    total_count = 0
-    error_messages = []
-    informational_messages = []
-    warning_messages = []
-
-    for m in result_bundle.boards:
-        error_count += m.error_count
-        warning_count += m.warning_count
-        issue_count += m.issue_count
-        success_count += m.success_count
-        total_count += m.total_count
-        informational_messages.extend(m.informational_messages)
-        error_messages.extend(m.error_messages)
-        warning_messages.extend(m.warning_messages)
-
-    result_bundle.error_count = error_count
-    result_bundle.issue_count = issue_count
-    result_bundle.success_count = success_count
-    result_bundle.total_count = total_count
-    result_bundle.warning_count = warning_count
-
-    result_bundle.error_messages = error_messages.copy()
-    result_bundle.informational_messages = informational_messages.copy()
-    result_bundle.warning_messages = warning_messages.copy()
-
-    reset_errors_and_warnings()
     return result_bundle
 
 
 def validate_board_file(
     frbs: list[BoardFile],
     skip_board_configuration_tests=False,
+    skip_board_structure_test=True,
     skip_max_paths_test=False,
+    max_paths_time_budget=None,
+    workers=None,
 ) -> ValidationResultBundle:
     """
     The entry-point for validating Fortune Avenue-compatible .frb files.
@@ -248,81 +408,66 @@ def validate_board_file(
         Configuration checks will be skipped. Defaults to False.
     :type skip_board_configuration_tests: bool, optional
 
+    :param skip_board_structure_test: If set to True, the Board Structure
+        Check will be skipped. Defaults to True, as the check does not
+        yet follow Back Street warps or Cannons, and would warn about
+        squares that can only be reached through them.
+    :type skip_board_structure_test: bool, optional
+
     :param skip_max_paths_test: If set to True, the Max Paths Check will
         be skipped. Defaults to False.
     :type skip_max_paths_test: bool, optional
 
+    :param max_paths_time_budget: The most wall-clock time, in seconds,
+        that the Max Paths Check may spend on each board. Defaults to
+        None, which means no budget.
+    :type max_paths_time_budget: float, optional
+
+    :param workers: The number of processes the Max Paths Check may
+        use, to search several boards side by side. Defaults to None,
+        which runs everything in this process.
+    :type workers: int, optional
+
     :return: A bundle containing the overall results, as well as a list
         containing objects that represent each of the individual results.
     :rtype: ValidationResultBundle
     """
     result_bundle = ValidationResultBundle()
 
-    r = []
-    for f in frbs:
-        reset_errors_and_warnings()
-        board_result = ValidationResult()
-        board_result.board_name = "Unknown .frb"
-
-        board_result.board_configuration = check_board_configuration(
-            frb=f,
-            skip=skip_board_configuration_tests
+    max_paths_results = [None] * len(frbs)
+    if not skip_max_paths_test:
+        max_paths_results = search_max_paths_for_boards(
+            frbs=frbs,
+            time_budget=max_paths_time_budget,
+            workers=workers
         )
-        board_result.max_paths = check_max_paths(
-            frb=f,
-            skip=skip_max_paths_test
-        )
-        board_result.paths = int(board_result.max_paths.data)
-
-        errors = get_count(IssueType.ERRORS)
-        successes = get_count(IssueType.SUCCESS)
-        warnings = get_count(IssueType.WARNINGS)
-        issues = errors + warnings
-        total = issues + successes
-
-        board_result.error_count = errors
-        board_result.success_count = successes
-        board_result.warning_count = warnings
-        board_result.issue_count = issues
-        board_result.total_count = total
-        board_result.error_messages = get_text(IssueType.ERRORS)
-        board_result.warning_messages = get_text(IssueType.WARNINGS)
-        board_result.informational_messages = get_text(IssueType.SUCCESS)
-
-        r.append(board_result)
-
-    result_bundle.boards = r
-
-    error_count = 0
-    warning_count = 0
-    issue_count = 0
-    success_count = 0
-    total_count = 0
-    error_messages = []
-    informational_messages = []
-    warning_messages = []
-
-    for m in result_bundle.boards:
-        error_count += m.error_count
-        warning_count += m.warning_count
-        issue_count += m.issue_count
-        success_count += m.success_count
-        total_count += m.total_count
-        informational_messages.extend(m.informational_messages)
-        error_messages.extend(m.error_messages)
-        warning_messages.extend(m.warning_messages)
-
-    result_bundle.error_count = error_count
-    result_bundle.issue_count = issue_count
-    result_bundle.success_count = success_count
-    result_bundle.total_count = total_count
-    result_bundle.warning_count = warning_count
-
-    result_bundle.error_messages = error_messages.copy()
-    result_bundle.informational_messages = informational_messages.copy()
-    result_bundle.warning_messages = warning_messages.copy()
-
-    reset_errors_and_warnings()
+
+    for f, paths in zip(frbs, max_paths_results):
+        # each board gets a context of its own, so that its counts
+        # are never mixed up with those of another run
+        with use_context():
+            board_result = ValidationResult()
+            board_result.board_name = "Unknown .frb"
+
+            board_result.board_configuration = run_timed(check_board_configuration, {
+                "frbs": [f],
+                "skip": skip_board_configuration_tests
+            })
+            board_result.max_paths = run_timed(check_max_paths, {
+                "frb": f,
+                "skip": skip_max_paths_test,
+                "time_budget": max_paths_time_budget,
+                "paths": paths
+            })
+            board_result.paths = int(board_result.max_paths.data or 0)
+            board_result.structure = run_timed(check_board_structure, {
+                "frbs": [f],
+                "skip": skip_board_structure_test
+            })
+
+            tally_board_result(board_result)
+            add_board_result(result_bundle, board_result)
+
     return result_bundle
 
 
@@ -353,70 +498,112 @@ def validate_descriptor(
     """
     result_bundle = ValidationResultBundle()
 
-    r = []
     for d in descriptors:
-        reset_errors_and_warnings()
-        board_result = ValidationResult()
-        board_result.board_name = d.name.en
-
-        board_result.music_download = check_music_download(
-            descriptor=d,
-            skip=skip_music_download_test,
-            gdrive_api_key=gdrive_api_key
-        )
+        # each board gets a context of its own, so that its counts
+        # are never mixed up with those of another run
+        with use_context():
+            board_result = ValidationResult()
+            board_result.board_name = d.name.en
+
+            board_result.music_download = run_timed(check_music_download, {
+                "descriptor": d,
+                "skip": skip_music_download_test,
+                "gdrive_api_key": gdrive_api_key
+            })
+
+            # go ahead and process yaml validation results as
+            # those get generated elsewhere, on load
+            board_result.yaml = d.yaml_validation_results
+            process_log_messages(
+                errors=board_result.yaml.error_messages,
+                warnings=board_result.yaml.warning_messages
+            )
+
+            tally_board_result(board_result)
+            add_board_result(result_bundle, board_result)
 
-        # go ahead and process yaml validation results as
-        # those get generated elsewhere, on load
-        board_result.yaml = d.yaml_validation_results
-        process_log_messages(errors=board_result.yaml.error_messages)
-
-        errors = get_count(IssueType.ERRORS)
-        successes = get_count(IssueType.SUCCESS)
-        warnings = get_count(IssueType.WARNINGS)
-        issues = errors + warnings
-        total = issues + successes
-
-        board_result.error_count = errors
-        board_result.success_count = successes
-        board_result.warning_count = warnings
-        board_result.issue_count = issues
-        board_result.total_count = total
-        board_result.error_messages = get_text(IssueType.ERRORS)
-        board_result.warning_messages = get_text(IssueType.WARNINGS)
-        board_result.informational_messages = get_text(IssueType.SUCCESS)
-
-        r.append(board_result)
-
-    result_bundle.boards = r
-
-    error_count = 0
-    warning_count = 0
-    issue_count = 0
-    success_count = 0
-    total_count = 0
-    error_messages = []
-    informational_messages = []
-    warning_messages = []
-
-    for m in result_bundle.boards:
-        error_count += m.error_count
-        warning_count += m.warning_count
-        issue_count += m.issue_count
-        success_count += m.success_count
-        total_count += m.total_count
-        informational_messages.extend(m.informational_messages)
-        error_messages.extend(m.error_messages)
-        warning_messages.extend(m.warning_messages)
-
-    result_bundle.error_count = error_count
-    result_bundle.issue_count = issue_count
-    result_bundle.success_count = success_count
-    result_bundle.total_count = total_count
-    result_bundle.warning_count = warning_count
-
-    result_bundle.error_messages = error_messages.copy()
-    result_bundle.informational_messages = informational_messages.copy()
-    result_bundle.warning_messages = warning_messages.copy()
-
-    reset_errors_and_warnings()
     return result_bundle
+
+
+def load_and_validate_bundles(source: Bundle | str, options: dict) -> list[ValidationResult]:
+    """
+    Loads the bundles from a .zip file or a directory, if given a path,
+    and validates them. This is the unit of work validate_bundles_parallel
+    sends to each worker process.
+
+    :param source: A Bundle, or the path to a .zip file or a directory
+        holding one or more bundles.
+    :type source: Bundle | str
+
+    :param options: Keyword arguments for validate_bundle.
+    :type options: dict
+
+    :return: The results for each board loaded from the source.
+    :rtype: list[ValidationResult]
+    """
+    if isinstance(source, Bundle):
+        bundles = [source]
+    elif os.path.isdir(source):
+        bundles = read_files(get_files_recursively(source))
+    else:
+        # every worker extracts into a directory of its own, which
+        # read_zip creates and removes again
+        with tempfile.TemporaryDirectory() as temp_dir:
+            bundles = read_zip(source, temp_dir_path=os.path.join(temp_dir, "bundle"))
+    bundles = [b for b in bundles if isinstance(b, Bundle)]
+    return validate_bundle(bundles, **options).boards
+
+
+def validate_bundles_parallel(
+    bundles_or_paths: list[Bundle | str],
+    workers: int = None,
+    results: ValidationResultBundle = None,
+    **options
+) -> Iterator[ValidationResult]:
+    """
+    Validates many bundles in worker processes, yielding each board's
+    ValidationResult as soon as it is ready, so that large runs can
+    report as they go. Paths are loaded by the workers too, so loading
+    is spread across them as well.
+
+    :param bundles_or_paths: Bundles, or paths to .zip files or
+        directories holding bundles, or a mix of both.
+    :type bundles_or_paths: list[Bundle | str]
+
+    :param workers: The number of processes to use. Defaults to None,
+        which validates everything in this process, one bundle at a
+        time.
+    :type workers: int, optional
+
+    :param results: A ValidationResultBundle to add each result to, and
+        its counts to the totals of, as it is yielded. Defaults to None.
+    :type results: ValidationResultBundle, optional
+
+    :param options: Any other keyword arguments for validate_bundle,
+        such as skip_music_download_test or max_paths_time_budget.
+
+    :return: Each board's result, in the order they finish.
+    :rtype: Iterator[ValidationResult]
+    """
+    if workers is None or workers <= 1:
+        for source in bundles_or_paths:
+            for board_result in load_and_validate_bundles(source, options):
+                if results is not None:
+                    add_board_result(results, board_result)
+                yield board_result
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(load_and_validate_bundles, source, options)
+            for source in bundles_or_paths
+        ]
+        try:
+            for future in as_completed(futures):
+                for board_result in future.result():
+                    if results is not None:
+                        add_board_result(results, board_result)
+                    yield board_result
+        finally:
+            for future in futures:
+                future.cancel()
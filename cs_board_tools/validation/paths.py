@@ -1,6 +1,32 @@
 """These tests check Paths counts to ensure things will work
 and be compatible once the board has been added into the game.
 """
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures import wait
+from dataclasses import replace
+from typing import Iterator
+
+from cs_board_tools.analysis.paths import (
+    build_transition_matrix,
+    calculate_max_paths_matrix,
+    count_paths_for_all_states
+)
+from cs_board_tools.queries.frb.graph import (
+    BoardGraph,
+    build_transitions,
+    get_board_graph,
+    get_destinations
+)
+from cs_board_tools.schema.analysis import (
+    MaxPathsBreakdown,
+    MaxPathsCount,
+    PathsHeatmap
+)
 from cs_board_tools.schema.frb import BoardFile, Square
 from cs_board_tools.schema.validation import CheckResult
 from cs_board_tools.validation.results import build_results_object
@@ -9,45 +35,109 @@ max_paths_warning = (
     "The Max Paths value of {max_paths} is higher than {limit}."
 )
 
+max_paths_timeout_warning = (
+    "The Max Paths search ran out of time after {time_budget} seconds, "
+    "so its value of {max_paths} is only a lower bound."
+)
 
-def get_destinations(
-    squares: list[Square],
-    prev_square_id: int,
-    square_id: int
-) -> list[int]:
-    """
-    Looks at a Square's waypoints and returns a list of possible
-    destinations for a given Entry ID.
+max_paths_file_warning = "{filename}: {warning}"
 
-    :param squares: A list of Square objects to test.
-    :type squares: list[Square]
+unknown_engine_error = (
+    "Unknown Max Paths engine \"{engine}\". Expected one of: {engines}."
+)
 
-    :param prev_square_id: The ID of the Previous Square, the
-        one you previously walked over in-game. The one you have
-        your back to.
+max_paths_engines = ["dp", "matrix"]
+
+# boards above the threshold get a warning; the limit keeps pathological
+# boards from being counted forever
+max_paths_threshold = 100
+max_paths_limit = 1000
+
+# the lower edge of each bin in a PathsHeatmap's histogram
+heatmap_histogram_bins = [0, 1, 10, 50, 100, 250, 500, 1000]
+
+# results of recent searches, keyed by get_max_paths_cache_key
+max_paths_cache = OrderedDict()
+max_paths_cache_lock = threading.Lock()
+max_paths_cache_size = 256
+
+
+def count_paths(
+    transitions: dict[tuple[int, int], tuple[int]],
+    prev_square_id: int,
+    square_id: int,
+    dice: int,
+    memo: dict,
+    limit: int = None,
+    deadline: float = None
+) -> int:
+    """
+    Counts the paths of length dice that start on square_id, having
+    arrived from prev_square_id. Counts for every (prev_square_id,
+    square_id, dice) state are stored in memo, so no state is ever
+    counted twice; passing the same memo in for several squares on the
+    same board shares that work between them.
+
+    If a limit is given, counting stops as soon as it is reached, and
+    the count returned is min(paths, limit). A memo holds counts for
+    one limit only, so never share one between different limits.
+
+    If a deadline is given, it is checked before each new state is
+    counted, so a single square can never run far past it. Only
+    finished states are stored in memo, so it can still be reused
+    after a timeout.
+
+    :param transitions: The board's transition table, as returned by
+        build_transitions.
+    :type transitions: dict[tuple[int, int], tuple[int]]
+
+    :param prev_square_id: The ID of the Previous Square, or 255 if
+        there isn't one.
     :type prev_square_id: int
 
     :param square_id: The ID of the Square for which to get the
         paths count.
     :type square_id: int
 
-    :return: Returns a list of Square IDs as Destinations.
-    :rtype: list[int]
+    :param dice: The search depth.
+    :type dice: int
+
+    :param memo: A dictionary holding already-counted states.
+    :type memo: dict
+
+    :param limit: The count at which to stop counting, or None to
+        count every path. Defaults to None.
+    :type limit: int, optional
+
+    :param deadline: A time.monotonic() value after which to give up.
+        Defaults to None, which means no deadline.
+    :type deadline: float, optional
+
+    :raises TimeoutError: If the deadline passes before counting ends.
+
+    :return: Returns the number of paths from that square.
+    :rtype: int
     """
-    destinations = []
+    if dice == 0:
+        return 1
 
-    if not (square_id < len(squares) or square_id == 255):
-        return
-    if not (prev_square_id < len(squares) or prev_square_id == 255):
-        return
+    key = (prev_square_id, square_id, dice)
+    count = memo.get(key)
+    if count is not None:
+        return count
 
-    square = squares[square_id]
-    for w in square.waypoints:
-        for d in w.destinations:
-            if w.entryId == prev_square_id or prev_square_id == 255:
-                if d != 255:
-                    destinations.append(d)
-    return list(set(destinations))
+    if deadline is not None and time.monotonic() > deadline:
+        raise TimeoutError
+
+    count = 0
+    for d in transitions.get((prev_square_id, square_id), ()):
+        count += count_paths(transitions, square_id, d, dice - 1, memo, limit, deadline)
+        if limit is not None and count >= limit:
+            count = limit
+            break
+
+    memo[key] = count
+    return count
 
 
 def get_paths_count(
@@ -77,32 +167,21 @@ def get_paths_count(
     :type dice: int
 
     :param limit: An upper limit of Max Paths to prevent computer
-        slowdown.
+        slowdown. Counting stops once it is reached, and the limit
+        itself is returned. None counts every path.
     :type limit: int
 
     :return: Returns the number of paths from that square.
     :rtype: int
     """
-    count = 0
-    if dice == 0:
-        count += 1
-        return count
-
-    destinations = get_destinations(
-        squares=squares,
+    return count_paths(
+        transitions=build_transitions(squares),
         prev_square_id=prev_square_id,
         square_id=square_id,
+        dice=dice,
+        memo={},
+        limit=limit,
     )
-    for d in destinations:
-        if d < len(squares):
-            count += get_paths_count(
-                squares=squares,
-                prev_square_id=square_id,
-                square_id=d,
-                dice=(dice - 1),
-                limit=limit,
-            )
-    return count
 
 
 def get_paths_count_without_prev_square(
@@ -127,7 +206,8 @@ def get_paths_count_without_prev_square(
     :type dice: int
 
     :param limit: An upper limit of Max Paths to prevent computer
-        slowdown.
+        slowdown. Counting stops once it is reached, and the limit
+        itself is returned. None counts every path.
     :type limit: int
 
     :return: Returns the number of paths from that square.
@@ -144,14 +224,323 @@ def get_paths_count_without_prev_square(
     return paths_count
 
 
+def count_paths_for_squares(
+    transitions: dict[tuple[int, int], tuple[int]],
+    square_ids: list[int],
+    dice: int,
+    limit: int = None,
+    deadline: float = None
+) -> list[int]:
+    """
+    Counts the paths from each of the given start squares, sharing one
+    memo between them. This is the unit of work handed to each process
+    when the Max Paths search runs in a pool.
+
+    :param transitions: The board's transition table.
+    :type transitions: dict[tuple[int, int], tuple[int]]
+
+    :param square_ids: The IDs of the start squares to count.
+    :type square_ids: list[int]
+
+    :param dice: The search depth.
+    :type dice: int
+
+    :param limit: The count at which to stop counting, or None to
+        count every path. Defaults to None.
+    :type limit: int, optional
+
+    :param deadline: A time.monotonic() value after which to give up.
+        Defaults to None, which means no deadline.
+    :type deadline: float, optional
+
+    :raises TimeoutError: If the deadline passes before counting ends.
+
+    :return: The paths count for each square, in the order given.
+    :rtype: list[int]
+    """
+    memo = {}
+    return [
+        count_paths(transitions, 255, square_id, dice, memo, limit, deadline)
+        for square_id in square_ids
+    ]
+
+
+def count_start_squares(
+    transitions: dict[tuple[int, int], tuple[int]],
+    square_count: int,
+    dice: int,
+    limit: int = None,
+    deadline: float = None
+) -> Iterator[int]:
+    """
+    Yields the paths count from each start square in turn, counting
+    each one only when it is asked for. Raises TimeoutError if the
+    deadline passes while counting a square.
+    """
+    memo = {}
+    for square_id in range(square_count):
+        yield count_paths(transitions, 255, square_id, dice, memo, limit, deadline)
+
+
+def count_start_squares_in_pool(
+    pool: ProcessPoolExecutor,
+    transitions: dict[tuple[int, int], tuple[int]],
+    square_count: int,
+    dice: int,
+    limit: int,
+    workers: int,
+    deadline: float = None
+) -> Iterator[int]:
+    """
+    Yields the paths count from each start square in square order,
+    having split the squares into contiguous chunks that are counted
+    in parallel by the pool. Raises TimeoutError or
+    concurrent.futures.TimeoutError if the deadline passes while a chunk
+    is being counted, or while waiting on one.
+
+    However the generator stops, whether it runs out, raises, or is
+    closed early, chunks that have not started are cancelled and those
+    that have are waited on, so no work is left running in the pool.
+    Running chunks check the deadline themselves, so after a timeout
+    that wait is short.
+    """
+    # every chunk has its own memo, and on a well-connected board each
+    # memo ends up holding most of the board's states, so use as few
+    # chunks as possible
+    chunk_size = max(1, -(-square_count // workers))
+    futures = [
+        pool.submit(
+            count_paths_for_squares,
+            transitions,
+            list(range(start, min(start + chunk_size, square_count))),
+            dice,
+            limit,
+            deadline,
+        )
+        for start in range(0, square_count, chunk_size)
+    ]
+    try:
+        for future in futures:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            yield from future.result(timeout=timeout)
+    finally:
+        for future in futures:
+            future.cancel()
+        wait(futures)
+
+
+def find_max_paths(
+    squares: list[Square],
+    dice: int,
+    limit: int = None,
+    engine: str = "dp",
+    stop_at: int = None,
+    time_budget: float = None,
+    graph: BoardGraph = None,
+    workers: int = None,
+    executor: ProcessPoolExecutor = None
+) -> MaxPathsCount:
+    """
+    Searches every square for the one with the most paths.
+
+    Three things can cut the search short, and each one leaves the
+    count as a lower bound rather than an exact value:
+
+    * limit: no square's count goes past the limit. Once a square
+      reaches it, that square stops being counted.
+    * stop_at: once any square's count goes past stop_at, the rest of
+      the board is not searched, as the board is already known to be
+      over it.
+    * time_budget: once the search has run for this many seconds, it
+      stops where it is and reports the best count found so far.
+
+    :param squares: A list of Square objects to test.
+    :type squares: list[Square]
+
+    :param dice: The Maximum Dice Roll value of the board, which
+        is used as the search depth in the calculation.
+    :type dice: int
+
+    :param limit: The highest count to search for, or None to count
+        every path. Defaults to None.
+    :type limit: int, optional
+
+    :param engine: "dp" to count with the memoised search, or "matrix"
+        to count every square at once with the NumPy engine in
+        cs_board_tools.analysis.paths. Defaults to "dp".
+    :type engine: str, optional
+
+    :param stop_at: A count which, once exceeded by any square, stops
+        the search. Only the "dp" engine searches square by square, so
+        the "matrix" engine ignores it. Defaults to None.
+    :type stop_at: int, optional
+
+    :param time_budget: The most wall-clock time, in seconds, that the
+        search may take. Defaults to None, which means no budget.
+    :type time_budget: float, optional
+
+    :param graph: The board's BoardGraph, if it has already been built.
+        Defaults to None, which builds one from squares.
+    :type graph: BoardGraph, optional
+
+    :param workers: If set above 1, the start squares are split between
+        this many processes. The result is the same as searching them
+        one by one. Each process counts with its own memo, so this only
+        pays off on large boards whose squares share few states. The
+        "matrix" engine already counts every square at once, so it
+        ignores this. Defaults to None.
+    :type workers: int, optional
+
+    :param executor: A process pool, owned by the caller, to split the
+        start squares between instead of starting one for this search.
+        It is left running, so callers searching many boards can share
+        one pool between them. The squares are split into workers
+        chunks, or one per CPU if workers is not set. Defaults to None.
+    :type executor: ProcessPoolExecutor, optional
+
+    :return: The square with the most paths and its count.
+    :rtype: MaxPathsCount
+    """
+    if engine not in max_paths_engines:
+        raise ValueError(unknown_engine_error.format(
+            engine=engine, engines=", ".join(max_paths_engines)
+        ))
+    started = time.monotonic()
+    if graph is None:
+        graph = BoardGraph(squares)
+
+    if engine == "matrix":
+        return calculate_max_paths_matrix(
+            squares=squares, dice=dice, limit=limit, time_budget=time_budget, graph=graph
+        )
+
+    deadline = None if time_budget is None else started + time_budget
+    pool = None
+    if executor is not None and len(squares) > 1:
+        counts = count_start_squares_in_pool(
+            executor, graph.transitions, len(squares), dice, limit,
+            workers or os.cpu_count() or 1, deadline
+        )
+    elif workers is not None and workers > 1 and len(squares) > 1:
+        pool = ProcessPoolExecutor(max_workers=workers)
+        counts = count_start_squares_in_pool(
+            pool, graph.transitions, len(squares), dice, limit, workers, deadline
+        )
+    else:
+        counts = count_start_squares(graph.transitions, len(squares), dice, limit, deadline)
+
+    # counts arrive in square order however they were computed, so the
+    # result is the same with or without a pool
+    result = MaxPathsCount()
+    try:
+        for i in range(len(squares)):
+            if deadline is not None and time.monotonic() > deadline:
+                result.timed_out = True
+                break
+            if stop_at is not None and result.count > stop_at:
+                result.stopped_early = True
+                break
+
+            try:
+                paths_count = next(counts)
+            except (TimeoutError, FutureTimeoutError):
+                result.timed_out = True
+                break
+            if paths_count > result.count:
+                result.count = paths_count
+                result.square_id = i
+    finally:
+        # stops any chunks still queued or running in the pool, so that
+        # nothing is left using the CPU once the search has returned
+        counts.close()
+        if pool is not None:
+            pool.shutdown()
+
+    result.saturated = limit is not None and result.count >= limit
+    return result
+
+
+def calculate_paths_heatmap(
+    squares: list[Square],
+    dice: int,
+    limit: int = None,
+    engine: str = "dp",
+    graph: BoardGraph = None
+) -> PathsHeatmap:
+    """
+    Counts the paths from every square, and from every way of arriving
+    on each square, in a single pass, rather than keeping only the
+    highest count the way find_max_paths does. This finds the hotspots
+    behind a high Max Paths value without searching again square by
+    square.
+
+    :param squares: A list of Square objects to test.
+    :type squares: list[Square]
+
+    :param dice: The search depth.
+    :type dice: int
+
+    :param limit: The count at which to saturate, or None to count
+        every path. Defaults to None.
+    :type limit: int, optional
+
+    :param engine: "dp" or "matrix"; see find_max_paths. Defaults to
+        "dp".
+    :type engine: str, optional
+
+    :param graph: The board's BoardGraph, if it has already been built.
+        Defaults to None, which builds one from squares.
+    :type graph: BoardGraph, optional
+
+    :return: The counts for every square and entry direction, and a
+        histogram of the squares' counts.
+    :rtype: PathsHeatmap
+    """
+    if engine not in max_paths_engines:
+        raise ValueError(unknown_engine_error.format(
+            engine=engine, engines=", ".join(max_paths_engines)
+        ))
+    if graph is None:
+        graph = BoardGraph(squares)
+
+    if engine == "matrix":
+        matrix = build_transition_matrix(squares, graph=graph)
+        counts = [int(c) for c in count_paths_for_all_states(matrix, dice, limit=limit)]
+        states = matrix.states
+    else:
+        memo = {}
+        states = graph.states
+        counts = [
+            count_paths(graph.transitions, prev_square_id, square_id, dice, memo, limit)
+            for prev_square_id, square_id in states
+        ]
+
+    heatmap = PathsHeatmap(dice=dice, limit=limit)
+    heatmap.square_counts = counts[:graph.square_count]
+    heatmap.entry_counts = dict(zip(states[graph.square_count:], counts[graph.square_count:]))
+
+    edges = [b for b in heatmap_histogram_bins if limit is None or b <= limit]
+    for low, high in zip(edges, edges[1:] + [None]):
+        heatmap.histogram.append((low, high, sum(
+            1 for c in heatmap.square_counts if c >= low and (high is None or c < high)
+        )))
+    return heatmap
+
+
 def calculate_max_paths(
     squares: list[Square],
     dice: int,
-    limit: int
+    limit: int,
+    engine: str = "dp"
 ) -> [int, int]:
     """
     Calculates the Max Paths value for all squares.
 
+    The transition table is built once, and every square shares one
+    table of counted states, so the whole board costs at most one
+    count per (prev_square_id, square_id, dice) state instead of one
+    walk per path.
+
     :param squares: A list of Square objects to test.
     :type squares: list[Square]
 
@@ -160,28 +549,308 @@ def calculate_max_paths(
     :type dice: int
 
     :param limit: An upper limit of Max Paths to prevent computer
-        slowdown.
+        slowdown. No square is counted past it, so a result equal to
+        the limit means "at least the limit". None counts every path.
     :type limit: int
 
+    :param engine: "dp" to count with the memoised search, or "matrix"
+        to count every square at once with the NumPy engine in
+        cs_board_tools.analysis.paths. Defaults to "dp".
+    :type engine: str, optional
+
     :return: Returns a tuple with the square ID with the maximum
         max paths count, and the max paths count itself.
     :rtype: [int, int]
     """
-    max_paths_count = 0
-    square_id_with_max_paths_count = 255
-    for i in range(len(squares)):
-        paths_count = get_paths_count_without_prev_square(
-            squares=squares, square_id=i, dice=dice, limit=limit
+    result = find_max_paths(squares=squares, dice=dice, limit=limit, engine=engine)
+    return [result.square_id, result.count]
+
+
+def get_search_depth(frb: BoardFile) -> int:
+    """
+    Returns the depth to which the Max Paths check searches a board: a
+    third of its square count, and never less than 16.
+
+    :param frb: A BoardFile object representing an .frb file.
+    :type frb: BoardFile
+
+    :return: The search depth.
+    :rtype: int
+    """
+    search_depth = int(len(frb._board_data.squares) / 3)
+
+    if search_depth < 16:
+        search_depth = 16
+    return search_depth
+
+
+def get_max_paths_cache_key(
+    frb: BoardFile,
+    skip_warnings: bool = False,
+    engine: str = "dp",
+    limit: int = max_paths_limit
+) -> tuple:
+    """
+    Returns the key under which a board's Max Paths result is cached.
+    Boards whose waypoints allow exactly the same moves share a key, so
+    identical .frb files, such as districts copied from one another,
+    are only searched once.
+
+    See check_max_paths for the parameters.
+
+    :return: The cache key.
+    :rtype: tuple
+    """
+    stop_at = None if skip_warnings else max_paths_threshold
+    return (get_board_graph(frb).fingerprint, get_search_depth(frb), engine, limit, stop_at)
+
+
+def get_cached_max_paths(key: tuple) -> MaxPathsCount:
+    """
+    Returns a copy of the cached Max Paths result for a key from
+    get_max_paths_cache_key, or None if there isn't one.
+    """
+    with max_paths_cache_lock:
+        result = max_paths_cache.get(key)
+        if result is None:
+            return None
+        max_paths_cache.move_to_end(key)
+    return replace(result)
+
+
+def cache_max_paths(key: tuple, result: MaxPathsCount):
+    """
+    Caches a Max Paths result under a key from get_max_paths_cache_key.
+    Results from searches that ran out of time are not cached, since a
+    later search with more time would find more.
+    """
+    if result.timed_out:
+        return
+    with max_paths_cache_lock:
+        max_paths_cache[key] = replace(result)
+        max_paths_cache.move_to_end(key)
+        while len(max_paths_cache) > max_paths_cache_size:
+            max_paths_cache.popitem(last=False)
+
+
+def clear_max_paths_cache():
+    """
+    Empties the Max Paths result cache.
+    """
+    with max_paths_cache_lock:
+        max_paths_cache.clear()
+
+
+def search_max_paths(
+    frb: BoardFile,
+    skip_warnings: bool = False,
+    engine: str = "dp",
+    limit: int = max_paths_limit,
+    time_budget: float = None,
+    workers: int = None,
+    executor: ProcessPoolExecutor = None
+) -> MaxPathsCount:
+    """
+    Runs the Max Paths search for a board the way check_max_paths does,
+    without building a CheckResult. Because it only returns the count,
+    it can run in another process. Results are cached by the board's
+    contents; see get_max_paths_cache_key.
+
+    :param executor: A process pool, owned by the caller, to split the
+        board's start squares between. See find_max_paths. Defaults to
+        None.
+    :type executor: ProcessPoolExecutor, optional
+
+    See check_max_paths for the other parameters.
+
+    :return: The square with the most paths and its count.
+    :rtype: MaxPathsCount
+    """
+    key = get_max_paths_cache_key(frb, skip_warnings, engine, limit)
+    result = get_cached_max_paths(key)
+    if result is not None:
+        return result
+
+    # once a square is past the warning threshold the board is going to
+    # warn no matter what the rest of it holds, so the search can stop
+    result = find_max_paths(
+        squares=frb._board_data.squares,
+        dice=get_search_depth(frb),
+        limit=limit,
+        engine=engine,
+        stop_at=None if skip_warnings else max_paths_threshold,
+        time_budget=time_budget,
+        graph=get_board_graph(frb),
+        workers=workers,
+        executor=executor,
+    )
+    cache_max_paths(key, result)
+    return result
+
+
+def search_max_paths_for_boards(
+    frbs: list[BoardFile],
+    skip_warnings: bool = False,
+    engine: str = "dp",
+    limit: int = max_paths_limit,
+    time_budget: float = None,
+    workers: int = None,
+    executor: ProcessPoolExecutor = None
+) -> list[MaxPathsCount]:
+    """
+    Runs the Max Paths search for several boards. Boards with identical
+    contents are only searched once. With more than one worker, or an
+    executor, the remaining boards are searched side by side in a
+    process pool. Otherwise a single board is searched in this process,
+    since splitting one board's start squares between processes costs
+    more in repeated work than it saves.
+
+    :param frbs: A list of BoardFile objects to search.
+    :type frbs: list[BoardFile]
+
+    :param workers: The number of processes to use. Defaults to None,
+        which searches every board in this process.
+    :type workers: int, optional
+
+    :param executor: A process pool, owned by the caller, to search the
+        boards in instead of starting one for this call. It is left
+        running. Defaults to None.
+    :type executor: ProcessPoolExecutor, optional
+
+    See check_max_paths for the other parameters.
+
+    :return: The result for each board, in the order of frbs.
+    :rtype: list[MaxPathsCount]
+    """
+    options = {
+        "skip_warnings": skip_warnings,
+        "engine": engine,
+        "limit": limit,
+        "time_budget": time_budget,
+    }
+    keys = [get_max_paths_cache_key(f, skip_warnings, engine, limit) for f in frbs]
+    results = {}
+    unsearched = {}
+    for key, f in zip(keys, frbs):
+        if key in results or key in unsearched:
+            continue
+        cached = get_cached_max_paths(key)
+        if cached is not None:
+            results[key] = cached
+        else:
+            unsearched[key] = f
+
+    if executor is None and (workers is None or workers <= 1 or len(unsearched) <= 1):
+        for key, f in unsearched.items():
+            results[key] = search_max_paths(f, **options)
+    elif unsearched:
+        pool = executor or ProcessPoolExecutor(max_workers=min(workers, len(unsearched)))
+        try:
+            futures = {
+                key: pool.submit(search_max_paths, f, **options)
+                for key, f in unsearched.items()
+            }
+            for key, future in futures.items():
+                results[key] = future.result()
+                cache_max_paths(key, results[key])
+        finally:
+            if executor is None:
+                pool.shutdown()
+
+    return [replace(results[key]) for key in keys]
+
+
+def check_max_paths_for_boards(
+    frbs: list[BoardFile],
+    filenames: list[str] = None,
+    skip: bool = False,
+    skip_warnings: bool = False,
+    engine: str = "dp",
+    limit: int = max_paths_limit,
+    time_budget: float = None,
+    workers: int = None,
+    paths: list[MaxPathsCount] = None
+) -> CheckResult:
+    """
+    Checks the Max Paths values for every .frb file in a bundle, such
+    as each district of a board with Switch squares, and warns if any
+    of them are too high.
+
+    :param frbs: A list of BoardFile objects representing one or more
+        .frb files.
+    :type frbs: list[BoardFile]
+
+    :param filenames: The .frb files' names, in the same order, used to
+        say which file a warning is about. Defaults to None.
+    :type filenames: list[str], optional
+
+    :param paths: The results of an earlier search_max_paths_for_boards
+        call for these boards. If given, they are not searched again.
+    :type paths: list[MaxPathsCount], optional
+
+    See check_max_paths for the other parameters.
+
+    :return: A CheckResult object containing the check status as well
+        as any messages, with a MaxPathsBreakdown as its data.
+    :rtype: CheckResult
+    """
+    if skip:
+        return build_results_object(skip=True)
+
+    error_messages = []
+    informational_messages = []
+    warning_messages = []
+
+    if filenames is None or len(filenames) != len(frbs):
+        filenames = [f"board file {i + 1}" for i in range(len(frbs))]
+    if paths is None:
+        paths = search_max_paths_for_boards(
+            frbs=frbs,
+            skip_warnings=skip_warnings,
+            engine=engine,
+            limit=limit,
+            time_budget=time_budget,
+            workers=workers,
         )
-        if paths_count > max_paths_count:
-            max_paths_count = paths_count
-            square_id_with_max_paths_count = i
-        paths_count = 0
 
-    return [square_id_with_max_paths_count, max_paths_count]
+    for filename, p in zip(filenames, paths):
+        if skip_warnings:
+            break
+        if p.count > max_paths_threshold:
+            warning = max_paths_warning.format(max_paths=p, limit=max_paths_threshold)
+            if len(frbs) > 1:
+                warning = max_paths_file_warning.format(filename=filename, warning=warning)
+            warning_messages.append(warning)
+        if p.timed_out:
+            warning = max_paths_timeout_warning.format(time_budget=time_budget, max_paths=p)
+            if len(frbs) > 1:
+                warning = max_paths_file_warning.format(filename=filename, warning=warning)
+            warning_messages.append(warning)
 
+    results = build_results_object(
+        errors=error_messages,
+        messages=informational_messages,
+        warnings=warning_messages,
+        data=MaxPathsBreakdown(filenames=filenames, files=paths)
+    )
+
+    error_messages.clear()
+    informational_messages.clear()
+    warning_messages.clear()
+
+    return results
 
-def check_max_paths(frb: BoardFile, skip: bool = False, skip_warnings: bool = False) -> CheckResult:
+
+def check_max_paths(
+    frb: BoardFile,
+    skip: bool = False,
+    skip_warnings: bool = False,
+    engine: str = "dp",
+    limit: int = max_paths_limit,
+    time_budget: float = None,
+    workers: int = None,
+    paths: MaxPathsCount = None
+) -> CheckResult:
     """
     Checks the Max Paths values for all squares on a board, and warns
     if the values are too high.
@@ -204,6 +873,30 @@ def check_max_paths(frb: BoardFile, skip: bool = False, skip_warnings: bool = Fa
         "Warning" messages.
     :type skip_warnings: bool, optional
 
+    :param engine: The engine used to count paths, "dp" or "matrix".
+        See find_max_paths.
+    :type engine: str, optional
+
+    :param limit: The highest count to search for. Defaults to 1000.
+    :type limit: int, optional
+
+    :param time_budget: The most wall-clock time, in seconds, that the
+        search may take, for example to keep CI runs bounded. If the
+        search runs out of time, a warning is raised and the count is
+        reported as a lower bound. Defaults to None, which means no
+        budget.
+    :type time_budget: float, optional
+
+    :param workers: If set above 1, the board's start squares are
+        split between this many processes. See find_max_paths.
+        Defaults to None.
+    :type workers: int, optional
+
+    :param paths: The result of an earlier search_max_paths call for
+        this board, such as one run in a process pool alongside other
+        boards. If given, the board is not searched again.
+    :type paths: MaxPathsCount, optional
+
     :return: A CheckResult object containing the check status as
         well as any messages and additional data.
     :rtype: CheckResult
@@ -215,25 +908,30 @@ def check_max_paths(frb: BoardFile, skip: bool = False, skip_warnings: bool = Fa
     informational_messages = []
     warning_messages = []
 
-    search_depth = int(len(frb._board_data.squares) / 3)
-
-    if search_depth < 16:
-        search_depth = 16
-
-    paths = calculate_max_paths(
-        squares=frb._board_data.squares, dice=search_depth, limit=1000
-    )
+    if paths is None:
+        paths = search_max_paths(
+            frb=frb,
+            skip_warnings=skip_warnings,
+            engine=engine,
+            limit=limit,
+            time_budget=time_budget,
+            workers=workers,
+        )
 
-    if paths[1] > 100 and not skip_warnings:
+    if paths.count > max_paths_threshold and not skip_warnings:
+        warning_messages.append(
+            max_paths_warning.format(max_paths=paths, limit=max_paths_threshold)
+        )
+    if paths.timed_out and not skip_warnings:
         warning_messages.append(
-            max_paths_warning.format(max_paths=paths[1], limit=100)
+            max_paths_timeout_warning.format(time_budget=time_budget, max_paths=paths)
         )
 
     results = build_results_object(
         errors=error_messages,
         messages=informational_messages,
         warnings=warning_messages,
-        data=paths[1]
+        data=paths
     )
 
     error_messages.clear()
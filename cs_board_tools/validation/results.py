@@ -2,7 +2,7 @@
 ones that build and return the CheckResults object.
 """
 from cs_board_tools.schema.validation import CheckResult
-from cs_board_tools.errors import process_log_messages
+from cs_board_tools.errors import ValidationContext, process_log_messages
 from typing import Any
 
 
@@ -12,7 +12,8 @@ def build_results_object(
     warnings: list[str] = [],
     data: Any = None,
     success: bool = False,
-    skip: bool = False
+    skip: bool = False,
+    context: ValidationContext = None
 ) -> CheckResult:
     """
     This function builds a Results object and returns it
@@ -37,6 +38,10 @@ def build_results_object(
     :param skip: If set to True, "SKIPPED" will be set as the check status.
     :type skip: bool
 
+    :param context: The ValidationContext to tally the check's messages
+        in. Defaults to None, which uses the current context.
+    :type context: ValidationContext, optional
+
     :return: A CheckResult object containing the check status as
         well as any messages and additional data.
     :rtype: CheckResult
@@ -63,7 +68,8 @@ def build_results_object(
         errors=errors.copy(),
         messages=messages.copy(),
         warnings=warnings.copy(),
-        job_was_successful=results.status
+        job_was_successful=results.status,
+        context=context
     )
 
     return results
@@ -0,0 +1,246 @@
+"""Runs validation checks side by side. Each check declares which of a
+bundle's inputs it needs and whether it is CPU-bound; I/O-bound checks
+run on threads, CPU-bound ones on processes when a process pool is
+available, and the results come back in the order the checks were
+declared, whatever order they finish in.
+
+Each check tallies its messages in a ValidationContext of its own,
+which is merged into the run's context, in declaration order, once the
+check's result is collected. That keeps the counts and message lists
+exactly as they would be if the checks had run one after another.
+
+Every check is timed as it runs, and the timing is kept on its
+CheckResult. When profiling, checks can also have their peak memory
+measured, and their cProfile stats written to a file.
+"""
+import cProfile
+import os
+import re
+import time
+import tracemalloc
+from concurrent.futures import Executor, Future
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from cs_board_tools.errors import ValidationContext, get_context, use_context
+from cs_board_tools.schema.validation import CheckResult, CheckTiming
+
+
+@dataclass
+class ScheduledCheck:
+    """
+    This dataclass describes a check for the scheduler to run. name is
+    the ValidationResult field its result goes in. inputs maps each of
+    the check function's parameters to the name of the input it takes,
+    and options holds any other arguments. cpu_bound checks are sent to
+    the process pool, if there is one.
+    """
+    name: str
+    function: Callable[..., CheckResult]
+    inputs: dict[str, str] = field(default_factory=dict)
+    options: dict[str, Any] = field(default_factory=dict)
+    cpu_bound: bool = False
+
+
+def get_profile_path(profile_dir: str, board_name: str, check_name: str) -> str:
+    """
+    Returns the path a check's cProfile stats are written to: a
+    <board name>.<check name>.prof file inside profile_dir, with any
+    characters that do not belong in a filename replaced.
+
+    :rtype: str
+    """
+    board_name = re.sub(r"[^\w.-]+", "_", board_name or "Unknown").strip("_")
+    return os.path.join(profile_dir, f"{board_name}.{check_name}.prof")
+
+
+def run_timed(
+    function: Callable[..., CheckResult],
+    kwargs: dict,
+    trace_memory: bool = False,
+    profile_path: str = None
+) -> CheckResult:
+    """
+    Runs a check and records how long it took on its result.
+
+    :param function: The check function.
+    :type function: Callable[..., CheckResult]
+
+    :param kwargs: The check's arguments.
+    :type kwargs: dict
+
+    :param trace_memory: If set to True, the check's peak memory is
+        measured with tracemalloc, which slows it down considerably.
+        Measurements are only accurate if no other check runs in this
+        process at the same time. Defaults to False.
+    :type trace_memory: bool, optional
+
+    :param profile_path: If given, the check runs under cProfile, and
+        its stats are written to this path. Defaults to None.
+    :type profile_path: str, optional
+
+    :return: The check's result.
+    :rtype: CheckResult
+    """
+    started_tracing = False
+    if trace_memory:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            started_tracing = True
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+
+    profiler = cProfile.Profile() if profile_path else None
+    wall_start = time.perf_counter()
+    cpu_start = time.thread_time()
+    try:
+        if profiler is None:
+            result = function(**kwargs)
+        else:
+            result = profiler.runcall(function, **kwargs)
+        timing = CheckTiming(
+            wall_time=time.perf_counter() - wall_start,
+            cpu_time=time.thread_time() - cpu_start
+        )
+        if trace_memory:
+            timing.peak_memory = max(tracemalloc.get_traced_memory()[1] - baseline, 0)
+    finally:
+        if started_tracing:
+            tracemalloc.stop()
+
+    if profiler is not None:
+        os.makedirs(os.path.dirname(profile_path) or ".", exist_ok=True)
+        profiler.dump_stats(profile_path)
+
+    result.timing = timing
+    return result
+
+
+def run_in_context(
+    function: Callable[..., CheckResult],
+    kwargs: dict,
+    trace_memory: bool = False,
+    profile_path: str = None
+) -> tuple[CheckResult, ValidationContext]:
+    """
+    Runs a check in a new ValidationContext of its own, timing it with
+    run_timed.
+
+    :return: The check's result, and the context holding its messages.
+    :rtype: tuple[CheckResult, ValidationContext]
+    """
+    with use_context() as context:
+        result = run_timed(function, kwargs, trace_memory, profile_path)
+    return result, context
+
+
+def submit_checks(
+    checks: list[ScheduledCheck],
+    inputs: dict[str, Any],
+    threads: Executor = None,
+    processes: Executor = None,
+    trace_memory: bool = False,
+    profile_dir: str = None,
+    board_name: str = ""
+) -> list[Future]:
+    """
+    Starts running a list of checks.
+
+    :param checks: The checks to run.
+    :type checks: list[ScheduledCheck]
+
+    :param inputs: The inputs the checks can ask for, by name.
+    :type inputs: dict[str, Any]
+
+    :param threads: The thread pool to run the checks on. Defaults to
+        None, which runs every check here and now, one after another.
+    :type threads: Executor, optional
+
+    :param processes: The process pool to run CPU-bound checks on.
+        Defaults to None, which runs them on the thread pool.
+    :type processes: Executor, optional
+
+    :param trace_memory: If set to True, each check's peak memory is
+        measured; see run_timed. Defaults to False.
+    :type trace_memory: bool, optional
+
+    :param profile_dir: If given, each check runs under cProfile, and
+        its stats are written to a file in this directory, named by
+        get_profile_path. Defaults to None.
+    :type profile_dir: str, optional
+
+    :param board_name: The name of the board the checks are for, used
+        to name the cProfile stats files. Defaults to "".
+    :type board_name: str, optional
+
+    :return: A Future for each check, in the same order, holding the
+        check's result and the context holding its messages.
+    :rtype: list[Future]
+    """
+    futures = []
+    for check in checks:
+        kwargs = {parameter: inputs[name] for parameter, name in check.inputs.items()}
+        kwargs.update(check.options)
+        profile_path = None
+        if profile_dir:
+            profile_path = get_profile_path(profile_dir, board_name, check.name)
+        args = (check.function, kwargs, trace_memory, profile_path)
+        if threads is None:
+            future = Future()
+            future.set_result(run_in_context(*args))
+        elif check.cpu_bound and processes is not None:
+            future = processes.submit(run_in_context, *args)
+        else:
+            future = threads.submit(run_in_context, *args)
+        futures.append(future)
+    return futures
+
+
+def collect_checks(
+    checks: list[ScheduledCheck],
+    futures: list[Future],
+    context: ValidationContext = None
+) -> dict[str, CheckResult]:
+    """
+    Waits for a list of checks to finish, and tallies their messages in
+    the order the checks were declared.
+
+    :param checks: The checks, as passed to submit_checks.
+    :type checks: list[ScheduledCheck]
+
+    :param futures: The Futures submit_checks returned for them.
+    :type futures: list[Future]
+
+    :param context: The context to tally the messages in. Defaults to
+        None, which uses the current context.
+    :type context: ValidationContext, optional
+
+    :return: Each check's result, by name, in declaration order.
+    :rtype: dict[str, CheckResult]
+    """
+    if context is None:
+        context = get_context()
+    results = {}
+    for check, future in zip(checks, futures):
+        result, check_context = future.result()
+        context.merge(check_context)
+        results[check.name] = result
+    return results
+
+
+def run_checks(
+    checks: list[ScheduledCheck],
+    inputs: dict[str, Any],
+    threads: Executor = None,
+    processes: Executor = None,
+    context: ValidationContext = None
+) -> dict[str, CheckResult]:
+    """
+    Runs a list of checks side by side and waits for them all; see
+    submit_checks and collect_checks.
+
+    :return: Each check's result, by name, in declaration order.
+    :rtype: dict[str, CheckResult]
+    """
+    futures = submit_checks(checks, inputs, threads, processes)
+    return collect_checks(checks, futures, context)
@@ -0,0 +1,134 @@
+"""Checks on the shape of a board's waypoint graph live here. They
+catch broken pathing -- squares that cannot be reached, places where a
+player can get stuck, one-way moves -- before it shows up as an odd
+Max Paths value or a crash in game.
+"""
+from cs_board_tools.analysis.structure import analyse_structure
+from cs_board_tools.queries.frb.squaretype import get_square_type_index
+from cs_board_tools.schema.frb import BoardFile, SquareType
+from cs_board_tools.schema.validation import CheckResult
+from cs_board_tools.validation.results import build_results_object
+
+unreachable_squares_warning = (
+    "These squares cannot be reached from the Bank: {squares}."
+)
+
+no_way_back_warning = (
+    "These squares can be reached from the Bank, but there is no way "
+    "back to the Bank from them: {squares}."
+)
+
+dead_end_warning = (
+    "A player can get stuck with no waypoint to leave by on these "
+    "squares, when arriving from the square in brackets: {states}."
+)
+
+one_way_moves_warning = (
+    "These moves can only be made in one direction, and do not involve "
+    "a One Way Alley or a Lift: {moves}."
+)
+
+file_warning = "{filename}: {warning}"
+
+
+def check_board_structure(
+    frbs: list[BoardFile],
+    filenames: list[str] = None,
+    skip: bool = False,
+    skip_warnings: bool = False
+) -> CheckResult:
+    """
+    Checks the shape of the waypoint graph of every .frb file in a
+    bundle, and warns about unreachable squares, squares with no way
+    back to the Bank, places where a player can get stuck, and moves
+    that only go one way outside of One Way Alleys and Lifts.
+
+    Only waypoints are followed, starting from the Bank, so squares a
+    player can only get to through a Back Street warp or a Cannon are
+    reported as unreachable. For that reason, validate_bundle and
+    validate_board_file skip this check unless asked to run it.
+
+    :param frbs: A list of BoardFile objects representing one or more
+        .frb files.
+    :type frbs: list[BoardFile]
+
+    :param filenames: The .frb files' names, in the same order, used to
+        say which file a warning is about. Defaults to None.
+    :type filenames: list[str], optional
+
+    :param skip: If set to True, the check will be skipped, but a
+        valid resultobject with no messages and SKIPPED as its
+        status will still be returned.
+    :type skip: bool
+
+    :param skip_warnings: If set, skips tests resulting in
+        "Warning" messages.
+    :type skip_warnings: bool, optional
+
+    :return: A CheckResult object containing the check status as
+        well as any messages, with a BoardStructure for each file as
+        its data.
+    :rtype: CheckResult
+    """
+    if skip:
+        return build_results_object(skip=True)
+
+    error_messages = []
+    informational_messages = []
+    warning_messages = []
+
+    if filenames is None or len(filenames) != len(frbs):
+        filenames = [f"board file {i + 1}" for i in range(len(frbs))]
+
+    structures = []
+    for filename, frb in zip(filenames, frbs):
+        structure = analyse_structure(frb)
+        structures.append(structure)
+        if skip_warnings:
+            continue
+
+        warnings = []
+        if structure.unreachable_squares:
+            warnings.append(unreachable_squares_warning.format(
+                squares=", ".join(str(i) for i in structure.unreachable_squares)
+            ))
+
+        banks = set(get_square_type_index(frb).ids(SquareType.Bank)) or {0}
+        home = [c for c in structure.components if banks & set(c)]
+        home = set().union(*home)
+        stranded = [
+            i for i in range(len(frb.squares))
+            if i not in home and i not in structure.unreachable_squares
+        ]
+        if stranded:
+            warnings.append(no_way_back_warning.format(
+                squares=", ".join(str(i) for i in stranded)
+            ))
+
+        if structure.dead_end_states:
+            warnings.append(dead_end_warning.format(states=", ".join(
+                f"{square_id} ({'any' if prev_square_id == 255 else prev_square_id})"
+                for prev_square_id, square_id in structure.dead_end_states
+            )))
+        if structure.one_way_moves:
+            warnings.append(one_way_moves_warning.format(moves=", ".join(
+                f"{a} -> {b}" for a, b in structure.one_way_moves
+            )))
+
+        for w in warnings:
+            if len(frbs) > 1:
+                w = file_warning.format(filename=filename, warning=w)
+            warning_messages.append(w)
+
+    results = build_results_object(
+        errors=error_messages,
+        messages=informational_messages,
+        warnings=warning_messages,
+        data=structures
+    )
+
+    error_messages.clear()
+    informational_messages.clear()
+    warning_messages.clear()
+
+    return results
@@ -0,0 +1,48 @@
+from collections import deque
+
+import pytest
+
+from cs_board_tools.analysis import compute_distances
+from cs_board_tools.io import read_frb
+from cs_board_tools.queries.frb import get_destinations
+from cs_board_tools.schema.frb import SquareType
+
+np = pytest.importorskip("numpy")
+
+
+def bfs_distances(squares, start):
+    """A plain breadth-first search over states, from one square."""
+    distances = {start: 0}
+    seen = {(255, start)}
+    queue = deque([((255, start), 0)])
+    while queue:
+        (prev_square_id, square_id), moves = queue.popleft()
+        for d in get_destinations(squares, prev_square_id, square_id):
+            if (square_id, d) not in seen:
+                seen.add((square_id, d))
+                distances.setdefault(d, moves + 1)
+                queue.append(((square_id, d), moves + 1))
+    return distances
+
+
+def test_distances_match_breadth_first_search():
+    frb = read_frb("./tests/artifacts/WiiU.frb")
+    distances = compute_distances(frb)
+    assert distances.shape == (55, 55)
+    for start in range(55):
+        expected = np.full(55, -1)
+        for square_id, moves in bfs_distances(frb.squares, start).items():
+            expected[square_id] = moves
+        assert (distances[start] == expected).all()
+
+    banks = [i for i, s in enumerate(frb.squares) if s.square_type == SquareType.Bank]
+    nearest_bank = distances[:, banks].min(axis=1)
+    assert nearest_bank[banks[0]] == 0 and (nearest_bank >= 0).all()
+
+
+def test_distances_are_cached_on_the_board():
+    frb = read_frb("./tests/artifacts/WiiU.frb")
+    distances = compute_distances(frb)
+    assert compute_distances(frb) is distances
+    assert not distances.flags.writeable
+    assert compute_distances(frb, refresh=True) is not distances
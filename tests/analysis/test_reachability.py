@@ -0,0 +1,57 @@
+import pytest
+
+from cs_board_tools.analysis import analyse_reachability, calculate_stop_sets
+from cs_board_tools.io import read_frb
+from cs_board_tools.queries.frb import get_destinations
+
+from tests.helpers import make_square
+
+
+def walk(squares, prev_square_id, square_id, roll, chance=1.0):
+    """Walks every route, yielding where each one stops and how likely
+    it is, to check the single-sweep analysis against."""
+    if roll == 0:
+        yield square_id, chance
+        return
+    destinations = get_destinations(squares, prev_square_id, square_id)
+    for d in destinations:
+        yield from walk(squares, square_id, d, roll - 1, chance / len(destinations))
+
+
+def test_stop_sets_and_probabilities_match_walks():
+    # a loop of six squares, with a shortcut out of square 0 and a dead
+    # end off square 3
+    squares = [
+        make_square({5: [1, 3], 1: [5]}),
+        make_square({0: [2], 2: [0]}),
+        make_square({1: [3], 3: [1]}),
+        make_square({2: [4, 6], 4: [2], 0: [4, 2]}),
+        make_square({3: [5], 5: [3]}),
+        make_square({4: [0], 0: [4]}),
+        make_square({3: []}),
+    ]
+    stop_sets = calculate_stop_sets(squares, 6)
+    for start in range(len(squares)):
+        for roll in range(1, 7):
+            stops = sorted({s for s, _ in walk(squares, 255, start, roll)})
+            assert stop_sets[start][roll - 1] == stops
+
+    np = pytest.importorskip("numpy")
+    frb = read_frb("./tests/artifacts/WiiU.frb")
+    frb.squares[:] = squares
+    result = analyse_reachability(frb, max_dice_roll=6)
+    for start in range(len(squares)):
+        expected = np.zeros(len(squares))
+        for roll in range(1, 7):
+            for s, chance in walk(squares, 255, start, roll):
+                expected[s] += chance / 6
+        assert np.allclose(result.landing_probabilities[start], expected)
+
+
+def test_reachability_on_a_real_board():
+    frb = read_frb("./tests/artifacts/WiiU.frb")
+    result = analyse_reachability(frb, probabilities=False)
+    assert result.max_dice_roll == 7
+    assert len(result.stop_sets) == 55
+    assert all(len(rolls) == 7 for rolls in result.stop_sets)
+    assert result.landing_probabilities is None
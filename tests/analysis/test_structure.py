@@ -0,0 +1,74 @@
+import random
+
+from cs_board_tools.analysis import analyse_structure, find_strongly_connected_components
+from cs_board_tools.io import read_frb
+from cs_board_tools.queries.frb import BoardGraph
+from cs_board_tools.schema.frb import SquareType
+from cs_board_tools.validation import check_board_structure
+
+from tests.helpers import make_square
+
+
+def reachable(graph, square_id):
+    seen = {square_id}
+    stack = [square_id]
+    while stack:
+        for d in graph.destinations(255, stack.pop()):
+            if d not in seen:
+                seen.add(d)
+                stack.append(d)
+    return seen
+
+
+def test_components_match_reachability():
+    rng = random.Random(5)
+    for _ in range(10):
+        count = 15
+        squares = []
+        for _ in range(count):
+            waypoints = {
+                entry: rng.sample(range(count), rng.randint(0, 2))
+                for entry in rng.sample(range(count), rng.randint(1, 2))
+            }
+            squares.append(make_square(waypoints))
+        graph = BoardGraph(squares)
+        reach = [reachable(graph, i) for i in range(count)]
+        expected = sorted(
+            {tuple(sorted(j for j in reach[i] if i in reach[j])) for i in range(count)}
+        )
+        components = find_strongly_connected_components(graph)
+        assert [tuple(c) for c in components] == expected
+
+
+def test_broken_pathing_is_found():
+    # a loop through the bank, with a one-way spur into a dead end, and
+    # a square nothing leads to
+    squares = [
+        make_square({2: [1], 1: [2]}, square_type=SquareType.Bank.value),
+        make_square({0: [2, 3], 2: [0]}),
+        make_square({1: [0], 0: [1]}),
+        make_square({1: []}),
+        make_square({4: [0]}),
+    ]
+    frb = read_frb("./tests/artifacts/WiiU.frb")
+    frb.squares[:] = squares
+
+    structure = analyse_structure(frb)
+    assert structure.components == [[0, 1, 2], [3], [4]]
+    assert structure.unreachable_squares == [4]
+    assert structure.dead_end_states == [(1, 3)]
+    assert structure.one_way_moves == [(1, 3), (4, 0)]
+    assert not structure.is_strongly_connected
+
+    result = check_board_structure([frb])
+    assert result.status == "WARNING"
+    assert len(result.warning_messages) == 4
+    assert check_board_structure([frb], skip_warnings=True).status == "OK"
+
+
+def test_real_board_is_well_formed():
+    frb = read_frb("./tests/artifacts/WiiU.frb")
+    structure = analyse_structure(frb)
+    assert structure.is_strongly_connected
+    assert not structure.dead_end_states and not structure.one_way_moves
+    assert check_board_structure([frb]).status == "OK"
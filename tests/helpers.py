@@ -0,0 +1,17 @@
+from cs_board_tools.schema.frb import Square, WaypointData
+
+
+def make_square(
+    waypoints: dict[int, list[int]],
+    square_type: int = 0,
+    x: int = 0,
+    y: int = 0
+) -> Square:
+    """A square whose waypoints map each entry square ID to the squares
+    a player arriving from it may move on to."""
+    entries = [
+        WaypointData(entry, (destinations + [255, 255, 255])[:3])
+        for entry, destinations in waypoints.items()
+    ]
+    entries += [WaypointData(255, [255, 255, 255])] * (4 - len(entries))
+    return Square(square_type, x, y, 0, entries, 0, 0, 0, 0, 0, 0)
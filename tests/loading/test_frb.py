@@ -1,5 +1,19 @@
+import gc
+import math
+import random
+
+import pytest
+
 from cs_board_tools.io import read_frb
-from cs_board_tools.schema.frb import LoopingMode, SquareType
+from cs_board_tools.queries.frb import (
+    BoardCache,
+    SpatialIndex,
+    are_square_types_present,
+    get_square_type_index,
+    is_square_type_present,
+    query,
+)
+from cs_board_tools.schema.frb import LoopingMode, Square, SquareType
 
 
 def test_reading_frb():
@@ -23,3 +37,117 @@ def test_reading_frb():
     assert frb.board_info.max_dice_roll == 7
     assert frb.board_info.salary_increment == 200
     assert frb.board_info.version_flag == 3
+
+
+def test_board_cache():
+    cache = BoardCache(lambda frb: SpatialIndex(frb.squares))
+    frb = read_frb("./tests/artifacts/WiiU.frb")
+    index = cache.get(frb)
+    assert cache.get(frb) is index
+    assert cache.get(frb, refresh=True) is not index
+
+    # replacing the board's squares makes the entry stale
+    index = cache.get(frb)
+    frb._board_data.squares = list(frb.squares)
+    assert cache.get(frb) is not index
+
+    # with a signature, squares edited in place make it stale too
+    cache = BoardCache(
+        lambda frb: SpatialIndex(frb.squares),
+        lambda squares: tuple(s.positionX for s in squares)
+    )
+    index = cache.get(frb)
+    frb.squares[0].positionY += 64
+    assert cache.get(frb) is index
+    frb.squares[0].positionX += 64
+    assert cache.get(frb) is not index
+
+    # entries go when their board does
+    del frb
+    gc.collect()
+    assert not cache.entries
+
+
+def test_square_type_index():
+    frb = read_frb("./tests/artifacts/WiiU.frb")
+    index = get_square_type_index(frb)
+    assert get_square_type_index(frb) is index
+
+    for t in SquareType:
+        ids = tuple(i for i, s in enumerate(frb.squares) if s.square_type == t)
+        assert index.ids(t) == ids
+        assert index.count(t) == len(ids)
+        assert is_square_type_present(frb, t) == bool(ids)
+    assert sum(index.counts.values()) == 55
+
+    assert are_square_types_present(frb, [SquareType.Bank, SquareType.Property])
+    assert not are_square_types_present(frb, [SquareType.Bank, SquareType.SwitchSquare])
+    assert index.has_any([SquareType.Bank, SquareType.SwitchSquare])
+
+    # types changed in place are picked up without a refresh
+    frb.squares[1].square_type = SquareType.SwitchSquare
+    assert is_square_type_present(frb, SquareType.SwitchSquare)
+    assert are_square_types_present(frb, [SquareType.Bank, SquareType.SwitchSquare])
+    assert get_square_type_index(frb).count(SquareType.SwitchSquare) == 1
+
+
+def test_square_query():
+    frb = read_frb("./tests/artifacts/WiiU.frb")
+    squares = list(enumerate(frb.squares))
+
+    properties = query(frb).where(type=SquareType.Property)
+    assert properties.ids() == [
+        i for i, s in squares if s.square_type == SquareType.Property
+    ]
+
+    expensive = properties.where(district__in=[1, 2], price__gt=30)
+    assert expensive.select("id", "price") == [
+        (i, s.price) for i, s in squares
+        if s.square_type == SquareType.Property
+        and s.district_destination_id in (1, 2) and s.price > 30
+    ]
+    assert expensive.count() < properties.count()
+    assert query(frb).where(id=43).select() == [frb.squares[43]]
+    assert query(frb).where(shop_model=21, x__lte=448).select("x") == [
+        s.positionX for _, s in squares if s.shop_model == 21 and s.positionX <= 448
+    ]
+    assert not query(frb).where(type=SquareType.SwitchSquare).exists()
+    frb.squares[43].square_type = SquareType.SwitchSquare
+    assert query(frb).where(type=SquareType.SwitchSquare).ids() == [43]
+
+    with pytest.raises(ValueError):
+        query(frb).where(colour="red")
+    with pytest.raises(ValueError):
+        query(frb).where(price__between=(1, 2))
+
+
+def test_spatial_index():
+    rng = random.Random(2)
+    squares = [
+        Square(0, rng.randrange(-700, 700, 16), rng.randrange(-600, 600, 16), 0, [], 0, 0, 0, 0, 0, 0)
+        for _ in range(150)
+    ]
+    index = SpatialIndex(squares)
+    positions = [(s.positionX, s.positionY) for s in squares]
+
+    assert index.in_range(-100, -50, 200, 300) == [
+        i for i, (x, y) in enumerate(positions) if -100 <= x <= 200 and -50 <= y <= 300
+    ]
+    assert index.within(10, 20, 150) == [
+        i for i, p in enumerate(positions) if math.dist(p, (10, 20)) <= 150
+    ]
+    for square_id in range(0, 150, 7):
+        nearest = index.nearest_neighbour(square_id)
+        assert nearest == min(
+            (i for i in range(150) if i != square_id),
+            key=lambda i: (math.dist(positions[i], positions[square_id]), i)
+        )
+    assert index.find_overlaps() == [
+        (a, b) for a in range(150) for b in range(a + 1, 150)
+        if abs(positions[a][0] - positions[b][0]) < 64
+        and abs(positions[a][1] - positions[b][1]) < 64
+    ]
+    assert index.find_isolated(100) == [
+        i for i, p in enumerate(positions)
+        if all(math.dist(p, q) > 100 for j, q in enumerate(positions) if j != i)
+    ]
@@ -0,0 +1,101 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import cs_board_tools.utilities.schema as schema_module
+from cs_board_tools.utilities import SchemaProvider, load_yaml, vendor_schema
+from cs_board_tools.utilities.yaml import schema_unavailable_message
+
+schema = {"type": "object", "required": ["name"]}
+etag = '"mapdescriptor-v1"'
+
+
+class SchemaHandler(BaseHTTPRequestHandler):
+    requests_seen = []
+
+    def do_GET(self):
+        SchemaHandler.requests_seen.append(dict(self.headers))
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        body = json.dumps(schema).encode("utf8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def start_server():
+    SchemaHandler.requests_seen = []
+    server = HTTPServer(("127.0.0.1", 0), SchemaHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_port}/mapdescriptor.json"
+
+
+def test_schema_is_fetched_once_and_revalidated(tmp_path):
+    server, url = start_server()
+    try:
+        provider = SchemaProvider(url=url, cache_dir=str(tmp_path))
+        assert provider.get() == schema
+        assert provider.get() == schema
+        assert provider.source == "network"
+        assert len(SchemaHandler.requests_seen) == 1
+
+        # a new process starts with an empty memo, but a warm disk cache
+        provider = SchemaProvider(url=url, cache_dir=str(tmp_path))
+        assert provider.get() == schema
+        assert provider.source == "cache"
+        assert SchemaHandler.requests_seen[1]["If-None-Match"] == etag
+    finally:
+        server.shutdown()
+
+
+def test_schema_falls_back_when_offline(tmp_path):
+    server, url = start_server()
+    SchemaProvider(url=url, cache_dir=str(tmp_path)).get()
+    server.shutdown()
+    server.server_close()
+
+    provider = SchemaProvider(url=url, cache_dir=str(tmp_path), timeout=1)
+    assert provider.get() == schema
+    assert provider.source == "cache"
+
+
+def test_vendored_schema_is_used_only_when_it_matches_its_record(tmp_path, monkeypatch):
+    schema_path = tmp_path / "mapdescriptor.json"
+    source_path = tmp_path / "mapdescriptor.source.json"
+    monkeypatch.setattr(schema_module, "vendored_schema_path", schema_path)
+    monkeypatch.setattr(schema_module, "vendored_source_path", source_path)
+
+    server, url = start_server()
+    try:
+        record = vendor_schema(url, schema_path, source_path)
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert record["url"] == url
+    assert record["etag"] == etag
+    assert schema_path.read_bytes() == json.dumps(schema).encode("utf8")
+
+    provider = SchemaProvider(url=url, cache_dir=str(tmp_path / "empty"), timeout=1)
+    assert provider.get() == schema
+    assert provider.source == "vendored"
+
+    # a copy that no longer matches its record is never used
+    schema_path.write_text(json.dumps({"type": "object"}), encoding="utf8")
+    provider = SchemaProvider(url=url, cache_dir=str(tmp_path / "empty"), timeout=1)
+    assert provider.get() is None
+    assert provider.source == "unavailable"
+
+    yaml_path = tmp_path / "board.yaml"
+    yaml_path.write_text("name: Board\n", encoding="utf8")
+    content, results = load_yaml(yaml_path, provider.get())
+    assert content["name"] == "Board"
+    assert results.status == "WARNING"
+    assert results.warning_messages == [schema_unavailable_message]
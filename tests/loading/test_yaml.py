@@ -1,4 +1,12 @@
-from cs_board_tools.io import read_yaml
+from concurrent.futures import ThreadPoolExecutor
+
+from cs_board_tools.io import read_yaml, read_yamls
+from cs_board_tools.utilities.yaml import get_yaml_validator, load_yaml, load_yaml_schema
+
+
+def valid_status() -> str:
+    # without the schema, a valid descriptor is loaded with a warning
+    return "OK" if load_yaml_schema() else "WARNING"
 
 
 def test_reading_yaml():
@@ -19,3 +27,63 @@ def test_reading_yaml():
     assert descriptor.tour_mode.opponent_3 == "Toad"
 
     assert descriptor.venture_cards.count == 64
+
+
+def test_every_schema_violation_is_reported(tmp_path):
+    schema = {
+        "$schema": "http://json-schema.org/draft-07/schema#",
+        "type": "object",
+        "properties": {
+            "baseSalary": {"type": "integer"},
+            "maxDiceRoll": {"type": "integer"},
+        },
+    }
+    descriptor = tmp_path / "Broken.yaml"
+    descriptor.write_text("baseSalary: lots\nmaxDiceRoll: seven\n")
+
+    _, results = load_yaml(str(descriptor), schema)
+
+    assert results.status == "ERROR"
+    assert len(results.error_messages) == 2
+    assert get_yaml_validator(schema) is get_yaml_validator(schema)
+
+
+def test_fast_loader_matches_default_loader():
+    filename = "./tests/artifacts/WiiU.yaml"
+    content, _ = load_yaml(filename, None)
+    fast_content, _ = load_yaml(filename, None, fast=True)
+
+    assert content == fast_content
+    assert content["shopNames"]["en"]["5"] == "scrap-paper shop"
+
+
+def test_loading_descriptors_concurrently(tmp_path):
+    broken = tmp_path / "Broken.yaml"
+    broken.write_text("name: [unclosed\n")
+    filenames = [str(broken), "./tests/artifacts/WiiU.yaml"] * 16
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(read_yaml, filenames))
+
+    for filename, descriptor in zip(filenames, results):
+        validation = descriptor.yaml_validation_results
+        if filename == str(broken):
+            assert validation.status == "ERROR"
+            assert len(validation.error_messages) == 1
+        else:
+            assert validation.status == valid_status()
+            assert validation.error_messages == []
+            assert descriptor.name.en == "Wii U"
+
+
+def test_reading_many_yamls_keeps_order(tmp_path):
+    broken = tmp_path / "Broken.yaml"
+    broken.write_text("name: [unclosed\n")
+    filenames = ["./tests/artifacts/WiiU.yaml", str(broken)] * 4
+
+    descriptors = read_yamls(filenames, workers=4)
+
+    assert len(descriptors) == len(filenames)
+    statuses = [d.yaml_validation_results.status for d in descriptors]
+    assert statuses == [valid_status(), "ERROR"] * 4
+    assert descriptors[0].name.en == "Wii U"
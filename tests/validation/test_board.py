@@ -0,0 +1,55 @@
+from cs_board_tools.io import read_frb
+from cs_board_tools.schema.frb import SquareType, WaypointData
+from cs_board_tools.validation.board import (
+    check_board_configuration,
+    check_doors_and_dice,
+    check_overlapping_squares,
+    check_two_way_doors,
+    scan_squares,
+)
+
+
+def test_square_scan():
+    frb = read_frb("./tests/artifacts/WiiU.frb")
+    second = read_frb("./tests/artifacts/WiiU.frb")
+    second.squares[3].square_type = SquareType.OneWayAlleyDoorB
+    for i in (1, 2):
+        frb.squares[i].square_type = SquareType.OneWayAlleyDoorA
+    frb.squares[1].waypoints = [WaypointData(2, [3, 255, 255])] + [WaypointData(255, [255, 255, 255])] * 3
+
+    scan = scan_squares([frb, second])
+    assert scan.has_doors and {1, 2} <= scan.door_ids
+    assert 3 not in scan.door_ids
+    assert {2, 3} <= scan.door_connection_ids
+
+    assert not check_two_way_doors([frb, second], scan)
+    assert not check_doors_and_dice([frb, second], scan)
+
+    frb.board_info.max_dice_roll = 9
+    assert check_two_way_doors([frb, second])
+    assert check_doors_and_dice([frb, second])
+
+
+def test_switch_district_files_pass_on_their_own():
+    # each district of a switch board is validated as its own .frb by
+    # validate_board_file, so its Switch squares never match len(frbs)
+    frb = read_frb("./tests/artifacts/WiiU.frb")
+    frb.squares[10].square_type = SquareType.SwitchSquare
+    frb.squares[10].district_destination_id = 3
+    assert check_board_configuration(frbs=[frb]).status == "OK"
+
+
+def test_overlapping_squares():
+    frb = read_frb("./tests/artifacts/WiiU.frb")
+    assert check_overlapping_squares([frb]).status == "OK"
+
+    frb.squares[7].positionX = frb.squares[6].positionX + 10
+    frb.squares[7].positionY = frb.squares[6].positionY - 63
+    result = check_overlapping_squares([frb])
+    assert result.status == "WARNING"
+    assert "1: (6, 7), " in result.warning_messages[0]
+    assert check_overlapping_squares([frb], skip_warnings=True).status == "OK"
+    assert check_overlapping_squares([frb], skip=True).status == "SKIPPED"
+
+    # overlaps are not part of the board configuration checks
+    assert check_board_configuration(frbs=[frb]).status == "OK"
@@ -0,0 +1,288 @@
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from cs_board_tools.analysis import PathAnalyser
+from cs_board_tools.io import read_frb
+from cs_board_tools.queries.frb import BoardGraph, get_board_graph
+from cs_board_tools.schema.frb import Square, WaypointData
+from cs_board_tools.validation.paths import (
+    calculate_max_paths,
+    calculate_paths_heatmap,
+    check_max_paths,
+    check_max_paths_for_boards,
+    clear_max_paths_cache,
+    count_paths,
+    find_max_paths,
+    get_destinations,
+    get_paths_count,
+    max_paths_cache,
+    search_max_paths_for_boards,
+)
+
+from tests.helpers import make_square
+
+
+def make_grid(width: int, height: int) -> list[Square]:
+    """A grid of roads, where every square leads on to every neighbour
+    except the one the player came from."""
+    def neighbours(i):
+        x, y = i % width, i // width
+        for nx, ny in ((x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1)):
+            if 0 <= nx < width and 0 <= ny < height:
+                yield ny * width + nx
+
+    squares = []
+    for i in range(width * height):
+        n = list(neighbours(i))
+        squares.append(make_square(
+            {e: [d for d in n if d != e] for e in n}, x=64 * (i % width), y=64 * (i // width)
+        ))
+    return squares
+
+
+def make_random_board(square_count: int, seed: int) -> list[Square]:
+    rng = random.Random(seed)
+    squares = []
+    for _ in range(square_count):
+        waypoints = {}
+        for entry in rng.sample(range(square_count), rng.randint(1, 4)):
+            waypoints[entry] = rng.sample(range(square_count), rng.randint(0, 3))
+        if rng.random() < 0.2:
+            waypoints[255] = [rng.randrange(square_count)]
+        squares.append(make_square(dict(list(waypoints.items())[:4])))
+    return squares
+
+
+def reference_paths_count(squares, prev_square_id, square_id, dice):
+    """The original exhaustive walk, kept to check the optimised count."""
+    if dice == 0:
+        return 1
+    count = 0
+    for d in get_destinations(squares, prev_square_id, square_id):
+        if d < len(squares):
+            count += reference_paths_count(squares, square_id, d, dice - 1)
+    return count
+
+
+def reference_max_paths(squares, dice):
+    best = [255, 0]
+    for i in range(len(squares)):
+        count = reference_paths_count(squares, 255, i, dice)
+        if count > best[1]:
+            best = [i, count]
+    return best
+
+
+def test_max_paths_matches_exhaustive_search():
+    boards = [make_grid(3, 3), make_grid(4, 2)]
+    boards += [make_random_board(12, seed) for seed in range(5)]
+    for squares in boards:
+        for dice in (1, 4, 8):
+            assert calculate_max_paths(squares, dice, 1000) == reference_max_paths(squares, dice)
+
+
+def test_paths_count_with_prev_square():
+    squares = make_grid(3, 3)
+    for prev, square in ((1, 4), (3, 4), (0, 1)):
+        assert get_paths_count(squares, prev, square, 6, 1000) == (
+            reference_paths_count(squares, prev, square, 6)
+        )
+
+
+def test_max_paths_on_large_board():
+    squares = make_grid(15, 15)
+    square_id, count = calculate_max_paths(squares, 75, None)
+    assert count > 10 ** 20
+    assert 0 <= square_id < len(squares)
+
+
+def test_matrix_engine_matches_dp():
+    pytest.importorskip("numpy")
+    boards = [make_grid(3, 3), make_grid(5, 4)]
+    boards += [make_random_board(20, seed) for seed in range(5)]
+    for squares in boards:
+        for dice in (1, 6, 16):
+            for limit in (None, 50):
+                assert calculate_max_paths(squares, dice, limit, engine="matrix") == (
+                    calculate_max_paths(squares, dice, limit)
+                )
+
+
+def test_unknown_engine_is_rejected():
+    with pytest.raises(ValueError):
+        calculate_max_paths(make_grid(2, 2), 4, 1000, engine="quantum")
+
+
+def test_limit_saturates_counts():
+    squares = make_grid(15, 15)
+    assert calculate_max_paths(squares, 75, 1000)[1] == 1000
+
+    result = find_max_paths(squares, 75, limit=1000)
+    assert result.saturated and str(result) == "≥ 1000"
+
+    squares = make_grid(3, 3)
+    exact = find_max_paths(squares, 6, limit=10 ** 6)
+    assert exact.exact and str(exact) == str(reference_max_paths(squares, 6)[1])
+    for limit in (1, 5, exact.count):
+        assert get_paths_count(squares, 255, exact.square_id, 6, limit) == limit
+
+
+def test_search_stops_once_past_threshold():
+    squares = make_grid(6, 6)
+    result = find_max_paths(squares, 12, stop_at=100)
+    assert result.stopped_early and result.count > 100
+    assert str(result) == f"≥ {result.count}"
+
+
+def test_time_budget():
+    squares = make_grid(6, 6)
+    result = find_max_paths(squares, 12, time_budget=0)
+    assert result.timed_out and not result.exact
+    assert find_max_paths(squares, 12, time_budget=60).exact
+
+
+def test_time_budget_is_checked_within_a_square():
+    squares = make_grid(30, 30)
+    transitions = BoardGraph(squares).transitions
+    memo = {}
+    with pytest.raises(TimeoutError):
+        count_paths(transitions, 255, 0, 80, memo, deadline=time.monotonic() - 1)
+    assert not memo
+
+    # counting the first square alone takes far longer than the budget
+    started = time.monotonic()
+    result = find_max_paths(squares, 80, time_budget=0.05)
+    assert result.timed_out and result.count == 0
+    assert time.monotonic() - started < 0.5
+
+
+def test_board_graph_matches_get_destinations():
+    boards = [make_grid(4, 3)] + [make_random_board(15, seed) for seed in range(5)]
+    for squares in boards:
+        graph = BoardGraph(squares)
+        for square_id in range(len(squares)):
+            for prev in list(range(len(squares))) + [255]:
+                expected = get_destinations(squares, prev, square_id)
+                assert graph.destinations(prev, square_id) == tuple(sorted(expected))
+
+
+def test_board_graph_is_built_once_per_board():
+    frb = read_frb("./tests/artifacts/WiiU.frb")
+    graph = get_board_graph(frb)
+    assert get_board_graph(frb) is graph
+    assert get_board_graph(frb, refresh=True) is not graph
+    assert get_board_graph(read_frb("./tests/artifacts/WiiU.frb")) is not graph
+
+
+def test_waypoints_edited_in_place_are_noticed():
+    frb = read_frb("./tests/artifacts/WiiU.frb")
+    graph = get_board_graph(frb)
+    assert check_max_paths(frb).data.count == 16
+
+    # every square's waypoints are cut, which no cached graph or count
+    # may hide
+    for square in frb.squares:
+        for w in square.waypoints:
+            w.destinations = [255, 255, 255]
+    assert get_board_graph(frb) is not graph
+    assert get_board_graph(frb).transitions == BoardGraph(frb.squares).transitions
+    assert check_max_paths(frb).data.count == 0
+
+
+def test_parallel_search_matches_serial():
+    boards = [make_grid(6, 6), make_random_board(40, 7)]
+    for squares in boards:
+        for options in ({}, {"limit": 50}, {"stop_at": 100}):
+            serial = find_max_paths(squares, 12, **options)
+            assert find_max_paths(squares, 12, workers=3, **options) == serial
+
+
+def test_parallel_search_with_caller_owned_executor():
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        squares = make_grid(6, 6)
+        for _ in range(2):
+            assert find_max_paths(squares, 12, executor=executor) == find_max_paths(squares, 12)
+
+        # on a timeout, the chunks still running are stopped before the
+        # search returns, so the pool is free straight away
+        result = find_max_paths(make_grid(30, 30), 80, time_budget=0.1, executor=executor)
+        assert result.timed_out
+        started = time.monotonic()
+        executor.submit(int).result()
+        assert time.monotonic() - started < 0.5
+
+        frbs = [read_frb("./tests/artifacts/WiiU.frb") for _ in range(2)]
+        clear_max_paths_cache()
+        assert search_max_paths_for_boards(frbs, executor=executor) == search_max_paths_for_boards(frbs)
+
+
+def test_parallel_search_across_boards():
+    frbs = [read_frb("./tests/artifacts/WiiU.frb") for _ in range(3)]
+    serial = search_max_paths_for_boards(frbs)
+    assert search_max_paths_for_boards(frbs, workers=2) == serial
+    assert [(p.square_id, p.count) for p in serial] == [(6, 16)] * 3
+
+
+def test_max_paths_for_every_board_file():
+    clear_max_paths_cache()
+    frb = read_frb("./tests/artifacts/WiiU.frb")
+    looping = read_frb("./tests/artifacts/WiiU.frb")
+    # give the second district a dead end, so it differs from the first
+    looping.squares[6].waypoints = [WaypointData(255, [255, 255, 255])] * 4
+    copy = read_frb("./tests/artifacts/WiiU.frb")
+
+    result = check_max_paths_for_boards(
+        [frb, looping, copy], filenames=["a.frb", "b.frb", "c.frb"]
+    )
+    breakdown = result.data
+    assert result.status == "OK"
+    assert breakdown.filenames == ["a.frb", "b.frb", "c.frb"]
+    assert [(p.square_id, p.count) for p in breakdown.files][0] == (6, 16)
+    assert breakdown.files[2] == breakdown.files[0]
+    assert breakdown.files[1] != breakdown.files[0]
+    assert int(breakdown) == 16 and str(breakdown) == "16"
+
+    # identical boards share one cache entry
+    assert len(max_paths_cache) == 2
+
+
+def test_path_analyser_follows_edits():
+    rng = random.Random(3)
+    for squares, limit in ((make_grid(6, 6), None), (make_random_board(30, 4), 40)):
+        analyser = PathAnalyser(squares, 12, limit=limit)
+        assert analyser.max_paths() == find_max_paths(squares, 12, limit=limit)
+        for _ in range(20):
+            square_id = rng.randrange(len(squares))
+            waypoints = {
+                entry: rng.sample(range(len(squares)), rng.randint(0, 3))
+                for entry in rng.sample(range(len(squares)), rng.randint(1, 4))
+            }
+            result = analyser.update_square(square_id, make_square(waypoints).waypoints)
+            assert result == find_max_paths(squares, 12, limit=limit)
+            prev = squares[square_id].waypoints[0].entryId
+            assert analyser.paths_count(square_id, prev) == (
+                get_paths_count(squares, prev, square_id, 12, limit)
+            )
+
+
+def test_paths_heatmap():
+    squares = make_grid(5, 4)
+    heatmap = calculate_paths_heatmap(squares, 10)
+    assert heatmap.square_counts == [
+        reference_paths_count(squares, 255, i, 10) for i in range(len(squares))
+    ]
+    assert heatmap.entry_counts[(1, 6)] == reference_paths_count(squares, 1, 6, 10)
+    assert heatmap.max_paths == find_max_paths(squares, 10)
+    assert sum(n for _, _, n in heatmap.histogram) == len(squares)
+    assert heatmap.hotspots(100) == sorted(
+        [i for i, c in enumerate(heatmap.square_counts) if c > 100],
+        key=lambda i: -heatmap.square_counts[i],
+    )
+
+    pytest.importorskip("numpy")
+    assert calculate_paths_heatmap(squares, 10, limit=50, engine="matrix") == (
+        calculate_paths_heatmap(squares, 10, limit=50)
+    )
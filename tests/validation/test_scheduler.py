@@ -0,0 +1,93 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from cs_board_tools.errors import (
+    IssueType,
+    get_count,
+    get_text,
+    reset_errors_and_warnings,
+    use_context,
+)
+from cs_board_tools.io import read_zip
+from cs_board_tools.validation import validate_bundle
+from cs_board_tools.validation.results import build_results_object
+from cs_board_tools.validation.scheduler import ScheduledCheck, run_checks
+
+
+def slow_check(delay: float, message: str, warn: bool = False):
+    time.sleep(delay)
+    if warn:
+        return build_results_object(warnings=[message], data=message)
+    return build_results_object(errors=[message], data=message)
+
+
+def test_checks_run_side_by_side_in_a_stable_order():
+    checks = [
+        ScheduledCheck("first", slow_check, inputs={"message": "a"}, options={"delay": 0.3}),
+        ScheduledCheck("second", slow_check, inputs={"message": "b"}, options={"delay": 0.1, "warn": True}),
+        ScheduledCheck("third", slow_check, inputs={"message": "c"}, options={"delay": 0.2}),
+    ]
+    inputs = {"a": "first error", "b": "a warning", "c": "second error"}
+
+    reset_errors_and_warnings()
+    serial = run_checks(checks, inputs)
+    expected = (get_text(IssueType.ERRORS), get_text(IssueType.WARNINGS), get_count(IssueType.SUCCESS))
+
+    reset_errors_and_warnings()
+    with ThreadPoolExecutor() as threads:
+        start = time.perf_counter()
+        results = run_checks(checks, inputs, threads=threads)
+        elapsed = time.perf_counter() - start
+
+    assert list(results) == ["first", "second", "third"]
+    assert [r.data for r in results.values()] == [r.data for r in serial.values()]
+    assert get_text(IssueType.ERRORS) == ["first error", "second error"]
+    assert (get_text(IssueType.ERRORS), get_text(IssueType.WARNINGS), get_count(IssueType.SUCCESS)) == expected
+    assert elapsed < 0.5
+    reset_errors_and_warnings()
+
+
+def test_concurrent_validation_runs_keep_their_own_counts():
+    bundles = read_zip("./tests/artifacts/WiiU.zip", temp_dir_path="./tests/artifacts")
+    broken = read_zip("./tests/artifacts/WiiU.zip", temp_dir_path="./tests/artifacts")
+    broken[0].descriptor.max_dice_roll = 3
+    broken[0].descriptor.authors = []
+
+    def summary(result):
+        return [
+            (b.error_count, b.warning_count, b.success_count, b.error_messages, b.warning_messages)
+            for b in result.boards
+        ]
+
+    expected = {
+        "ok": summary(validate_bundle(bundles)),
+        "broken": summary(validate_bundle(broken)),
+    }
+    assert expected["ok"] != expected["broken"]
+
+    runs = ["ok", "broken"] * 8
+    with use_context() as outer:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(
+                lambda run: summary(validate_bundle(bundles if run == "ok" else broken)),
+                runs
+            ))
+        assert outer.error_count == 0 and outer.success_count == 0
+    assert results == [expected[run] for run in runs]
+
+
+def test_checks_are_timed_and_profiled(tmp_path):
+    bundles = read_zip("./tests/artifacts/WiiU.zip", temp_dir_path="./tests/artifacts")
+
+    result = validate_bundle(bundles)
+    board = result.boards[0]
+    assert board.max_paths.timing.wall_time > 0
+    assert board.max_paths.timing.peak_memory == 0
+    assert result.timing == board.timing
+    assert board.timing.wall_time >= board.max_paths.timing.wall_time
+
+    profiled = validate_bundle(bundles, profile_dir=tmp_path)
+    assert profiled == result
+    assert profiled.boards[0].max_paths.timing.peak_memory > 0
+    assert (tmp_path / "Wii_U.max_paths.prof").exists()
+    assert len(list(tmp_path.glob("Wii_U.*.prof"))) == 9
@@ -1,5 +1,20 @@
-from cs_board_tools.io import read_zip
-from cs_board_tools.validation import validate_bundle
+import importlib
+import json
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+
+from cs_board_tools.io import read_files, read_frb, read_zip
+from cs_board_tools.schema.frb import WaypointData
+from cs_board_tools.schema.validation import ValidationResultBundle
+from cs_board_tools.utilities import load_yaml_schema
+from cs_board_tools.utilities.filesystem import get_files_recursively
+from cs_board_tools.validation import (
+    validate_board_file,
+    validate_bundle,
+    validate_bundles_parallel
+)
+from cs_board_tools.validation.cache import get_validation_cache_key
+from cs_board_tools.validation.consistency import compare_values, mismatch_error
 
 
 def test_validation():
@@ -17,4 +32,164 @@ def test_validation():
         assert b.max_paths.status == "OK"
         assert b.screenshots.status == "OK"
         assert b.venture.status == "OK"
-        assert result.issue_count == 0
+        # without the schema, the descriptor is loaded with a warning
+        assert result.error_count == 0
+        assert result.issue_count == (0 if load_yaml_schema() else 1)
+
+
+def test_max_paths_runs_on_processes_by_default(monkeypatch):
+    main = importlib.import_module("cs_board_tools.validation.main")
+    submitted = []
+
+    class RecordingPool(ProcessPoolExecutor):
+        def submit(self, fn, *args, **kwargs):
+            submitted.append(args[0].__name__)
+            return super().submit(fn, *args, **kwargs)
+
+    monkeypatch.setattr(main, "ProcessPoolExecutor", RecordingPool)
+    bundles = read_zip("./tests/artifacts/WiiU.zip")
+    result = validate_bundle(bundles)
+
+    assert submitted == ["check_max_paths_for_boards"]
+    assert result.boards[0].max_paths.status == "OK"
+    assert result.boards[0].paths == 16
+
+
+def test_validation_of_a_single_board_file():
+    frb = read_frb("./tests/artifacts/WiiU.frb")
+    result = validate_board_file([frb])
+
+    b = result.boards[0]
+    assert b.board_configuration.status == "OK"
+    assert b.max_paths.status == "OK"
+    assert b.structure.status == "SKIPPED"
+    assert b.paths == 16
+    assert result.error_count == 0
+
+    result = validate_board_file([frb], skip_board_structure_test=False)
+    assert result.boards[0].structure.status == "OK"
+
+    result = validate_board_file([frb], skip_max_paths_test=True)
+    assert result.boards[0].max_paths.status == "SKIPPED"
+    assert result.boards[0].paths == 0
+
+
+def test_compare_values_reports_to_the_given_list():
+    first, second = [], []
+    compare_values(8, 9, "max dice roll", first)
+    compare_values(8, 8, "max dice roll", second)
+    assert first == [mismatch_error.format(attribute="max dice roll", frbValue=8, yamlValue=9)]
+    assert second == []
+
+
+def test_parallel_validation_of_many_bundles():
+    bundles = read_zip("./tests/artifacts/WiiU.zip", temp_dir_path="./tests/artifacts")
+    expected = validate_bundle(bundles)
+    sources = ["./tests/artifacts/WiiU.zip", "./tests/artifacts", bundles[0]]
+
+    for workers in (None, 2):
+        totals = ValidationResultBundle()
+        results = list(validate_bundles_parallel(sources, workers=workers, results=totals))
+        assert len(results) == 3
+        for r in results:
+            assert r.board_name == "Wii U"
+            assert (r.success_count, r.error_messages, r.paths) == (
+                expected.boards[0].success_count, [], 16
+            )
+        assert totals.boards == results
+        assert totals.success_count == 3 * expected.success_count
+        assert totals.informational_messages == 3 * expected.informational_messages
+
+
+def test_validation_cache(tmp_path):
+    bundles = read_zip("./tests/artifacts/WiiU.zip", temp_dir_path="./tests/artifacts")
+    again = read_zip("./tests/artifacts/WiiU.zip", temp_dir_path="./tests/artifacts")
+    assert bundles[0].source_files == ["./tests/artifacts/WiiU.zip"]
+    assert get_validation_cache_key(bundles[0], {}) == get_validation_cache_key(again[0], {})
+
+    first = validate_bundle(bundles, cache=True, cache_dir=tmp_path)
+    assert len(list(tmp_path.iterdir())) == 1
+
+    # a hit reuses the stored result without running the checks, so
+    # changes made after loading go unnoticed
+    again[0].frbs[0].squares[6].waypoints = [WaypointData(255, [255, 255, 255])] * 4
+    second = validate_bundle(again, cache=True, cache_dir=tmp_path)
+    assert second == first and second.boards[0].paths == 16
+
+    # other options miss the cache, and so do bundles not read from disk
+    missed = validate_bundle(again, skip_warnings=True, cache=True, cache_dir=tmp_path)
+    assert missed.boards[0].paths != 16
+    again[0].source_files = []
+    validate_bundle(again, cache=True, cache_dir=tmp_path)
+    assert len(list(tmp_path.iterdir())) == 2
+
+
+def test_validation_cache_with_many_bundles_in_one_zip(tmp_path):
+    archive_path = tmp_path / "boards.zip"
+    with zipfile.ZipFile("./tests/artifacts/WiiU.zip") as source, \
+            zipfile.ZipFile(archive_path, "w") as archive:
+        for name in source.namelist():
+            content = source.read(name)
+            archive.writestr(f"Wii U/{name}", content)
+            if name.endswith(".yaml"):
+                content = content.replace(b"en: Wii U", b"en: Other Board", 1)
+                content = content.replace(b"maxDiceRoll: 7", b"maxDiceRoll: 8")
+            archive.writestr(f"Other Board/{name}", content)
+
+    def validate():
+        bundles = read_zip(str(archive_path), temp_dir_path=str(tmp_path / "temp"))
+        result = validate_bundle(
+            bundles, skip_music_download_test=True, cache=True, cache_dir=tmp_path / "cache"
+        )
+        return bundles, {
+            b.board_name: b.consistency.status
+            for b in result.boards
+        }
+
+    bundles, first = validate()
+    keys = {get_validation_cache_key(b, {}) for b in bundles}
+    assert len(keys) == 2
+    assert first == {"Wii U": "OK", "Other Board": "ERROR"}
+    assert len(list((tmp_path / "cache").iterdir())) == 2
+
+    # each bundle is served its own cached result
+    _, second = validate()
+    assert second == first
+
+
+def test_validation_cache_key_covers_every_file(tmp_path):
+    with zipfile.ZipFile("./tests/artifacts/WiiU.zip") as archive:
+        archive.extractall(tmp_path / "bundle")
+    files = get_files_recursively(str(tmp_path / "bundle"))
+    bundle = read_files(files)[0]
+    key = get_validation_cache_key(bundle, {})
+    assert key
+
+    # the naming check looks at the music files' names too
+    music = tmp_path / "bundle" / "music.brstm"
+    music.write_bytes(b"")
+    with_music = get_validation_cache_key(read_files(files + [str(music)])[0], {})
+    renamed = music.rename(music.with_name("renamed.brstm"))
+    with_renamed_music = get_validation_cache_key(read_files(files + [str(renamed)])[0], {})
+    assert len({key, with_music, with_renamed_music}) == 3
+
+
+def test_validation_cache_entries(tmp_path):
+    bundles = read_zip("./tests/artifacts/WiiU.zip", temp_dir_path="./tests/artifacts")
+    first = validate_bundle(bundles, cache=True, cache_dir=tmp_path)
+    (path,) = tmp_path.iterdir()
+
+    # entries are plain JSON, and the music download check is never stored
+    entry = json.loads(path.read_text())
+    assert "music_download" not in entry["checks"]
+    assert entry["checks"]["max_paths"]["data"]["type"] == "MaxPathsBreakdown"
+
+    # a hit replays the stored checks, so the counts come out the same
+    hit = validate_bundle(bundles, cache=True, cache_dir=tmp_path)
+    assert hit == first and hit.success_count == first.success_count
+
+    # anything unreadable is a miss, and is written over
+    for garbage in ('{"checks": {"max_paths": ', "\xff\xfe", '{"checks": {"naming": {}}}', "[]"):
+        path.write_text(garbage, encoding="latin-1")
+        assert validate_bundle(bundles, cache=True, cache_dir=tmp_path) == first
+        assert json.loads(path.read_text()) == entry